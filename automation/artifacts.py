@@ -0,0 +1,163 @@
+"""
+Failure artifact storage (screenshots and DOM snapshots)
+
+Artifacts are compressed (screenshots to WebP via Pillow, DOM snapshots to
+gzip), named by the SHA-256 of their content so a page that keeps failing
+the same way is only stored once, and evicted least-recently-used first
+once the directory grows past its size cap.
+"""
+import gzip
+import hashlib
+import io
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_SCRIPT_RE = re.compile(rb"<script\b.*?(?:</script\s*>|$)", re.IGNORECASE | re.DOTALL)
+_HEAD_RE = re.compile(rb"<head\b[^>]*>", re.IGNORECASE)
+
+# Blocks inline event handlers and javascript: URLs that survive script stripping
+_NO_SCRIPT_POLICY = b'<meta http-equiv="Content-Security-Policy" content="script-src \'none\'; object-src \'none\'">'
+
+# Exported DOM snapshots older than this are removed on the next export
+_EXPORT_MAX_AGE = 24 * 3600
+
+
+class ArtifactStore:
+    def __init__(self, root="data/artifacts", max_bytes=200 * 1024 * 1024):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def save_failure(self, screenshot=None, dom=None):
+        """Store a failure's screenshot (PNG bytes) and DOM (HTML text).
+
+        Returns a dict like {'screenshot': '<name>', 'dom': '<name>'} with
+        entries only for the artifacts that were provided.
+        """
+        saved = {}
+        if screenshot:
+            saved['screenshot'] = self.save(screenshot, *_compress_screenshot(screenshot))
+        if dom:
+            raw = dom.encode('utf-8')
+            saved['dom'] = self.save(raw, gzip.compress(raw, compresslevel=6), "html.gz")
+        if saved:
+            self.enforce_limit()
+        return saved
+
+    def save(self, raw, compressed, ext):
+        """Store compressed data under the hash of the raw data, returns the file name"""
+        name = f"{hashlib.sha256(raw).hexdigest()[:20]}.{ext}"
+        path = self.root / name
+
+        with self._lock:
+            if path.exists():
+                # Seen this exact page before; mark it recently used
+                os.utime(path)
+            else:
+                partial = path.with_name(name + ".partial")
+                partial.write_bytes(compressed)
+                partial.replace(path)
+        return name
+
+    def path(self, name):
+        """Absolute path of a stored artifact (None if it has been evicted)"""
+        path = (self.root / Path(name).name).resolve()
+        return path if path.exists() else None
+
+    def read(self, name):
+        """Read an artifact, decompressing gzip'd DOM snapshots"""
+        path = self.path(name)
+        if not path:
+            return None
+        os.utime(path)
+        data = path.read_bytes()
+        return gzip.decompress(data) if name.endswith(".gz") else data
+
+    def export_dom(self, name, export_dir=None):
+        """Write a DOM snapshot as a script-free .html file for viewing, returns its path.
+
+        The captured page's scripts are removed and a Content-Security-Policy
+        forbids any that remain, so opening it never runs Facebook's code.
+        Exports are named after the artifact, so opening the same snapshot
+        again reuses the file; stale exports are cleaned up.
+        """
+        html = self.read(name)
+        if html is None:
+            return None
+
+        export_dir = Path(export_dir or Path(tempfile.gettempdir()) / "fbm-dom-snapshots")
+        export_dir.mkdir(parents=True, exist_ok=True)
+        _remove_stale_exports(export_dir)
+
+        html = _SCRIPT_RE.sub(b"", html)
+        head = _HEAD_RE.search(html)
+        at = head.end() if head else 0
+        html = html[:at] + _NO_SCRIPT_POLICY + html[at:]
+
+        path = export_dir / (Path(name).name.split(".")[0] + ".html")
+        path.write_bytes(html)
+        return path
+
+    def enforce_limit(self):
+        """Delete least recently used artifacts until the directory fits the cap"""
+        with self._lock:
+            files = [(p.stat().st_mtime, p.stat().st_size, p) for p in self.root.iterdir()
+                     if p.is_file() and not p.name.endswith(".partial")]
+            total = sum(size for _, size, _ in files)
+            if total <= self.max_bytes:
+                return 0
+
+            removed = 0
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+
+        logger.info(f"Evicted {removed} failure artifact(s) to stay under {self.max_bytes // (1024 * 1024)} MB")
+        return removed
+
+    def total_size(self):
+        """Current size of the artifacts directory in bytes"""
+        return sum(p.stat().st_size for p in self.root.iterdir() if p.is_file())
+
+
+def _remove_stale_exports(export_dir):
+    cutoff = time.time() - _EXPORT_MAX_AGE
+    for path in export_dir.glob("*.html"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def _compress_screenshot(png):
+    """Convert a PNG screenshot to WebP; falls back to the original PNG without Pillow"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return png, "png"
+
+    try:
+        start = time.perf_counter()
+        with Image.open(io.BytesIO(png)) as image:
+            out = io.BytesIO()
+            image.save(out, format="WEBP", quality=70, method=4)
+        logger.debug(f"Screenshot {len(png)} -> {out.tell()} bytes in {time.perf_counter() - start:.2f}s")
+        return out.getvalue(), "webp"
+    except Exception as e:
+        logger.warning(f"Could not convert screenshot to WebP: {e}")
+        return png, "png"
@@ -0,0 +1,189 @@
+"""
+Batch listing generation from folders of images
+
+Images can be grouped by capture time: photos taken in one burst (no more
+than burst_gap seconds apart) are assumed to show the same item and are kept
+in the same listing. Capture times come from EXIF (falling back to the file's
+modification time) and are cached in the database's image_index table, so
+re-planning a folder only reads files that were added or changed.
+"""
+import collections
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
+
+# EXIF tags
+_EXIF_IFD = 0x8769
+_DATETIME = 306
+_DATETIME_ORIGINAL = 36867
+_SUBSEC_TIME_ORIGINAL = 37521
+
+
+def scan_image_folder(folder):
+    """List image files directly inside folder, sorted by name"""
+    image_files = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                image_files.append(entry.path)
+    # Directory order is arbitrary on most filesystems; camera file names sort by shot
+    image_files.sort()
+    return image_files
+
+
+def read_capture_time(path, mtime=None):
+    """When a photo was taken, as (unix timestamp, source).
+
+    Uses EXIF DateTimeOriginal (with sub-seconds, so bursts keep their order),
+    then EXIF DateTime, then the file's modification time.
+    """
+    try:
+        from PIL import Image
+        with Image.open(path) as image:
+            exif = image.getexif()
+        exif_ifd = exif.get_ifd(_EXIF_IFD)
+        taken = exif_ifd.get(_DATETIME_ORIGINAL) or exif.get(_DATETIME)
+        if taken:
+            timestamp = datetime.strptime(str(taken).strip(), "%Y:%m:%d %H:%M:%S").timestamp()
+            subsec = str(exif_ifd.get(_SUBSEC_TIME_ORIGINAL) or '').strip()
+            if subsec.isdigit():
+                timestamp += float(f"0.{subsec}")
+            return timestamp, 'exif'
+    except Exception:
+        # No Pillow, unreadable file or malformed EXIF date
+        pass
+
+    if mtime is None:
+        mtime = os.stat(path).st_mtime
+    return mtime, 'mtime'
+
+
+def index_capture_times(db, image_files, max_workers=8):
+    """Capture times for image_files as {path: timestamp}.
+
+    Cached entries whose mtime and size still match are reused; the rest are
+    read in a thread pool and written back to the index. Files that have
+    disappeared since the folder was scanned are left out. image_files must be
+    the full scan of each folder: index entries for files not in it (deleted or
+    renamed) are removed.
+    """
+    start = time.perf_counter()
+    cached = {}
+    for folder in {os.path.dirname(path) for path in image_files}:
+        cached.update(db.get_image_index(folder))
+
+    times = {}
+    stale = []
+    present = collections.defaultdict(list)
+    for path in image_files:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        present[os.path.dirname(path)].append(path)
+        entry = cached.get(path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            times[path] = entry[2]
+        else:
+            stale.append((path, stat))
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="exif") as pool:
+            results = list(pool.map(lambda item: read_capture_time(item[0], item[1].st_mtime), stale))
+
+        db.save_image_index([
+            (path, os.path.dirname(path), stat.st_mtime_ns, stat.st_size, captured_at, source)
+            for (path, stat), (captured_at, source) in zip(stale, results)
+        ])
+        for (path, _), (captured_at, _) in zip(stale, results):
+            times[path] = captured_at
+
+    # Only write when the scan is missing files the index still has
+    found = set(image_files)
+    removed = sum(
+        db.prune_image_index(folder, present[folder])
+        for folder in {os.path.dirname(path) for path in cached if path not in found}
+    )
+    if removed:
+        logger.info(f"Removed {removed} index entries for deleted or renamed images")
+
+    logger.info(f"Indexed {len(times)} images ({len(stale)} read, "
+                f"{len(times) - len(stale)} cached) in {time.perf_counter() - start:.2f}s")
+    return times
+
+
+def group_by_capture_time(capture_times, burst_gap=30):
+    """Split images into bursts: sorted by capture time, a new group starts
+    whenever the gap to the previous photo exceeds burst_gap seconds"""
+    ordered = sorted(capture_times, key=lambda path: (capture_times[path], path))
+
+    groups = []
+    previous = None
+    for path in ordered:
+        taken = capture_times[path]
+        if previous is None or taken - previous > burst_gap:
+            groups.append([])
+        groups[-1].append(path)
+        previous = taken
+    return groups
+
+
+def plan_grouped_listings(workflow, groups, images_per, num_listings):
+    """Like plan_listings, but never mixes images from different groups.
+
+    Groups larger than images_per are split into consecutive listings; a
+    group's leftover photos form a smaller listing of their own.
+    """
+    descriptions = workflow['descriptions']
+
+    listings = []
+    for group in groups:
+        for start_idx in range(0, len(group), images_per):
+            if len(listings) >= num_listings:
+                return listings
+            listing_images = group[start_idx:start_idx + images_per]
+            listings.append((descriptions[len(listings) % len(descriptions)], listing_images))
+    return listings
+
+
+def plan_listings(workflow, image_files, images_per, num_listings):
+    """Split images into listings and rotate through the workflow's descriptions.
+
+    Returns a list of (description, images) tuples; fewer than num_listings
+    if there aren't enough images.
+    """
+    num_listings = min(num_listings, len(image_files) // images_per)
+    descriptions = workflow['descriptions']
+
+    listings = []
+    for i in range(num_listings):
+        start_idx = i * images_per
+        listing_images = image_files[start_idx:start_idx + images_per]
+        listings.append((descriptions[i % len(descriptions)], listing_images))
+    return listings
+
+
+def enqueue_listings(db, workflow, listings):
+    """Add planned listings to the posting queue, returns the number added"""
+    return db.add_many_to_queue([
+        {
+            'workflow_id': workflow['id'],
+            'title': workflow['title'],
+            'description': description,
+            'price': workflow['price'],
+            'category': workflow['category'],
+            'condition': workflow['condition'],
+            'location': workflow['location'],
+            'images': images,
+            'delivery_method': workflow.get('delivery_method', 'Door pickup'),
+            'groups': workflow.get('groups'),
+            'boost_listing': workflow.get('boost_listing', False)
+        }
+        for description, images in listings
+    ])
@@ -3,8 +3,12 @@ Browser automation setup with persistent Chrome profile
 """
 from playwright.async_api import async_playwright
 import asyncio
+import logging
+import time
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 class BrowserManager:
     def __init__(self, chrome_profile_path=None):
         self.chrome_profile_path = chrome_profile_path
@@ -12,9 +16,11 @@ class BrowserManager:
         self.context = None
         self.page = None
         self.playwright = None
+        self.launch_seconds = None
     
     async def start(self):
         """Start browser with persistent profile"""
+        start_time = time.perf_counter()
         self.playwright = await async_playwright().start()
 
         # Launch args for better stealth
@@ -69,6 +75,9 @@ class BrowserManager:
                 get: () => undefined
             });
         """)
+
+        self.launch_seconds = time.perf_counter() - start_time
+        logger.info(f"Browser launched in {self.launch_seconds:.2f}s")
         
         return self.page
     
@@ -80,28 +89,28 @@ class BrowserManager:
                 if not self.page.is_closed():
                     await self.page.close()
             except Exception as e:
-                print(f"Error closing page (non-critical): {str(e)[:100]}")
+                logger.warning(f"Error closing page (non-critical): {str(e)[:100]}")
 
         # Close context
         if self.context:
             try:
                 await self.context.close()
             except Exception as e:
-                print(f"Error closing context (non-critical): {str(e)[:100]}")
+                logger.warning(f"Error closing context (non-critical): {str(e)[:100]}")
 
         # Close browser
         if self.browser:
             try:
                 await self.browser.close()
             except Exception as e:
-                print(f"Error closing browser (non-critical): {str(e)[:100]}")
+                logger.warning(f"Error closing browser (non-critical): {str(e)[:100]}")
 
         # Stop playwright
         if self.playwright:
             try:
                 await self.playwright.stop()
             except Exception as e:
-                print(f"Error stopping playwright (non-critical): {str(e)[:100]}")
+                logger.warning(f"Error stopping playwright (non-critical): {str(e)[:100]}")
     
     async def navigate_to(self, url):
         """Navigate to URL"""
@@ -113,7 +122,12 @@ class BrowserManager:
         if self.page:
             return await self.page.wait_for_selector(selector, timeout=timeout)
     
-    async def take_screenshot(self, path):
-        """Take screenshot for debugging"""
+    async def take_screenshot(self, path=None):
+        """Take screenshot for debugging, returns the PNG bytes"""
+        if self.page:
+            return await self.page.screenshot(path=path)
+
+    async def get_page_html(self):
+        """Get the current page's DOM as HTML"""
         if self.page:
-            await self.page.screenshot(path=path)
+            return await self.page.content()
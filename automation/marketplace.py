@@ -2,68 +2,64 @@
 Facebook Marketplace posting automation
 """
 import asyncio
+import logging
 import random
 from pathlib import Path
 from automation.human_behavior import HumanBehavior
 
+logger = logging.getLogger(__name__)
+
 class MarketplaceAutomation:
-    def __init__(self, browser_manager):
+    def __init__(self, browser_manager, artifact_store=None):
         self.browser = browser_manager
         self.page = None
         self.human = HumanBehavior()
+        self.artifact_store = artifact_store
     
     async def initialize(self):
         """Initialize browser and navigate to Marketplace"""
         self.page = await self.browser.start()
 
-        print("Navigating to Facebook Marketplace...")
+        logger.info("Navigating to Facebook Marketplace...")
         await self.browser.navigate_to("https://www.facebook.com/marketplace/create/item")
 
         # Give page more time to load and redirect if needed
-        print("Waiting for page to load...")
+        logger.info("Waiting for page to load...")
         await self.human.async_random_delay(5, 7)
 
         # Check if we need to log in
-        print("Checking if logged in...")
+        logger.info("Checking if logged in...")
         current_url = self.page.url
-        print(f"Current URL: {current_url}")
+        logger.debug(f"Current URL: {current_url}")
 
         # Check for login page
         if "login" in current_url.lower() or "checkpoint" in current_url.lower():
-            print("\n" + "="*70)
-            print("   FIRST TIME LOGIN REQUIRED - Please log in to Facebook")
-            print("="*70)
-            print("\nThe browser window is now open.")
-            print("\nPlease complete the following steps:")
-            print("  1. Enter your Facebook email/phone and password")
-            print("  2. Complete any 2FA or security checks")
-            print("  3. Wait for Facebook to fully log you in")
-            print("\nThe tool will automatically continue once you're logged in.")
-            print("You have up to 10 MINUTES to complete this process.")
-            print("="*70 + "\n")
+            logger.warning(
+                "First time login required - please log in to Facebook in the open browser window "
+                "(email/phone and password, then any 2FA or security checks). "
+                "The tool will continue automatically once you're logged in; you have up to 10 minutes."
+            )
 
             # Wait for navigation away from login page (max 10 minutes for first login)
             try:
                 await self.page.wait_for_url(lambda url: "login" not in url.lower() and "checkpoint" not in url.lower(), timeout=600000)
-                print("\n" + "="*70)
-                print("   LOGIN SUCCESSFUL! Continuing to Marketplace...")
-                print("="*70 + "\n")
+                logger.info("Login successful, continuing to Marketplace")
 
                 # Give Facebook time to fully initialize the session
                 await self.human.async_random_delay(3, 5)
 
                 # Navigate to marketplace again after login
-                print("Navigating to Marketplace create page...")
+                logger.info("Navigating to Marketplace create page...")
                 await self.browser.navigate_to("https://www.facebook.com/marketplace/create/item")
                 await self.human.async_random_delay(5, 7)
             except Exception as e:
                 raise Exception("Login timeout - please complete login within 10 minutes")
         else:
-            print("✓ Already logged in! Proceeding with quick start...")
+            logger.info("Already logged in! Proceeding with quick start...")
 
         # Verify we're on the right page
         final_url = self.page.url
-        print(f"Final URL: {final_url}")
+        logger.debug(f"Final URL: {final_url}")
 
         if "marketplace/create" not in final_url:
             raise Exception(
@@ -91,10 +87,10 @@ class MarketplaceAutomation:
             boost_listing: Whether to enable boost listing (default: False)
 
         Returns:
-            dict: {'success': bool, 'error': str or None}
+            dict: {'success': bool, 'error': str or None, 'artifacts': dict or None}
         """
         try:
-            print(f"\nCreating listing: {title}")
+            logger.info(f"Creating listing: {title}")
             await self.human.async_random_delay(0.5, 1)
             await self._dismiss_popups()
 
@@ -116,29 +112,29 @@ class MarketplaceAutomation:
                 await self._toggle_boost_listing()
 
             # STEP 2: Click "Next" to go to delivery method page
-            print("\n[STEP 1] Clicking Next to go to delivery page...")
+            logger.info("[STEP 1] Clicking Next to go to delivery page...")
             await self._click_next_button()
-            print("✓ Clicked Next button")
+            logger.info("Clicked Next button")
             await self.human.async_random_delay(0.8, 1.2)
 
             # STEP 3: Select delivery method on the new page
-            print("\n[STEP 2] Selecting delivery method...")
+            logger.info("[STEP 2] Selecting delivery method...")
             await self._select_delivery_method(delivery_method)
             await self.human.async_random_delay(0.5, 0.8)
 
             # STEP 4: Click "Next" again to go to groups page
-            print("\n[STEP 3] Clicking Next to go to groups page...")
+            logger.info("[STEP 3] Clicking Next to go to groups page...")
             await self._click_next_button()
-            print("✓ Clicked Next button")
+            logger.info("Clicked Next button")
             await self.human.async_random_delay(0.8, 1.2)
 
             # STEP 5: Select groups
-            print("\n[STEP 4] Selecting groups...")
+            logger.info("[STEP 4] Selecting groups...")
             await self._select_groups(group_names)
             await self.human.async_random_delay(0.5, 0.8)
 
             # STEP 6: Click "Next" one more time (there might be another Next after groups)
-            print("\n[STEP 5] Checking for additional Next button...")
+            logger.info("[STEP 5] Checking for additional Next button...")
 
             # Try to find Next or Publish button
             has_next = await self.page.evaluate("""
@@ -149,34 +145,37 @@ class MarketplaceAutomation:
             """)
 
             if has_next:
-                print("Found Next button, clicking it...")
+                logger.debug("Found Next button, clicking it...")
                 await self._click_next_button()
-                print("✓ Clicked Next button")
+                logger.info("Clicked Next button")
                 await self.human.async_random_delay(0.8, 1.2)
 
             # STEP 7: Click "Publish" to complete
-            print("\n[STEP 6] Clicking Publish to complete listing...")
+            logger.info("[STEP 6] Clicking Publish to complete listing...")
             await self._click_publish_button()
-            print("✓ Clicked Publish button")
+            logger.info("Clicked Publish button")
             await self.human.async_random_delay(1, 1.5)
 
-            print(f"✓ Listing created successfully!\n")
+            logger.info("Listing created successfully!")
 
             # Navigate back to create listing page for next listing
-            print("Navigating back to create listing page for next listing...")
+            logger.info("Navigating back to create listing page for next listing...")
             await self.human.async_random_delay(2, 3)  # Wait for confirmation page to load
             await self.browser.navigate_to("https://www.facebook.com/marketplace/create/item")
             await self.human.async_random_delay(2, 3)  # Wait for create page to load
             await self._dismiss_popups()
 
-            return {'success': True, 'error': None}
+            return {'success': True, 'error': None, 'artifacts': None}
 
         except Exception as e:
-            print(f"Error creating listing: {str(e)}")
+            logger.exception(f"Error creating listing: {str(e)}")
+
+            # Capture the broken page before navigating away from it
+            artifacts = await self._capture_failure_artifacts()
 
             # Try to navigate back to create listing page even on error
             try:
-                print("Attempting to navigate back to create listing page after error...")
+                logger.info("Attempting to navigate back to create listing page after error...")
                 await self.human.async_random_delay(1, 2)
                 await self.browser.navigate_to("https://www.facebook.com/marketplace/create/item")
                 await self.human.async_random_delay(2, 3)
@@ -184,7 +183,34 @@ class MarketplaceAutomation:
             except:
                 pass  # Ignore navigation errors during error recovery
 
-            return {'success': False, 'error': str(e)}
+            return {'success': False, 'error': str(e), 'artifacts': artifacts}
+
+    async def _capture_failure_artifacts(self):
+        """Save a screenshot and DOM snapshot of the current page, returns their names"""
+        if not self.artifact_store:
+            return None
+
+        screenshot = dom = None
+        try:
+            screenshot = await self.browser.take_screenshot()
+        except Exception as e:
+            logger.warning(f"Could not capture failure screenshot: {str(e)[:100]}")
+        try:
+            dom = await self.browser.get_page_html()
+        except Exception as e:
+            logger.warning(f"Could not capture DOM snapshot: {str(e)[:100]}")
+
+        try:
+            # Compression and hashing are CPU work, keep them off the event loop
+            loop = asyncio.get_running_loop()
+            artifacts = await loop.run_in_executor(None, self.artifact_store.save_failure, screenshot, dom)
+        except Exception as e:
+            logger.warning(f"Could not save failure artifacts: {e}")
+            return None
+
+        if artifacts:
+            logger.info(f"Saved failure artifacts: {artifacts}")
+        return artifacts or None
     
     async def _upload_images(self, image_paths):
         """Upload images to listing"""
@@ -213,7 +239,7 @@ class MarketplaceAutomation:
 
                 # Upload files
                 await file_input.set_input_files(abs_paths)
-                print(f"✓ Uploaded {len(image_paths)} image(s)")
+                logger.info(f"Uploaded {len(image_paths)} image(s)")
                 await self.human.async_random_delay(1, 1.5)
             else:
                 raise Exception("Could not find image upload input")
@@ -234,7 +260,7 @@ class MarketplaceAutomation:
                 await asyncio.sleep(0.1)
                 await inp.fill("")  # Clear any existing text
                 await inp.fill(title)  # Fast fill instead of slow typing
-                print("✓ Title entered")
+                logger.info("Title entered")
                 return
         raise Exception("Could not find title input field")
     
@@ -258,7 +284,7 @@ class MarketplaceAutomation:
             for char in price_str:
                 await price_input.type(char)
                 await asyncio.sleep(random.uniform(0.03, 0.08))
-            print("✓ Price entered")
+            logger.info("Price entered")
             return
 
         raise Exception("Could not find price input field")
@@ -266,7 +292,7 @@ class MarketplaceAutomation:
     async def _select_category(self, category):
         """Select category - type and pick from Facebook's dropdown suggestions"""
         try:
-            print(f"Looking for category field to enter: {category}")
+            logger.debug(f"Looking for category field to enter: {category}")
 
             # Look for category field by aria-label
             category_selectors = [
@@ -288,7 +314,7 @@ class MarketplaceAutomation:
 
                         # Found the category field
                         if 'category' in aria_label:
-                            print("✓ Found category field")
+                            logger.info("Found category field")
 
                             # Click the field to focus it
                             await inp.click()
@@ -304,7 +330,7 @@ class MarketplaceAutomation:
                                 await inp.type(char)
                                 await asyncio.sleep(random.uniform(0.08, 0.15))
 
-                            print(f"✓ Typed search term: {search_term}")
+                            logger.info(f"Typed search term: {search_term}")
 
                             # Wait for dropdown to populate
                             await self.human.async_random_delay(1, 1.5)
@@ -333,7 +359,7 @@ class MarketplaceAutomation:
                             """)
 
                             if is_valid:
-                                print(f"✓ Selected category from dropdown using keyboard")
+                                logger.info("Selected category from dropdown using keyboard")
                                 return
                             else:
                                 # BACKUP: Try clicking dropdown option directly
@@ -362,14 +388,14 @@ class MarketplaceAutomation:
                                 """)
 
                                 if dropdown_clicked:
-                                    print(f"✓ Selected category by clicking dropdown")
+                                    logger.info("Selected category by clicking dropdown")
                                     await self.human.async_random_delay(0.3, 0.5)
                                     return
                                 else:
-                                    print("WARNING: Could not select category from dropdown")
+                                    logger.warning("Could not select category from dropdown")
                                     return
                 except Exception as e:
-                    print(f"Error in this selector: {str(e)[:100]}")
+                    logger.debug(f"Error in this selector: {str(e)[:100]}")
                     continue
 
             raise Exception("Could not find category input field")
@@ -380,7 +406,7 @@ class MarketplaceAutomation:
     async def _select_condition(self, condition):
         """Select item condition using keyboard navigation"""
         try:
-            print(f"Looking for condition field to select: {condition}")
+            logger.debug(f"Looking for condition field to select: {condition}")
 
             # Map condition to number of arrow key presses
             condition_map = {
@@ -457,7 +483,7 @@ class MarketplaceAutomation:
             if not dropdown_selector:
                 raise Exception("Could not find condition dropdown element")
 
-            print(f"Found condition dropdown: {dropdown_selector}")
+            logger.debug(f"Found condition dropdown: {dropdown_selector}")
 
             # Use Playwright to click the dropdown (this properly focuses it)
             dropdown_element = await self.page.wait_for_selector(dropdown_selector, timeout=5000)
@@ -470,19 +496,19 @@ class MarketplaceAutomation:
 
             # Click the element to open dropdown and focus it
             await dropdown_element.click()
-            print("✓ Clicked condition dropdown")
+            logger.info("Clicked condition dropdown")
             await self.human.async_random_delay(0.8, 1.2)  # Wait for dropdown menu to appear
 
             # Use keyboard navigation: press down arrow N times, then Enter
-            print(f"Pressing down arrow {arrow_presses} time(s) for: {condition}")
+            logger.info(f"Pressing down arrow {arrow_presses} time(s) for: {condition}")
             for i in range(arrow_presses):
                 await self.page.keyboard.press("ArrowDown")
-                print(f"  Pressed ArrowDown {i+1}/{arrow_presses}")
+                logger.debug(f"Pressed ArrowDown {i+1}/{arrow_presses}")
                 await self.human.async_random_delay(0.2, 0.4)
 
             # Press Enter to select
             await self.page.keyboard.press("Enter")
-            print(f"✓ Pressed Enter to select condition: {condition}")
+            logger.info(f"Pressed Enter to select condition: {condition}")
             await self.human.async_random_delay(0.5, 0.8)
 
         except Exception as e:
@@ -499,7 +525,7 @@ class MarketplaceAutomation:
                 await asyncio.sleep(0.2)
                 await ta.fill("")  # Clear any existing text
                 await ta.fill(description)  # Fast fill instead of slow character-by-character typing
-                print("✓ Description entered")
+                logger.info("Description entered")
                 return
 
         raise Exception("Could not find description field")
@@ -527,10 +553,10 @@ class MarketplaceAutomation:
                 except:
                     continue
 
-            print(f"Warning: Could not set location to {location}")
+            logger.warning(f"Could not set location to {location}")
 
         except Exception as e:
-            print(f"Warning: Error setting location: {str(e)}")
+            logger.warning(f"Error setting location: {str(e)}")
 
     async def _select_delivery_method(self, method="Door pickup"):
         """
@@ -538,7 +564,7 @@ class MarketplaceAutomation:
         Options: 'Public meetup', 'Door pickup', 'Door dropoff'
         """
         try:
-            print(f"Looking for delivery method: {method}")
+            logger.debug(f"Looking for delivery method: {method}")
 
             # Try to find and click the delivery method
             delivery_clicked = await self.page.evaluate(f"""
@@ -593,13 +619,13 @@ class MarketplaceAutomation:
             """, method)
 
             if delivery_clicked:
-                print(f"✓ Selected delivery method: {method}")
+                logger.info(f"Selected delivery method: {method}")
                 await self.human.async_random_delay(0.5, 0.8)
             else:
-                print(f"WARNING: Could not find delivery method checkbox for '{method}'")
+                logger.warning(f"Could not find delivery method checkbox for '{method}'")
 
         except Exception as e:
-            print(f"ERROR: Exception selecting delivery method: {str(e)}")
+            logger.error(f"Exception selecting delivery method: {str(e)}")
 
     async def _select_groups(self, group_names=None):
         """
@@ -607,7 +633,7 @@ class MarketplaceAutomation:
         If group_names is None or empty, selects the first available group
         """
         try:
-            print("Looking for groups to select...")
+            logger.debug("Looking for groups to select...")
 
             if not group_names:
                 # Select first available group by default
@@ -627,10 +653,10 @@ class MarketplaceAutomation:
                 """)
 
                 if selected:
-                    print("✓ Selected first available group")
+                    logger.info("Selected first available group")
                     await self.human.async_random_delay(0.5, 0.8)
                 else:
-                    print("Warning: No groups found to select (may not be required)")
+                    logger.warning("No groups found to select (may not be required)")
             else:
                 # Select specific groups
                 selected_count = 0
@@ -658,19 +684,19 @@ class MarketplaceAutomation:
                         await self.human.async_random_delay(0.3, 0.5)
 
                 if selected_count > 0:
-                    print(f"✓ Selected {selected_count} group(s)")
+                    logger.info(f"Selected {selected_count} group(s)")
                 else:
-                    print("Warning: No matching groups found")
+                    logger.warning("No matching groups found")
 
         except Exception as e:
-            print(f"Warning: Error selecting groups: {str(e)}")
+            logger.warning(f"Error selecting groups: {str(e)}")
 
     async def _toggle_boost_listing(self):
         """
         Toggle boost listing switch (must be called BEFORE first Next click)
         """
         try:
-            print("Looking for boost listing toggle...")
+            logger.debug("Looking for boost listing toggle...")
 
             # Find and click the boost switch
             boost_toggled = await self.page.evaluate("""
@@ -705,13 +731,13 @@ class MarketplaceAutomation:
             """)
 
             if boost_toggled:
-                print("✓ Boost listing enabled")
+                logger.info("Boost listing enabled")
                 await self.human.async_random_delay(0.5, 0.8)
             else:
-                print("Warning: Could not find boost listing toggle (this is OK if boost isn't available)")
+                logger.warning("Could not find boost listing toggle (this is OK if boost isn't available)")
 
         except Exception as e:
-            print(f"Warning: Error toggling boost listing: {str(e)}")
+            logger.warning(f"Error toggling boost listing: {str(e)}")
 
     async def _click_next_button(self):
         """Click the Next button"""
@@ -824,4 +850,4 @@ class MarketplaceAutomation:
         try:
             await self.browser.close()
         except Exception as e:
-            print(f"Error closing browser (non-critical): {str(e)[:100]}")
+            logger.warning(f"Error closing browser (non-critical): {str(e)[:100]}")
@@ -0,0 +1,361 @@
+"""
+Posting worker that runs in a child process
+
+PostingProcess pre-flight checks the items in this process (so the
+verdict cache in automation.preflight is reused between runs), then launches
+run_posting() with the multiprocessing "spawn" start method for the
+survivors, so Playwright and Chrome never share the GIL with Tk and a crash
+or hang in the driver can't take the window down. The child opens its own
+Database connection and writes queue statuses itself; the GUI only listens.
+
+Messages are (kind, payload) tuples.
+
+GUI -> worker (commands queue):
+    ('stop', None)                   finish the current listing, then exit
+
+Worker -> GUI (on_event callback; pre-flight messages come from this process):
+    ('status', text)                 short status bar text
+    ('preflight', {'checked', 'failed'})
+    ('progress', {'index', 'total', 'item_id'})   starting item `index` (0-based)
+    ('waiting', seconds)             delay before the next post
+    ('item', {'id', 'status'})       a status change has been written
+    ('error', message)               the run failed
+    ('done', {'posted', 'failed', 'stopped', 'crashed', 'error'})   always the last message
+
+Log records are sent on a third queue and re-emitted by the GUI process's
+logging, so they show up in the log file and the Logs tab.
+"""
+import asyncio
+import logging
+import multiprocessing
+import queue
+import random
+import threading
+from automation.artifacts import ArtifactStore
+from automation.browser import BrowserManager
+from automation.marketplace import MarketplaceAutomation
+from automation.preflight import PreflightChecker
+from config.logging_setup import setup_worker_logging, forward_worker_logs
+from database.db import Database
+from database.writer import DatabaseWriter
+
+logger = logging.getLogger(__name__)
+
+
+class StatusNotRecorded(Exception):
+    """A queue status change could not be saved; the run must stop"""
+
+
+def run_posting(db_path, settings, item_ids, events, commands, log_queue):
+    """Child process entry point"""
+    setup_worker_logging(log_queue, settings)
+
+    stop = threading.Event()
+    reader = threading.Thread(target=_read_commands, args=(commands, stop), name="worker-commands")
+    reader.daemon = True
+    reader.start()
+
+    result = {'posted': 0, 'failed': 0, 'stopped': False, 'crashed': False, 'error': None}
+    try:
+        asyncio.run(_post_listings(db_path, settings, item_ids, events, stop, result))
+    except Exception as e:
+        logger.exception(f"Error in posting worker: {e}")
+        result['error'] = str(e)
+        events.put(('error', str(e)))
+    finally:
+        result['stopped'] = stop.is_set()
+        events.put(('done', result))
+
+
+def _read_commands(commands, stop):
+    """Worker thread that applies commands from the GUI"""
+    while True:
+        kind, _ = commands.get()
+        if kind == 'stop':
+            stop.set()
+            return
+
+
+async def _post_listings(db_path, settings, item_ids, events, stop, result):
+    """Post each item that is still pending (pre-flight has already run in the GUI process)"""
+    db = Database(db_path)
+    wanted = set(item_ids)
+    # Re-read so items deleted or already handled since Start was pressed are skipped
+    items = [item for item in db.get_queue_items(status='pending') if item.id in wanted]
+    if not items or stop.is_set():
+        db.close()
+        return
+
+    browser = BrowserManager(settings.get('chrome_profile_path'))
+    artifact_store = ArtifactStore(
+        settings.get('artifacts_dir', 'data/artifacts'),
+        settings.get('artifacts_max_mb', 200) * 1024 * 1024
+    )
+    automation = MarketplaceAutomation(browser, artifact_store)
+
+    # Status writes go through a background thread so the event loop never waits on SQLite
+    writer = DatabaseWriter(db)
+    loop = asyncio.get_running_loop()
+
+    write_timeout = settings.get('status_write_timeout', 30)
+    unrecorded = []
+
+    def written(item_id, status):
+        return lambda: events.put(('item', {'id': item_id, 'status': status}))
+
+    def not_written(item, status):
+        return lambda error: unrecorded.append(f"'{item.title}' (#{item.id}) as {status}: {error}")
+
+    def update_status(item, status, *args):
+        writer.update_queue_status(
+            item.id, status, *args, on_done=written(item.id, status), on_error=not_written(item, status)
+        )
+
+    async def check_recorded():
+        """Stop the run rather than keep posting when a status change could not be saved"""
+        flushed = await loop.run_in_executor(None, writer.flush, write_timeout)
+        if not flushed or unrecorded:
+            raise StatusNotRecorded()
+
+    try:
+        await automation.initialize()
+
+        total = len(items)
+        for idx, item in enumerate(items):
+            if stop.is_set():
+                break
+
+            # The previous listing's result must be saved before the next one starts
+            await check_recorded()
+            events.put(('progress', {'index': idx, 'total': total, 'item_id': item.id}))
+            update_status(item, 'posting')
+            await check_recorded()
+
+            listing = await automation.create_listing(
+                item.title,
+                item.description,
+                item.price,
+                item.category,
+                item.condition,
+                item.location,
+                item.images,
+                item.delivery_method,
+                item.groups,
+                item.boost_listing
+            )
+
+            if listing['success']:
+                result['posted'] += 1
+                update_status(item, 'posted')
+            else:
+                result['failed'] += 1
+                update_status(item, 'failed', listing['error'], listing.get('artifacts'))
+
+            # Random delay between posts; a stop command ends it early
+            if idx < total - 1:
+                delay = random.uniform(
+                    settings.get('min_delay_between_posts', 60),
+                    settings.get('max_delay_between_posts', 180)
+                )
+                events.put(('waiting', delay))
+                await loop.run_in_executor(None, stop.wait, delay)
+    except StatusNotRecorded:
+        # Reported below, once the writer has given up on the pending writes
+        pass
+    finally:
+        await automation.close()
+        # Make sure every status change is on disk before the process exits
+        await loop.run_in_executor(None, writer.close, write_timeout)
+        db.close()
+
+    pending = writer.pending()
+    if unrecorded or pending:
+        problems = unrecorded + ([f"{pending} status write(s) still pending"] if pending else [])
+        raise RuntimeError(f"Could not record listing status, stopped posting: {'; '.join(problems)}")
+
+
+class PostingProcess:
+    """Runs the posting worker in a child process and relays its messages.
+
+    on_event(kind, payload) is called on a background thread for every worker
+    message; GUI code should hand it to the Tk thread with after().
+    """
+
+    def __init__(self, db, settings, item_ids, on_event, stop_timeout=120):
+        if db.in_memory:
+            raise ValueError("The posting worker needs a file-backed database")
+
+        self.db = db
+        self.settings = dict(settings)
+        self.item_ids = list(item_ids)
+        self.on_event = on_event
+        self.stop_timeout = stop_timeout
+        self.current_item = None
+        # Relayed from 'item' events; the child's own totals win when it reports them
+        self.counts = {'posted': 0, 'failed': 0}
+        self.preflight_failed = 0
+        self.stopping = False
+        self.finished = threading.Event()
+        self.process = None
+        self._killed_reason = None
+        self._done_sent = False
+        self._launch_lock = threading.Lock()
+
+        self._context = multiprocessing.get_context("spawn")
+        self.events = self._context.Queue()
+        self.commands = self._context.Queue()
+        self.logs = self._context.Queue()
+
+    def start(self):
+        """Start pre-flight checks, then the child process, on a background thread"""
+        threading.Thread(target=forward_worker_logs, args=(self.logs,), name="worker-logs", daemon=True).start()
+        threading.Thread(target=self._run, name="worker-monitor", daemon=True).start()
+
+    def is_running(self):
+        return not self.finished.is_set()
+
+    def stop(self):
+        """Ask the worker to stop after the current listing; kill it if it hasn't within stop_timeout"""
+        if self.stopping or not self.is_running():
+            return
+        self.stopping = True
+        self.commands.put(('stop', None))
+
+        timer = threading.Timer(self.stop_timeout, self.terminate, args=(f"did not stop within {self.stop_timeout}s",))
+        timer.daemon = True
+        timer.start()
+
+    def terminate(self, reason="terminated"):
+        """Kill the worker right away (e.g. when the app is closing)"""
+        with self._launch_lock:
+            self._killed_reason = self._killed_reason or reason
+            if self.process and self.process.is_alive():
+                logger.warning(f"Killing posting worker: {reason}")
+                self.process.kill()
+
+    def _run(self):
+        """Pre-flight, launch the child and relay its messages; always ends with 'done'"""
+        try:
+            item_ids = self._preflight()
+            with self._launch_lock:
+                launch = bool(item_ids) and not self.stopping and not self._killed_reason
+                if launch:
+                    self.process = self._context.Process(
+                        target=run_posting,
+                        args=(self.db.db_path, self.settings, item_ids, self.events, self.commands, self.logs),
+                        name="posting-worker",
+                        daemon=True
+                    )
+                    self.process.start()
+                    logger.info(f"Started posting worker (pid {self.process.pid})")
+            if launch:
+                self._monitor()
+        except Exception as e:
+            logger.exception(f"Error running posting worker: {e}")
+            if not self._done_sent:
+                if self.process:
+                    # Can't follow the child any more; stop it and clean up as if it crashed
+                    if self.process.is_alive():
+                        self.process.kill()
+                    self._child_died(f"could not be monitored ({e})")
+                else:
+                    self._dispatch('error', str(e))
+                    self._dispatch('done', dict(self.counts, stopped=self.stopping, crashed=False, error=str(e)))
+        finally:
+            if not self._done_sent:
+                self._dispatch('done', dict(self.counts, stopped=self.stopping, crashed=False, error=None))
+            self.logs.put(None)
+            self.finished.set()
+
+    def _preflight(self):
+        """Fail broken items before the browser is launched, returns the ids still to post"""
+        self._dispatch('status', "Checking listings")
+        wanted = set(self.item_ids)
+        items = [item for item in self.db.get_queue_items(status='pending') if item.id in wanted]
+
+        checker = PreflightChecker(max_workers=self.settings.get('preflight_workers', 8))
+        problems = checker.check_items(items)
+        self.preflight_failed = len(problems)
+        for item_id, reason in problems.items():
+            self.db.update_queue_status(item_id, 'failed', f"Pre-flight check failed: {reason}")
+            self._dispatch('item', {'id': item_id, 'status': 'failed'})
+        self._dispatch('preflight', {'checked': len(items), 'failed': len(problems)})
+        return [item.id for item in items if item.id not in problems]
+
+    def _monitor(self):
+        """Relay worker messages and notice if the child dies without saying so"""
+        while True:
+            try:
+                kind, payload = self.events.get(timeout=0.5)
+            except queue.Empty:
+                if self.process.is_alive():
+                    continue
+                # Exited; pick up anything it managed to send first
+                try:
+                    kind, payload = self.events.get(timeout=0.5)
+                except queue.Empty:
+                    self._child_died()
+                    return
+
+            if kind == 'progress':
+                self.current_item = payload['item_id']
+            elif kind == 'item' and payload['id'] == self.current_item and payload['status'] != 'posting':
+                self.current_item = None
+            elif kind == 'done':
+                # The child's totals count listings whose status write was lost too;
+                # add the pre-flight failures, which happened in this process
+                payload = dict(payload, failed=payload['failed'] + self.preflight_failed)
+                relayed = {key: payload[key] for key in self.counts}
+                if relayed != self.counts:
+                    logger.warning(f"Posting worker reported {relayed} but status updates were received "
+                                   f"for {self.counts}; some status changes were not recorded")
+
+            self._dispatch(kind, payload)
+            if kind == 'done':
+                self.process.join(timeout=10)
+                return
+
+    def _child_died(self, reason=None):
+        """Clean up after a worker that exited (or was killed) mid-run"""
+        self.process.join(timeout=5)
+        reason = self._killed_reason or reason or f"exited unexpectedly (exit code {self.process.exitcode})"
+        logger.error(f"Posting worker {reason}")
+
+        # The listing being posted may be half done; don't leave it stuck in 'posting'.
+        # Only touch it if it is still 'posting': the child may have recorded the
+        # result just before dying, and a posted listing must never be re-offered.
+        if self.current_item is not None:
+            try:
+                if self.db.update_queue_status(
+                    self.current_item, 'failed', f"Posting worker {reason}", expected_status='posting'
+                ):
+                    self._dispatch('item', {'id': self.current_item, 'status': 'failed'})
+                else:
+                    # Re-read so the totals match what the child managed to write
+                    self._count_final_status(self.current_item)
+            except Exception as e:
+                logger.error(f"Could not mark item {self.current_item} failed: {e}")
+
+        crashed = not self._killed_reason
+        if crashed:
+            self._dispatch('error', f"Posting worker {reason}")
+        self._dispatch('done', dict(
+            self.counts, stopped=self.stopping, crashed=crashed, error=f"Posting worker {reason}" if crashed else None
+        ))
+
+    def _count_final_status(self, item_id):
+        """Count an item whose final status was written but never reported"""
+        for item in self.db.get_queue_items():
+            if item.id == item_id and item.status in self.counts:
+                self._dispatch('item', {'id': item_id, 'status': item.status})
+                return
+
+    def _dispatch(self, kind, payload):
+        if kind == 'item' and payload['status'] in self.counts:
+            self.counts[payload['status']] += 1
+        elif kind == 'done':
+            self._done_sent = True
+        try:
+            self.on_event(kind, payload)
+        except Exception:
+            logger.exception(f"Error handling worker event {kind}")
@@ -0,0 +1,85 @@
+"""
+Memory benchmark: 100k queue rows as dicts vs slotted QueueItem records
+
+Records decode images/groups lazily, so they are measured twice: untouched,
+and after reading .images and .groups the way the queue view does for every
+row. The second number is the one that applies to refresh_queue.
+
+Usage: python benchmarks/bench_records_memory.py [count]
+"""
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from database.models import QueueItem
+
+
+def make_rows(count):
+    """Build raw rows shaped like SELECT QueueItem.COLUMNS FROM queue"""
+    images = json.dumps([f"/photos/batch/IMG_{i:04d}.jpg" for i in range(4)])
+    return [
+        (i, 1, f"Custom CNC Sign #{i}", "Handmade sign, cut from birch plywood.", 45.0,
+         "Home & Garden", "New", "Springfield", images, "Door pickup", None, 0,
+         "pending", "2026-01-01T12:00:00", None, None, None)
+        for i in range(count)
+    ]
+
+
+def as_dict(row):
+    """Decode a row the way Database.get_queue_items used to"""
+    return {
+        'id': row[0], 'workflow_id': row[1], 'title': row[2], 'description': row[3],
+        'price': row[4], 'category': row[5], 'condition': row[6], 'location': row[7],
+        'images': json.loads(row[8]), 'delivery_method': row[9] or 'Door pickup',
+        'groups': json.loads(row[10]) if row[10] else None, 'boost_listing': bool(row[11]),
+        'status': row[12] or 'pending', 'created_at': row[13], 'posted_at': row[14],
+        'error_message': row[15], 'artifacts': json.loads(row[16]) if row[16] else None
+    }
+
+
+def as_touched_record(row):
+    """Build a record and decode the lazy fields the queue view reads"""
+    record = QueueItem.from_row(row)
+    record.images
+    record.groups
+    return record
+
+
+def measure(build, rows):
+    """Return bytes allocated by build(rows) that are still alive"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(rows)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def report(label, size, count, baseline=None):
+    line = f"  {label + ':':30} {size / 1024 / 1024:8.1f} MB ({size // count} bytes/row)"
+    if baseline:
+        line += f", saved {(1 - size / baseline) * 100:.0f}%"
+    print(line)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = make_rows(count)
+
+    dict_bytes = measure(lambda rs: [as_dict(r) for r in rs], rows)
+    record_bytes = measure(lambda rs: [QueueItem.from_row(r) for r in rs], rows)
+    touched_bytes = measure(lambda rs: [as_touched_record(r) for r in rs], rows)
+
+    print(f"{count} rows")
+    report("dicts", dict_bytes, count)
+    report("records (untouched)", record_bytes, count, dict_bytes)
+    report("records (images/groups read)", touched_bytes, count, dict_bytes)
+
+if __name__ == "__main__":
+    main()
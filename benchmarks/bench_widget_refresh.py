@@ -0,0 +1,58 @@
+"""
+Benchmark: Tk objects created per QueueManager.refresh_queue
+
+Needs a display; on a headless machine run it under Xvfb:
+    xvfb-run python benchmarks/bench_widget_refresh.py [count]
+"""
+import sys
+import tempfile
+import time
+import tkinter.font
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import customtkinter as ctk
+from database.db import Database
+from config.config import Config
+from gui.queue_manager import QueueManager
+
+
+def count_widgets(widget):
+    """Count a widget and all of its descendants"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / "bench.db"))
+        config = Config(str(Path(tmp) / "settings.json"))
+        workflow_id = db.create_workflow("Bench", "Sign", ["desc"], 45.0, "Home & Garden", "New")
+        for i in range(count):
+            db.add_to_queue(workflow_id, f"Sign {i}", "desc", 45.0, "Home & Garden", "New", "",
+                            [f"img_{i}_{n}.jpg" for n in range(4)])
+
+        root = ctk.CTk()
+        root.withdraw()
+        view = QueueManager(root, db, config, lambda text: None)
+
+        for run in range(3):
+            fonts_before = len(tkinter.font.names(root))
+            start = time.perf_counter()
+            view.refresh_queue()
+            root.update_idletasks()
+            elapsed = time.perf_counter() - start
+            fonts_created = len(tkinter.font.names(root)) - fonts_before
+
+            print(f"refresh {run + 1}: {count} items, {elapsed * 1000:7.1f} ms, "
+                  f"{count_widgets(view.queue_frame)} widgets, {fonts_created} fonts created")
+
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main()
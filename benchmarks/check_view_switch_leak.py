@@ -0,0 +1,109 @@
+"""
+Leak check: switching views repeatedly must not grow memory
+
+Opens the main window against a throwaway database, warms up, takes a
+tracemalloc baseline, cycles through the sidebar views the given
+number of times and compares. Exits non-zero if traced memory, live widgets
+or Tcl commands grew past the allowed limits, printing the top-growing
+allocation sites.
+
+Needs a display; on a headless machine run it under Xvfb:
+    xvfb-run python benchmarks/check_view_switch_leak.py [--switches 1000] [--max-growth-kb 1024]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+import synthetic
+from gui.memory_monitor import count_widgets, tk_object_counts, take_snapshot, top_growth
+
+
+def view_switchers(window):
+    """The navigation callbacks, in sidebar order"""
+    return [window.show_workflows, window.show_queue, window.show_logs, window.show_stats]
+
+
+def switch_views(window, switches):
+    """Cycle through the navigation views, processing events after each switch"""
+    views = view_switchers(window)
+    for i in range(switches):
+        views[i % len(views)]()
+        window.update()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that switching views does not leak memory")
+    parser.add_argument("--switches", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--rows", type=int, default=50, help="Queue rows shown in the Posting Queue view")
+    parser.add_argument("--max-growth-kb", type=float, default=1024)
+    parser.add_argument("--max-command-growth", type=int, default=0)
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    os.chdir(tmp.name)
+
+    # Imported after chdir so the window's default data/ and config/ paths land in tmp
+    from config.config import Config
+    from database.db import Database
+    from gui.main_window import MainWindow
+
+    Config().set('chrome_profile_path', tmp.name)
+    synthetic.populate(Database(), args.rows)
+
+    tracemalloc.start(10)
+    window = MainWindow()
+    window.withdraw()
+
+    switch_views(window, args.warmup)
+    baseline = take_snapshot()
+    before = tk_object_counts(window)
+    before['widgets'] = count_widgets(window)
+
+    # A whole number of cycles ends on the view the baseline was taken on
+    cycle = len(view_switchers(window))
+    switches = args.switches + (-args.switches % cycle)
+    switch_views(window, switches)
+    snapshot = take_snapshot()
+    after = tk_object_counts(window)
+    after['widgets'] = count_widgets(window)
+
+    growth_kb = (sum(s.size for s in snapshot.statistics('filename')) -
+                 sum(s.size for s in baseline.statistics('filename'))) / 1024
+
+    print(f"\n{switches} view switches")
+    print(f"  traced memory: {growth_kb:+.1f} KB (limit {args.max_growth_kb:.0f} KB)")
+    for key in ('widgets', 'tk_commands', 'after_timers'):
+        print(f"  {key}: {before[key]} -> {after[key]}")
+
+    print("\nTop growing allocation sites:")
+    for entry in top_growth(snapshot, baseline, top=10):
+        print(f"  {entry['size_diff_kb']:+9.1f} KB {entry['count_diff']:+7d} objs  {entry['site']}")
+
+    failures = []
+    if growth_kb > args.max_growth_kb:
+        failures.append(f"memory grew {growth_kb:.0f} KB")
+    if after['widgets'] > before['widgets']:
+        failures.append(f"{after['widgets'] - before['widgets']} widgets leaked")
+    if after['tk_commands'] - before['tk_commands'] > args.max_command_growth:
+        failures.append(f"{after['tk_commands'] - before['tk_commands']} Tcl commands leaked")
+
+    window.destroy()
+    tracemalloc.stop()
+
+    if failures:
+        print(f"\n[FAIL] {', '.join(failures)}\n")
+        sys.exit(1)
+    print("\n[OK] No leak detected\n")
+
+
+if __name__ == "__main__":
+    main()
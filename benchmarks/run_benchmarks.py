@@ -0,0 +1,221 @@
+"""
+Storage and GUI benchmark suite
+
+Generates synthetic workflows, queue rows and image folders at each scale
+and times the Database layer, batch scan-and-enqueue and (when a display is
+available) QueueManager.refresh_queue widget building. Results are written
+to benchmarks/results/<timestamp>-<commit>.json so runs can be compared.
+
+Usage:
+    python benchmarks/run_benchmarks.py                       # 1k, 10k, 100k
+    python benchmarks/run_benchmarks.py --scales 1000,10000
+    xvfb-run python benchmarks/run_benchmarks.py --gui        # include GUI refresh
+    python benchmarks/run_benchmarks.py --compare old.json new.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database.db import Database
+from automation.batch import (
+    scan_image_folder, plan_listings, enqueue_listings,
+    index_capture_times, group_by_capture_time, plan_grouped_listings
+)
+import synthetic
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+class Timer:
+    """Collects named timings for one scale"""
+
+    def __init__(self, repeat=3):
+        self.repeat = repeat
+        self.results = {}
+
+    def run(self, name, func, repeat=None, ops=None):
+        """Time func, keeping the best of `repeat` runs"""
+        best = None
+        for _ in range(repeat or self.repeat):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        entry = {'seconds': round(best, 6)}
+        if ops:
+            entry['ops'] = ops
+            entry['us_per_op'] = round(best / ops * 1e6, 2)
+        self.results[name] = entry
+        print(f"  {name:32s} {best * 1000:10.1f} ms" + (f"  ({entry['us_per_op']} us/op)" if ops else ""))
+        return best
+
+
+def bench_database(scale, timer, in_memory):
+    """Database CRUD and get_queue_items decoding"""
+    tmp = tempfile.TemporaryDirectory()
+    db_path = ":memory:" if in_memory else os.path.join(tmp.name, "bench.db")
+    db = Database(db_path)
+
+    timer.run("populate", lambda: synthetic.populate(db, scale), repeat=1, ops=scale)
+
+    timer.run("get_queue_items(all)", lambda: db.get_queue_items(), ops=scale)
+    timer.run("get_queue_items(pending)", lambda: db.get_queue_items(status='pending'))
+    timer.run("get_queue_items+decode", lambda: [item.images for item in db.get_queue_items()], ops=scale)
+    timer.run("get_all_workflows", lambda: db.get_all_workflows())
+    timer.run("stats(daily+workflow+reasons)", lambda: (
+        db.get_daily_stats(None), db.get_workflow_stats(None), db.get_failure_reasons(None)
+    ))
+
+    # Per-row operations open a connection each, so time a fixed sample
+    sample = min(scale, 500)
+    ids = [item.id for item in db.get_queue_items(status='pending')[:sample]]
+    workflow = db.get_all_workflows()[0]
+
+    timer.run("add_to_queue", lambda: [
+        db.add_to_queue(workflow.id, "t", "d", 1.0, "Misc", "New", "", ["a.jpg"]) for _ in range(sample)
+    ], repeat=1, ops=sample)
+    timer.run("update_queue_status", lambda: [db.update_queue_status(i, 'posting') for i in ids],
+              repeat=1, ops=len(ids))
+    timer.run("get_workflow", lambda: [db.get_workflow(workflow.id) for _ in range(sample)], repeat=1, ops=sample)
+    timer.run("delete_queue_item", lambda: [db.delete_queue_item(i) for i in ids], repeat=1, ops=len(ids))
+    timer.run("archive_queue_items", lambda: db.archive_queue_items(retention_days=0), repeat=1)
+
+    db.close()
+    tmp.cleanup()
+
+
+def bench_batch(scale, timer):
+    """batch_generate's scan-and-enqueue path"""
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = synthetic.make_image_folder(Path(tmp) / "images", scale)
+        db = Database(":memory:")
+        workflow = db.get_workflow(db.create_workflow(**synthetic.make_workflow(random.Random(0), 0)))
+
+        scanned = {}
+
+        def scan():
+            scanned['files'] = scan_image_folder(folder)
+
+        timer.run("scan_image_folder", scan, ops=scale)
+
+        image_files = scanned['files']
+        num_listings = len(image_files) // 4
+        timer.run("plan+enqueue_listings", lambda: enqueue_listings(
+            db, workflow, plan_listings(workflow, image_files, 4, num_listings)
+        ), repeat=1, ops=num_listings)
+
+        # First run reads every file's EXIF, later runs hit the image index
+        timer.run("index_capture_times(cold)", lambda: index_capture_times(db, image_files), repeat=1, ops=scale)
+        timer.run("index+group+plan(warm)", lambda: plan_grouped_listings(
+            workflow, group_by_capture_time(index_capture_times(db, image_files)), 4, num_listings
+        ), ops=scale)
+        db.close()
+
+
+def bench_gui(scale, timer):
+    """QueueManager.refresh_queue widget building (needs a display)"""
+    import customtkinter as ctk
+    from config.config import Config
+    from gui.queue_manager import QueueManager
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(":memory:")
+        synthetic.populate(db, scale)
+        config = Config(os.path.join(tmp, "settings.json"))
+
+        root = ctk.CTk()
+        root.withdraw()
+        view = QueueManager(root, db, config, lambda text: None)
+
+        def refresh():
+            view.refresh_queue()
+            root.update_idletasks()
+
+        timer.run("refresh_queue", refresh, repeat=2, ops=scale)
+        root.destroy()
+        db.close()
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(old_path, new_path):
+    """Print per-benchmark changes between two result files"""
+    old = json.loads(Path(old_path).read_text())
+    new = json.loads(Path(new_path).read_text())
+    print(f"{old['commit']} -> {new['commit']}")
+
+    for scale, benches in new['results'].items():
+        print(f"\nscale {scale}")
+        for name, entry in benches.items():
+            before = old['results'].get(scale, {}).get(name)
+            if not before:
+                print(f"  {name:32s} {entry['seconds'] * 1000:10.1f} ms  (new)")
+                continue
+            change = (entry['seconds'] - before['seconds']) / before['seconds'] * 100 if before['seconds'] else 0
+            flag = "  REGRESSION" if change > 10 else ""
+            print(f"  {name:32s} {before['seconds'] * 1000:10.1f} -> {entry['seconds'] * 1000:10.1f} ms "
+                  f"({change:+.0f}%){flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark storage and GUI layers")
+    parser.add_argument("--scales", default="1000,10000,100000", help="Comma-separated row counts")
+    parser.add_argument("--gui", action="store_true", help="Include QueueManager.refresh_queue (needs a display)")
+    parser.add_argument("--gui-max", type=int, default=2000, help="Largest scale to build widgets for")
+    parser.add_argument("--disk", action="store_true", help="Use a database file instead of :memory:")
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/<time>-<commit>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    commit = git_commit()
+    report = {
+        'commit': commit,
+        'time': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'storage': 'disk' if args.disk else 'memory',
+        'results': {}
+    }
+
+    for scale in [int(s) for s in args.scales.split(",")]:
+        print(f"\nscale {scale}")
+        timer = Timer()
+        bench_database(scale, timer, in_memory=not args.disk)
+        bench_batch(scale, timer)
+        if args.gui and scale <= args.gui_max:
+            bench_gui(scale, timer)
+        report['results'][str(scale)] = timer.results
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nResults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
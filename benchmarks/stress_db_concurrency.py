@@ -0,0 +1,136 @@
+"""
+Concurrency stress harness for UI-thread vs worker-thread database access
+
+Simulates the Tk thread (refresh reads), the posting worker (status updates)
+and optional background writers (batch enqueue, archival) hammering one
+database file at configurable rates. Reports latency percentiles, lock
+errors and Database retry/backoff counters.
+
+Usage:
+    python benchmarks/stress_db_concurrency.py --duration 20 --ui-rate 20 --worker-rate 50
+    python benchmarks/stress_db_concurrency.py --journal-mode DELETE --retries 0   # old behaviour
+"""
+import argparse
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database.db import Database
+import synthetic
+
+
+class Actor(threading.Thread):
+    """Runs one operation at a fixed rate and records its latency"""
+
+    def __init__(self, name, operation, rate, stop):
+        super().__init__(name=name, daemon=True)
+        self.operation = operation
+        self.interval = 1.0 / rate
+        self.stop = stop
+        self.latencies = []
+        self.errors = 0
+        self.error_messages = set()
+
+    def run(self):
+        next_run = time.perf_counter()
+        while not self.stop.is_set():
+            start = time.perf_counter()
+            try:
+                self.operation()
+            except sqlite3.OperationalError as e:
+                self.errors += 1
+                self.error_messages.add(str(e))
+            self.latencies.append(time.perf_counter() - start)
+
+            next_run += self.interval
+            delay = next_run - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind; don't try to catch up in a burst
+                next_run = time.perf_counter()
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stress the Database layer from several threads")
+    parser.add_argument("--duration", type=float, default=15, help="Seconds to run")
+    parser.add_argument("--rows", type=int, default=5000, help="Queue rows to start with")
+    parser.add_argument("--ui-rate", type=float, default=10, help="UI refreshes per second")
+    parser.add_argument("--worker-rate", type=float, default=50, help="Worker status updates per second")
+    parser.add_argument("--enqueue-rate", type=float, default=2, help="Batch enqueues (50 rows) per second, 0 to disable")
+    parser.add_argument("--archive-rate", type=float, default=0.5, help="Archive runs per second, 0 to disable")
+    parser.add_argument("--busy-timeout", type=float, default=10.0)
+    parser.add_argument("--retries", type=int, default=5)
+    parser.add_argument("--journal-mode", default="WAL")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(str(Path(tmp) / "stress.db"), busy_timeout=args.busy_timeout,
+                      max_retries=args.retries, journal_mode=args.journal_mode)
+        workflow_ids = synthetic.populate(db, args.rows)
+        pending_ids = [item.id for item in db.get_queue_items(status='pending')]
+        batch = synthetic.make_queue_items(random.Random(1), workflow_ids[0], 50)
+
+        counter = iter(range(10 ** 9))
+
+        def ui_refresh():
+            db.get_queue_items()
+            db.get_all_workflows()
+
+        def worker_update():
+            queue_id = pending_ids[next(counter) % len(pending_ids)]
+            db.update_queue_status(queue_id, 'posting')
+            db.update_queue_status(queue_id, 'failed', 'stress test')
+
+        stop = threading.Event()
+        actors = [
+            Actor("ui", ui_refresh, args.ui_rate, stop),
+            Actor("worker", worker_update, args.worker_rate, stop),
+        ]
+        if args.enqueue_rate:
+            actors.append(Actor("enqueue", lambda: db.add_many_to_queue(batch), args.enqueue_rate, stop))
+        if args.archive_rate:
+            actors.append(Actor("archive", lambda: db.archive_queue_items(retention_days=0, batch_size=200),
+                                args.archive_rate, stop))
+
+        print(f"Running {len(actors)} threads for {args.duration:.0f}s "
+              f"(journal={args.journal_mode}, busy_timeout={args.busy_timeout}s, retries={args.retries})")
+        for actor in actors:
+            actor.start()
+        time.sleep(args.duration)
+        stop.set()
+        for actor in actors:
+            actor.join()
+
+        print(f"\n{'thread':10s} {'ops':>7s} {'errors':>7s} {'p50 ms':>8s} {'p95 ms':>8s} {'p99 ms':>8s} {'max ms':>8s}")
+        for actor in actors:
+            lat = actor.latencies
+            print(f"{actor.name:10s} {len(lat):7d} {actor.errors:7d} "
+                  f"{percentile(lat, 50) * 1000:8.1f} {percentile(lat, 95) * 1000:8.1f} "
+                  f"{percentile(lat, 99) * 1000:8.1f} {max(lat, default=0) * 1000:8.1f}")
+            for message in actor.error_messages:
+                print(f"           ! {message}")
+
+        stats = db.lock_stats
+        print(f"\nRetries: {stats['retries']}, failures after retries: {stats['failures']}, "
+              f"time in backoff: {stats['backoff_seconds']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
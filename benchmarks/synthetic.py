@@ -0,0 +1,89 @@
+"""
+Synthetic data generator for benchmarks
+"""
+import random
+from pathlib import Path
+
+CATEGORIES = ["Home & Garden", "Electronics", "Hobbies", "Misc"]
+CONDITIONS = ["New", "Used - Like new", "Used - good", "Used - fair"]
+WORDS = ("custom cnc sign birch walnut oak engraved rustic modern family name "
+         "cabin lake garden welcome handmade gift wedding anniversary").split()
+
+# A valid 1x1 grayscale JPEG, small enough to write 100k of them quickly
+TINY_JPEG = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000ffdb004300080606070605080707070909080a0c140d0c0b0b0c1912130f"
+    "141d1a1f1e1d1a1c1c20242e2720222c231c1c2837292c30313434341f27393d38323c2e333432ffc0000b080001000101011100"
+    "ffc4001f0000010501010101010100000000000000000102030405060708090a0bffc400b5100002010303020403050504040000"
+    "017d01020300041105122131410613516107227114328191a1082342b1c11552d1f02433627282090a161718191a25262728292a"
+    "3435363738393a434445464748494a535455565758595a636465666768696a737475767778797a838485868788898a9293949596"
+    "9798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9bac2c3c4c5c6c7c8c9cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1f2f3"
+    "f4f5f6f7f8f9faffda0008010100003f00fbd3ffd9"
+)
+
+
+def sentence(rng, words=12):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def make_workflow(rng, index):
+    """Keyword arguments for Database.create_workflow"""
+    return {
+        'name': f"Workflow {index}",
+        'title': f"{rng.choice(WORDS).title()} Sign {index}",
+        'descriptions': [sentence(rng, 40) for _ in range(3)],
+        'price': round(rng.uniform(10, 300), 2),
+        'category': rng.choice(CATEGORIES),
+        'condition': rng.choice(CONDITIONS),
+        'location': "Springfield",
+        'groups': [f"Group {n}" for n in range(rng.randint(0, 3))] or None,
+    }
+
+
+def make_queue_items(rng, workflow_id, count, images_per=4):
+    """Dicts for Database.add_many_to_queue"""
+    return [
+        {
+            'workflow_id': workflow_id,
+            'title': f"{rng.choice(WORDS).title()} Sign {i}",
+            'description': sentence(rng, 60),
+            'price': round(rng.uniform(10, 300), 2),
+            'category': rng.choice(CATEGORIES),
+            'condition': rng.choice(CONDITIONS),
+            'location': "Springfield",
+            'images': [f"/photos/batch/IMG_{i * images_per + n:06d}.jpg" for n in range(images_per)],
+            'delivery_method': "Door pickup",
+            'groups': None,
+            'boost_listing': False,
+        }
+        for i in range(count)
+    ]
+
+
+def populate(db, count, seed=0, workflows=10):
+    """Fill a Database with workflows and `count` queue rows in mixed states"""
+    rng = random.Random(seed)
+    workflow_ids = [db.create_workflow(**make_workflow(rng, i)) for i in range(workflows)]
+
+    per_workflow = count // len(workflow_ids)
+    for n, workflow_id in enumerate(workflow_ids):
+        chunk = per_workflow + (count % len(workflow_ids) if n == 0 else 0)
+        db.add_many_to_queue(make_queue_items(rng, workflow_id, chunk))
+
+    # Mark a share of rows posted/failed so status queries have realistic selectivity
+    conn = db.get_connection()
+    conn.execute("UPDATE queue SET status = 'posted', posted_at = created_at WHERE id % 3 = 0")
+    conn.execute("UPDATE queue SET status = 'failed', error_message = 'Could not find Next button' WHERE id % 7 = 0")
+    conn.commit()
+    conn.close()
+    return workflow_ids
+
+
+def make_image_folder(folder, count):
+    """Create `count` tiny JPEG files (plus some non-image noise) in folder"""
+    folder = Path(folder)
+    folder.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (folder / f"IMG_{i:06d}.jpg").write_bytes(TINY_JPEG)
+    for i in range(max(1, count // 20)):
+        (folder / f"notes_{i}.txt").write_text("not an image")
+    return folder
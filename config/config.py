@@ -21,12 +21,36 @@ class Config:
                 'chrome_profile_path': '',
                 'min_delay_between_posts': 60,  # seconds
                 'max_delay_between_posts': 180,
+                'preflight_workers': 8,  # threads checking images before a run
+                'worker_stop_timeout': 120,  # seconds Stop waits for the current listing before killing the worker
+                'status_write_timeout': 30,  # seconds the posting worker waits for a locked status write before stopping
                 'typing_speed': 'medium',  # slow, medium, fast
                 'default_location': '',
                 'default_category': 'Home & Garden',
                 'default_condition': 'New',
                 'images_per_listing': 4,
-                'auto_save_workflows': True
+                'batch_group_by_time': False,
+                'burst_gap_seconds': 30,  # photos further apart start a new listing
+                'auto_save_workflows': True,
+                'autosave_delay_ms': 1000,  # idle time after the last edit before autosaving
+                'queue_retention_days': 30,  # days before posted/failed items are archived
+                'archive_batch_size': 500,
+                'archive_compress_threshold': 1024,  # bytes
+                'maintenance_interval_hours': 6,
+                'backup_dir': 'data/backups',
+                'backups_to_keep': 5,
+                'backup_interval_hours': 24,
+                'ui_profiling': False,
+                'ui_slow_handler_ms': 100,
+                'memory_profiling': False,
+                'memory_snapshot_minutes': 10,
+                'log_dir': 'data/logs',
+                'log_level': 'INFO',
+                'log_levels': {'automation': 'INFO', 'database': 'INFO', 'gui': 'INFO'},
+                'log_max_bytes': 5 * 1024 * 1024,
+                'log_backup_count': 5,
+                'artifacts_dir': 'data/artifacts',
+                'artifacts_max_mb': 200
             }
             self.save_settings(defaults)
             return defaults
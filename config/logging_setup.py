@@ -0,0 +1,180 @@
+"""
+Logging setup for the application
+
+Loggers only ever put records on an in-memory queue (QueueHandler), so
+automation and GUI code never wait on disk or console I/O. A QueueListener
+thread fans records out to a size-rotated JSON-lines file, the console (when
+one is attached) and an in-memory ring buffer that feeds the GUI log panel.
+"""
+import collections
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_LOG_LEVELS = {
+    'automation': 'INFO',
+    'database': 'INFO',
+    'gui': 'INFO'
+}
+
+_listener = None
+_ring_buffer = None
+_traceback_formatter = logging.Formatter()
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format each record as one JSON object per line"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage()
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class TracebackQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that keeps the traceback out of the message.
+
+    The stock prepare() folds the formatted traceback into the message and
+    clears exc_text, so the JSON file could never put it in its own field.
+    Here the message is merged with its args and the traceback is kept in
+    exc_text (which pickles, unlike exc_info) for the handlers to render.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        if record.exc_info:
+            record.exc_text = _traceback_formatter.formatException(record.exc_info)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+class RingBufferHandler(logging.Handler):
+    """Keep the most recent records in memory for the GUI log panel"""
+
+    def __init__(self, capacity=2000):
+        super().__init__()
+        self.records = collections.deque(maxlen=capacity)
+        self.sequence = 0
+        self._buffer_lock = threading.Lock()
+
+    def emit(self, record):
+        line = self.format(record)
+        with self._buffer_lock:
+            self.sequence += 1
+            self.records.append((self.sequence, record.levelno, line))
+
+    def get_since(self, sequence=0):
+        """Return (sequence, levelno, line) entries newer than `sequence`"""
+        with self._buffer_lock:
+            return [entry for entry in self.records if entry[0] > sequence]
+
+
+def setup_logging(config=None, log_dir="data/logs"):
+    """Configure application logging; safe to call more than once"""
+    global _listener, _ring_buffer
+
+    if _listener:
+        return _ring_buffer
+
+    get = config.get if config else (lambda key, default=None: default)
+    log_dir = Path(get('log_dir', log_dir))
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    text_format = logging.Formatter("%(asctime)s %(levelname)-7s %(name)s: %(message)s", "%H:%M:%S")
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_dir / "app.jsonl",
+        maxBytes=get('log_max_bytes', 5 * 1024 * 1024),
+        backupCount=get('log_backup_count', 5),
+        encoding="utf-8"
+    )
+    file_handler.setFormatter(JsonLinesFormatter())
+
+    _ring_buffer = RingBufferHandler(get('log_buffer_size', 2000))
+    _ring_buffer.setFormatter(text_format)
+
+    handlers = [file_handler, _ring_buffer]
+
+    # pythonw and frozen builds have no console
+    if sys.stderr is not None:
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(text_format)
+        handlers.append(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(get('log_level', 'INFO'))
+    root.addHandler(TracebackQueueHandler(log_queue))
+    logging.captureWarnings(True)
+    _apply_levels(get)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _ring_buffer
+
+
+def setup_worker_logging(log_queue, config=None):
+    """Configure logging in a worker process.
+
+    Records are put on log_queue (a multiprocessing queue) instead of being
+    written here; the GUI process passes them to its own handlers with
+    forward_worker_logs, so they land in the same file and log panel.
+    """
+    get = config.get if config else (lambda key, default=None: default)
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.setLevel(get('log_level', 'INFO'))
+    root.addHandler(TracebackQueueHandler(log_queue))
+    _apply_levels(get)
+
+
+def forward_worker_logs(log_queue):
+    """Re-emit a worker process's log records in this process until None is received"""
+    while True:
+        record = log_queue.get()
+        if record is None:
+            break
+        logging.getLogger(record.name).handle(record)
+
+
+def _apply_levels(get):
+    """Set per-package levels from the 'log_levels' setting"""
+    levels = dict(DEFAULT_LOG_LEVELS)
+    levels.update(get('log_levels', {}) or {})
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+
+def get_log_buffer():
+    """Get the ring buffer feeding the GUI log panel (None before setup)"""
+    return _ring_buffer
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+
+    if _listener:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -2,24 +2,150 @@
 Database management for workflows and posting queue
 """
 import sqlite3
+import functools
 import json
-from datetime import datetime
+import logging
+import random
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timedelta
 from pathlib import Path
+from database.models import Workflow, QueueItem
+
+logger = logging.getLogger(__name__)
+
+# Columns copied from the hot queue table into queue_archive
+ARCHIVE_COLUMNS = list(QueueItem.COLUMNS)
+
+# Workflow columns the editor may write individually
+WORKFLOW_EDITABLE_COLUMNS = (
+    'name', 'title', 'descriptions', 'price', 'category', 'condition', 'location',
+    'delivery_method', 'groups', 'boost_listing'
+)
+
+# Archived text fields that may be stored zlib-compressed
+COMPRESSIBLE_COLUMNS = ('description', 'images', 'error_message')
+
+
+def _failure_reason_sql(column):
+    """SQL expression reducing an error message to a groupable failure reason (first line, max 100 chars)"""
+    message = f"COALESCE(NULLIF(TRIM({column}), ''), 'Unknown error')"
+    return (f"SUBSTR({message}, 1, CASE WHEN INSTR({message}, CHAR(10)) > 0 "
+            f"THEN MIN(INSTR({message}, CHAR(10)) - 1, 100) ELSE 100 END)")
+
+
+def _is_lock_error(error):
+    message = str(error).lower()
+    return 'locked' in message or 'busy' in message
+
+
+def retry_on_locked(method):
+    """Retry a Database operation with exponential backoff when the database is locked.
+
+    All attempts share one deadline of busy_timeout seconds: get_connection
+    gives each attempt only the time that is left, so lock waits and retries
+    together never block the caller for longer than busy_timeout.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if getattr(self._local, 'deadline', None) is not None:
+            # Called from another retried operation; its deadline applies
+            return method(self, *args, **kwargs)
+
+        deadline = time.monotonic() + self.busy_timeout
+        self._local.deadline = deadline
+        try:
+            delay = self.retry_delay
+            for attempt in range(self.max_retries + 1):
+                try:
+                    return method(self, *args, **kwargs)
+                except sqlite3.OperationalError as e:
+                    out_of_time = time.monotonic() >= deadline
+                    if not _is_lock_error(e) or attempt == self.max_retries or out_of_time:
+                        if _is_lock_error(e):
+                            self._record_lock('failures')
+                            logger.error(f"{method.__name__} failed after {attempt} retries: {e}")
+                        raise
+
+                # Sleep outside the except block so the failed call's frame (and its
+                # connection) is released before waiting. Jitter keeps competing
+                # threads from retrying in lockstep.
+                wait = min(delay * random.uniform(0.5, 1.5), max(deadline - time.monotonic(), 0))
+                self._record_lock('retries', wait)
+                time.sleep(wait)
+                delay = min(delay * 2, 2.0)
+        finally:
+            self._local.deadline = None
+    return wrapper
+
 
 class Database:
-    def __init__(self, db_path="data/app.db"):
+    def __init__(self, db_path="data/app.db", busy_timeout=10.0, max_retries=5, retry_delay=0.05, journal_mode="WAL"):
+        """Open the database at db_path.
+
+        db_path may be ":memory:" (or a "file:...?mode=memory&cache=shared" URI)
+        to keep everything in RAM. Each in-memory Database gets its own named
+        shared-cache database, so every connection it opens sees the same data.
+
+        busy_timeout is the longest an operation waits for a lock in total;
+        within that budget, operations that hit "database is locked" are
+        retried up to max_retries times with exponential backoff starting at
+        retry_delay.
+        """
+        self._keepalive = None
+        self.busy_timeout = busy_timeout
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.journal_mode = journal_mode
+        self.lock_stats = {'retries': 0, 'failures': 0, 'backoff_seconds': 0.0}
+        self._stats_lock = threading.Lock()
+        self._local = threading.local()
+
+        if db_path == ":memory:":
+            db_path = f"file:fbm-{uuid.uuid4().hex}?mode=memory&cache=shared"
         self.db_path = db_path
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.uri = db_path.startswith("file:")
+        self.in_memory = self.uri and "mode=memory" in db_path
+
+        if self.in_memory:
+            # An in-memory database lives only as long as a connection to it is open
+            self._keepalive = sqlite3.connect(self.db_path, uri=True, check_same_thread=False)
+        else:
+            path = db_path[len("file:"):].split("?")[0] if self.uri else db_path
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
         self.init_database()
     
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        # Inside a retried operation, only wait for what is left of its deadline
+        deadline = getattr(self._local, 'deadline', None)
+        timeout = self.busy_timeout if deadline is None else max(deadline - time.monotonic(), 0)
+        # IMMEDIATE takes the write lock when a write transaction starts, so a
+        # writer waits in the busy handler instead of failing on lock upgrade
+        return sqlite3.connect(self.db_path, uri=self.uri, timeout=timeout, isolation_level="IMMEDIATE")
+
+    def _record_lock(self, key, backoff=0.0):
+        with self._stats_lock:
+            self.lock_stats[key] += 1
+            self.lock_stats['backoff_seconds'] += backoff
+
+    def close(self):
+        """Release an in-memory database (no-op for files)"""
+        if self._keepalive:
+            self._keepalive.close()
+            self._keepalive = None
     
     def init_database(self):
         """Initialize database tables"""
         conn = self.get_connection()
         cursor = conn.cursor()
 
+        # WAL lets the GUI read while the posting worker writes
+        if self.journal_mode and not self.in_memory:
+            cursor.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+
         # Workflows table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS workflows (
@@ -69,7 +195,7 @@ class Database:
             cursor.execute("ALTER TABLE workflows ADD COLUMN groups TEXT DEFAULT NULL")
             # Update existing rows to have default value
             cursor.execute("UPDATE workflows SET delivery_method = 'Door pickup' WHERE delivery_method IS NULL")
-            print("Added delivery_method and groups columns to workflows table")
+            logger.info("Added delivery_method and groups columns to workflows table")
 
         try:
             cursor.execute("SELECT delivery_method FROM queue LIMIT 1")
@@ -79,28 +205,174 @@ class Database:
             cursor.execute("ALTER TABLE queue ADD COLUMN groups TEXT DEFAULT NULL")
             # Update existing rows to have default value
             cursor.execute("UPDATE queue SET delivery_method = 'Door pickup' WHERE delivery_method IS NULL")
-            print("Added delivery_method and groups columns to queue table")
+            logger.info("Added delivery_method and groups columns to queue table")
 
         # Add boost_listing column if it doesn't exist
         try:
             cursor.execute("SELECT boost_listing FROM workflows LIMIT 1")
         except sqlite3.OperationalError:
             cursor.execute("ALTER TABLE workflows ADD COLUMN boost_listing INTEGER DEFAULT 0")
-            print("Added boost_listing column to workflows table")
+            logger.info("Added boost_listing column to workflows table")
 
         try:
             cursor.execute("SELECT boost_listing FROM queue LIMIT 1")
         except sqlite3.OperationalError:
             cursor.execute("ALTER TABLE queue ADD COLUMN boost_listing INTEGER DEFAULT 0")
-            print("Added boost_listing column to queue table")
+            logger.info("Added boost_listing column to queue table")
 
         # Fix any NULL status values
         cursor.execute("UPDATE queue SET status = 'pending' WHERE status IS NULL")
 
+        # Archive table for posted/failed history moved out of the hot queue
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS queue_archive (
+                id INTEGER PRIMARY KEY,
+                workflow_id INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                description BLOB NOT NULL,
+                price REAL NOT NULL,
+                category TEXT NOT NULL,
+                condition TEXT NOT NULL,
+                location TEXT,
+                images BLOB NOT NULL,
+                delivery_method TEXT DEFAULT 'Door pickup',
+                groups TEXT,
+                boost_listing INTEGER DEFAULT 0,
+                status TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                posted_at TEXT,
+                error_message BLOB,
+                artifacts TEXT,
+                compressed INTEGER DEFAULT 0,
+                archived_at TEXT NOT NULL
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_queue_archive_created ON queue_archive (created_at)")
+
+        # Add artifacts column (failure screenshot/DOM snapshot names) if it doesn't exist
+        for table in ('queue', 'queue_archive'):
+            try:
+                cursor.execute(f"SELECT artifacts FROM {table} LIMIT 1")
+            except sqlite3.OperationalError:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN artifacts TEXT DEFAULT NULL")
+                logger.info(f"Added artifacts column to {table} table")
+
+        # When the current posting attempt started, for attempt durations
+        try:
+            cursor.execute("SELECT started_at FROM queue LIMIT 1")
+        except sqlite3.OperationalError:
+            cursor.execute("ALTER TABLE queue ADD COLUMN started_at TEXT DEFAULT NULL")
+            logger.info("Added started_at column to queue table")
+
+        self.init_stats_tables(cursor)
+
+        # Cached image metadata for batch grouping, valid while mtime and size match
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS image_index (
+                path TEXT PRIMARY KEY,
+                folder TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                captured_at REAL NOT NULL,
+                source TEXT NOT NULL
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_image_index_folder ON image_index (folder)")
+
         conn.commit()
         conn.close()
     
+    def init_stats_tables(self, cursor):
+        """Create the materialized queue statistics and the trigger that maintains them.
+
+        Every time a queue item becomes posted or failed the trigger bumps that
+        day's counters for its workflow, so stats never have to scan the queue
+        or archive. Tables created for the first time are backfilled from the
+        existing history (without durations, which weren't recorded).
+        """
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='queue_stats'")
+        backfill = cursor.fetchone() is None
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS queue_stats (
+                day TEXT NOT NULL,
+                workflow_id INTEGER NOT NULL,
+                posted INTEGER NOT NULL DEFAULT 0,
+                failed INTEGER NOT NULL DEFAULT 0,
+                timed_attempts INTEGER NOT NULL DEFAULT 0,
+                attempt_seconds REAL NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, workflow_id)
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS queue_failure_reasons (
+                day TEXT NOT NULL,
+                workflow_id INTEGER NOT NULL,
+                reason TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (day, workflow_id, reason)
+            )
+        """)
+
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS queue_stats_on_finish
+            AFTER UPDATE OF status ON queue
+            WHEN NEW.status IN ('posted', 'failed') AND OLD.status IS NOT NEW.status
+            BEGIN
+                INSERT INTO queue_stats (day, workflow_id, posted, failed, timed_attempts, attempt_seconds)
+                VALUES (
+                    date('now', 'localtime'),
+                    NEW.workflow_id,
+                    NEW.status = 'posted',
+                    NEW.status = 'failed',
+                    NEW.started_at IS NOT NULL,
+                    COALESCE((julianday('now', 'localtime') - julianday(NEW.started_at)) * 86400, 0)
+                )
+                ON CONFLICT (day, workflow_id) DO UPDATE SET
+                    posted = posted + excluded.posted,
+                    failed = failed + excluded.failed,
+                    timed_attempts = timed_attempts + excluded.timed_attempts,
+                    attempt_seconds = attempt_seconds + excluded.attempt_seconds;
+
+                INSERT INTO queue_failure_reasons (day, workflow_id, reason, count)
+                SELECT date('now', 'localtime'), NEW.workflow_id, {_failure_reason_sql('NEW.error_message')}, 1
+                WHERE NEW.status = 'failed'
+                ON CONFLICT (day, workflow_id, reason) DO UPDATE SET count = count + 1;
+            END
+        """)
+
+        if not backfill:
+            return
+
+        # Archived error messages may be compressed; those count as unknown reasons
+        history = """
+            SELECT workflow_id, status, created_at, posted_at, error_message FROM queue
+            WHERE status IN ('posted', 'failed')
+            UNION ALL
+            SELECT workflow_id, status, created_at, posted_at,
+                   CASE WHEN typeof(error_message) = 'text' THEN error_message END
+            FROM queue_archive
+        """
+        cursor.execute(f"""
+            INSERT INTO queue_stats (day, workflow_id, posted, failed)
+            SELECT date(COALESCE(posted_at, created_at)), workflow_id,
+                   SUM(status = 'posted'), SUM(status = 'failed')
+            FROM ({history})
+            GROUP BY 1, 2
+        """)
+        backfilled = cursor.rowcount
+        cursor.execute(f"""
+            INSERT INTO queue_failure_reasons (day, workflow_id, reason, count)
+            SELECT date(created_at), workflow_id, {_failure_reason_sql('error_message')}, COUNT(*)
+            FROM ({history})
+            WHERE status = 'failed'
+            GROUP BY 1, 2, 3
+        """)
+        if backfilled:
+            logger.info(f"Backfilled queue statistics for {backfilled} day/workflow pairs")
+
     # Workflow operations
+    @retry_on_locked
     def create_workflow(self, name, title, descriptions, price, category, condition, location="", delivery_method="Door pickup", groups=None, boost_listing=False):
         """Create a new workflow template"""
         conn = self.get_connection()
@@ -122,107 +394,29 @@ class Database:
         finally:
             conn.close()
     
+    @retry_on_locked
     def get_workflow(self, workflow_id):
         """Get workflow by ID"""
         conn = self.get_connection()
         cursor = conn.cursor()
-
-        # Get column info
-        cursor.execute("PRAGMA table_info(workflows)")
-        columns = {col[1]: col[0] for col in cursor.fetchall()}
-
-        cursor.execute("SELECT * FROM workflows WHERE id = ?", (workflow_id,))
+        cursor.execute(f"SELECT {', '.join(Workflow.COLUMNS)} FROM workflows WHERE id = ?", (workflow_id,))
         row = cursor.fetchone()
         conn.close()
 
-        if row:
-            # Get indices safely
-            delivery_idx = columns.get('delivery_method')
-            groups_idx = columns.get('groups')
-            created_idx = columns.get('created_at')
-            updated_idx = columns.get('updated_at')
-
-            # Safely parse groups
-            groups = None
-            try:
-                if groups_idx is not None and len(row) > groups_idx and row[groups_idx]:
-                    groups = json.loads(row[groups_idx])
-            except (json.JSONDecodeError, TypeError):
-                groups = None
-
-            # Get boost_listing
-            boost_idx = columns.get('boost_listing')
-            boost_listing = bool(row[boost_idx]) if boost_idx is not None and len(row) > boost_idx and row[boost_idx] is not None else False
-
-            return {
-                'id': row[0],
-                'name': row[1],
-                'title': row[2],
-                'descriptions': json.loads(row[3]),
-                'price': row[4],
-                'category': row[5],
-                'condition': row[6],
-                'location': row[7],
-                'delivery_method': (row[delivery_idx] if delivery_idx is not None and len(row) > delivery_idx and row[delivery_idx] else 'Door pickup'),
-                'groups': groups,
-                'boost_listing': boost_listing,
-                'created_at': (row[created_idx] if created_idx is not None and len(row) > created_idx else None),
-                'updated_at': (row[updated_idx] if updated_idx is not None and len(row) > updated_idx else None)
-            }
-        return None
+        return Workflow.from_row(row) if row else None
     
+    @retry_on_locked
     def get_all_workflows(self):
         """Get all workflows"""
         conn = self.get_connection()
         cursor = conn.cursor()
-
-        # Get column info
-        cursor.execute("PRAGMA table_info(workflows)")
-        columns = {col[1]: col[0] for col in cursor.fetchall()}
-
-        cursor.execute("SELECT * FROM workflows ORDER BY updated_at DESC")
+        cursor.execute(f"SELECT {', '.join(Workflow.COLUMNS)} FROM workflows ORDER BY updated_at DESC")
         rows = cursor.fetchall()
         conn.close()
 
-        # Get indices safely
-        delivery_idx = columns.get('delivery_method')
-        groups_idx = columns.get('groups')
-        created_idx = columns.get('created_at')
-        updated_idx = columns.get('updated_at')
-
-        # Get boost_listing index
-        boost_idx = columns.get('boost_listing')
-
-        workflows = []
-        for row in rows:
-            # Safely parse groups
-            groups = None
-            try:
-                if groups_idx is not None and len(row) > groups_idx and row[groups_idx]:
-                    groups = json.loads(row[groups_idx])
-            except (json.JSONDecodeError, TypeError):
-                groups = None
-
-            # Get boost_listing
-            boost_listing = bool(row[boost_idx]) if boost_idx is not None and len(row) > boost_idx and row[boost_idx] is not None else False
-
-            workflows.append({
-                'id': row[0],
-                'name': row[1],
-                'title': row[2],
-                'descriptions': json.loads(row[3]),
-                'price': row[4],
-                'category': row[5],
-                'condition': row[6],
-                'location': row[7],
-                'delivery_method': (row[delivery_idx] if delivery_idx is not None and len(row) > delivery_idx and row[delivery_idx] else 'Door pickup'),
-                'groups': groups,
-                'boost_listing': boost_listing,
-                'created_at': (row[created_idx] if created_idx is not None and len(row) > created_idx else None),
-                'updated_at': (row[updated_idx] if updated_idx is not None and len(row) > updated_idx else None)
-            })
-        return workflows
+        return [Workflow.from_row(row) for row in rows]
     
+    @retry_on_locked
     def update_workflow(self, workflow_id, name, title, descriptions, price, category, condition, location="", delivery_method="Door pickup", groups=None, boost_listing=False):
         """Update an existing workflow"""
         conn = self.get_connection()
@@ -239,6 +433,45 @@ class Database:
         conn.commit()
         conn.close()
     
+    @retry_on_locked
+    def update_workflow_fields(self, workflow_id, fields, expected_updated_at=None):
+        """Update only the given workflow columns.
+
+        fields maps column names to values (descriptions and groups as lists).
+        With expected_updated_at the row is only written if it hasn't been saved
+        since, so a stale editor can't overwrite newer changes. Returns the new
+        updated_at, or None if the workflow changed or was deleted in the meantime.
+        Raises sqlite3.IntegrityError if the new name is already taken.
+        """
+        values = []
+        for column, value in fields.items():
+            if column not in WORKFLOW_EDITABLE_COLUMNS:
+                raise ValueError(f"Not an editable workflow column: {column}")
+            if column == 'descriptions':
+                value = json.dumps(value)
+            elif column == 'groups':
+                value = json.dumps(value) if value else None
+            elif column == 'boost_listing':
+                value = 1 if value else 0
+            values.append(value)
+
+        now = datetime.now().isoformat()
+        assignments = "".join(f"{column}=?, " for column in fields)
+        sql = f"UPDATE workflows SET {assignments}updated_at=? WHERE id=?"
+        params = values + [now, workflow_id]
+        if expected_updated_at is not None:
+            sql += " AND updated_at=?"
+            params.append(expected_updated_at)
+
+        conn = self.get_connection()
+        try:
+            cursor = conn.execute(sql, params)
+            conn.commit()
+            return now if cursor.rowcount else None
+        finally:
+            conn.close()
+
+    @retry_on_locked
     def delete_workflow(self, workflow_id):
         """Delete a workflow"""
         conn = self.get_connection()
@@ -248,6 +481,7 @@ class Database:
         conn.close()
     
     # Queue operations
+    @retry_on_locked
     def add_to_queue(self, workflow_id, title, description, price, category, condition, location, images, delivery_method="Door pickup", groups=None, boost_listing=False):
         """Add a listing to the posting queue"""
         conn = self.get_connection()
@@ -264,86 +498,88 @@ class Database:
         queue_id = cursor.lastrowid
         conn.close()
         return queue_id
+
+    @retry_on_locked
+    def add_many_to_queue(self, items):
+        """Add several listings to the queue in one transaction.
+
+        items are dicts with the same keys as add_to_queue's arguments.
+        Returns the number of rows added.
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (
+                item['workflow_id'], item['title'], item['description'], item['price'],
+                item['category'], item['condition'], item.get('location'), json.dumps(item['images']),
+                item.get('delivery_method', 'Door pickup'),
+                json.dumps(item['groups']) if item.get('groups') else None,
+                1 if item.get('boost_listing') else 0, now
+            )
+            for item in items
+        ]
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT INTO queue (workflow_id, title, description, price, category, condition, location, images, delivery_method, groups, boost_listing, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+        conn.commit()
+        conn.close()
+        return len(rows)
     
+    @retry_on_locked
     def get_queue_items(self, status=None):
         """Get queue items, optionally filtered by status"""
         conn = self.get_connection()
         cursor = conn.cursor()
+        columns = ', '.join(QueueItem.COLUMNS)
 
-        # Get column names to properly map indices
         if status:
-            cursor.execute("SELECT * FROM queue WHERE status = ? ORDER BY created_at ASC", (status,))
+            cursor.execute(f"SELECT {columns} FROM queue WHERE status = ? ORDER BY created_at ASC", (status,))
         else:
-            cursor.execute("SELECT * FROM queue ORDER BY created_at ASC")
+            cursor.execute(f"SELECT {columns} FROM queue ORDER BY created_at ASC")
 
         rows = cursor.fetchall()
-
-        # Get column info
-        cursor.execute("PRAGMA table_info(queue)")
-        columns = {col[1]: col[0] for col in cursor.fetchall()}
-
         conn.close()
 
-        items = []
-        for row in rows:
-            # Get indices safely
-            delivery_idx = columns.get('delivery_method')
-            groups_idx = columns.get('groups')
-            boost_idx = columns.get('boost_listing')
-            status_idx = columns.get('status')
-            created_idx = columns.get('created_at')
-            posted_idx = columns.get('posted_at')
-            error_idx = columns.get('error_message')
-
-            # Safely parse groups
-            groups = None
-            try:
-                if groups_idx is not None and len(row) > groups_idx and row[groups_idx]:
-                    groups = json.loads(row[groups_idx])
-            except (json.JSONDecodeError, TypeError):
-                groups = None
-
-            # Get boost_listing
-            boost_listing = bool(row[boost_idx]) if boost_idx is not None and len(row) > boost_idx and row[boost_idx] is not None else False
-
-            items.append({
-                'id': row[0],
-                'workflow_id': row[1],
-                'title': row[2],
-                'description': row[3],
-                'price': row[4],
-                'category': row[5],
-                'condition': row[6],
-                'location': row[7],
-                'images': json.loads(row[8]),
-                'delivery_method': (row[delivery_idx] if delivery_idx is not None and len(row) > delivery_idx and row[delivery_idx] else 'Door pickup'),
-                'groups': groups,
-                'boost_listing': boost_listing,
-                'status': (row[status_idx] if status_idx is not None and len(row) > status_idx and row[status_idx] else 'pending'),
-                'created_at': (row[created_idx] if created_idx is not None and len(row) > created_idx else None),
-                'posted_at': (row[posted_idx] if posted_idx is not None and len(row) > posted_idx else None),
-                'error_message': (row[error_idx] if error_idx is not None and len(row) > error_idx else None)
-            })
-        return items
+        return [QueueItem.from_row(row) for row in rows]
     
-    def update_queue_status(self, queue_id, status, error_message=None):
-        """Update queue item status"""
+    @retry_on_locked
+    def update_queue_status(self, queue_id, status, error_message=None, artifacts=None, expected_status=None):
+        """Update queue item status, artifacts links failure screenshots/DOM snapshots.
+
+        With expected_status the row is only changed if it still has that
+        status. Returns True if the row was updated.
+        """
         conn = self.get_connection()
         cursor = conn.cursor()
+        artifacts_json = json.dumps(artifacts) if artifacts else None
+        where = "WHERE id=?" + (" AND status=?" if expected_status else "")
+        where_args = (queue_id, expected_status) if expected_status else (queue_id,)
         
         if status == 'posted':
             posted_at = datetime.now().isoformat()
-            cursor.execute("""
-                UPDATE queue SET status=?, posted_at=?, error_message=? WHERE id=?
-            """, (status, posted_at, error_message, queue_id))
+            cursor.execute(f"""
+                UPDATE queue SET status=?, posted_at=?, error_message=?, artifacts=? {where}
+            """, (status, posted_at, error_message, artifacts_json) + where_args)
+        elif status == 'posting':
+            # Start of an attempt; the stats trigger measures duration from here
+            started_at = datetime.now().isoformat()
+            cursor.execute(f"""
+                UPDATE queue SET status=?, started_at=?, error_message=?, artifacts=? {where}
+            """, (status, started_at, error_message, artifacts_json) + where_args)
         else:
-            cursor.execute("""
-                UPDATE queue SET status=?, error_message=? WHERE id=?
-            """, (status, error_message, queue_id))
+            cursor.execute(f"""
+                UPDATE queue SET status=?, error_message=?, artifacts=? {where}
+            """, (status, error_message, artifacts_json) + where_args)
         
+        updated = cursor.rowcount > 0
         conn.commit()
         conn.close()
+        return updated
     
+    @retry_on_locked
     def delete_queue_item(self, queue_id):
         """Delete a queue item"""
         conn = self.get_connection()
@@ -353,9 +589,330 @@ class Database:
         conn.close()
     
     def clear_completed_queue(self):
-        """Clear all completed/failed items from queue"""
+        """Move all completed/failed items from the queue into the archive"""
+        return self.archive_queue_items(retention_days=0)
+
+    # Archive operations
+    @retry_on_locked
+    def archive_queue_items(self, retention_days=30, batch_size=500, compress_threshold=1024):
+        """Move posted/failed items older than retention_days into queue_archive.
+
+        Rows are moved in batches of batch_size, one transaction per batch, so the
+        queue table is never locked for long. Text fields longer than
+        compress_threshold bytes are stored zlib-compressed.
+        Returns the number of archived rows.
+        """
+        cutoff = (datetime.now() - timedelta(days=retention_days)).isoformat()
+        select_sql = f"""
+            SELECT {', '.join(ARCHIVE_COLUMNS)} FROM queue
+            WHERE status IN ('posted', 'failed') AND COALESCE(posted_at, created_at) <= ?
+            ORDER BY id LIMIT ?
+        """
+        insert_sql = f"""
+            INSERT OR REPLACE INTO queue_archive ({', '.join(ARCHIVE_COLUMNS)}, compressed, archived_at)
+            VALUES ({', '.join('?' * len(ARCHIVE_COLUMNS))}, ?, ?)
+        """
+        compress_idx = [ARCHIVE_COLUMNS.index(col) for col in COMPRESSIBLE_COLUMNS]
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        archived = 0
+
+        try:
+            while True:
+                cursor.execute(select_sql, (cutoff, batch_size))
+                rows = cursor.fetchall()
+                if not rows:
+                    break
+
+                now = datetime.now().isoformat()
+                archive_rows = []
+                for row in rows:
+                    row = list(row)
+                    compressed = 0
+                    if compress_threshold is not None:
+                        for idx in compress_idx:
+                            value = row[idx]
+                            if value and len(value) > compress_threshold:
+                                row[idx] = zlib.compress(value.encode('utf-8'))
+                                compressed = 1
+                    archive_rows.append(row + [compressed, now])
+
+                cursor.executemany(insert_sql, archive_rows)
+                cursor.executemany("DELETE FROM queue WHERE id = ?", [(row[0],) for row in rows])
+                conn.commit()
+                archived += len(rows)
+        finally:
+            conn.close()
+
+        return archived
+
+    @retry_on_locked
+    def get_archived_items(self, limit=100, offset=0):
+        """Get archived queue items, newest first"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT {', '.join(ARCHIVE_COLUMNS)}, compressed, archived_at FROM queue_archive
+            ORDER BY created_at DESC LIMIT ? OFFSET ?
+        """, (limit, offset))
+        rows = cursor.fetchall()
+        conn.close()
+
+        items = []
+        for row in rows:
+            item = dict(zip(ARCHIVE_COLUMNS + ['compressed', 'archived_at'], row))
+            for col in COMPRESSIBLE_COLUMNS:
+                if isinstance(item[col], bytes):
+                    item[col] = zlib.decompress(item[col]).decode('utf-8')
+
+            try:
+                item['groups'] = json.loads(item['groups']) if item['groups'] else None
+            except (json.JSONDecodeError, TypeError):
+                item['groups'] = None
+
+            item['images'] = json.loads(item['images'])
+            item['artifacts'] = json.loads(item['artifacts']) if item['artifacts'] else None
+            item['boost_listing'] = bool(item['boost_listing'])
+            item['delivery_method'] = item['delivery_method'] or 'Door pickup'
+            item['compressed'] = bool(item['compressed'])
+            items.append(item)
+        return items
+
+    @retry_on_locked
+    def get_archive_count(self):
+        """Get the number of archived queue items"""
         conn = self.get_connection()
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM queue WHERE status IN ('posted', 'failed')")
+        cursor.execute("SELECT COUNT(*) FROM queue_archive")
+        count = cursor.fetchone()[0]
+        conn.close()
+        return count
+
+    # Image index operations
+    @retry_on_locked
+    def get_image_index(self, folder):
+        """Cached image entries for a folder as {path: (mtime_ns, size, captured_at, source)}"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT path, mtime_ns, size, captured_at, source FROM image_index WHERE folder = ?",
+            (folder,)
+        )
+        entries = {path: tuple(rest) for path, *rest in cursor.fetchall()}
+        conn.close()
+        return entries
+
+    @retry_on_locked
+    def save_image_index(self, entries):
+        """Insert or replace image index entries, (path, folder, mtime_ns, size, captured_at, source) tuples"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.executemany("""
+            INSERT OR REPLACE INTO image_index (path, folder, mtime_ns, size, captured_at, source)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, entries)
+        conn.commit()
+        conn.close()
+
+    @retry_on_locked
+    def prune_image_index(self, folder, present_paths):
+        """Delete a folder's index entries whose files are gone, returns the number removed"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        # Temp tables belong to this connection, which is closed below
+        cursor.execute("CREATE TEMP TABLE present_images (path TEXT PRIMARY KEY)")
+        cursor.executemany("INSERT OR IGNORE INTO present_images (path) VALUES (?)", ((path,) for path in present_paths))
+        cursor.execute("""
+            DELETE FROM image_index
+            WHERE folder = ? AND path NOT IN (SELECT path FROM present_images)
+        """, (folder,))
+        removed = cursor.rowcount
         conn.commit()
         conn.close()
+        return removed
+
+    @retry_on_locked
+    def prune_missing_image_folders(self):
+        """Delete index entries for folders that no longer exist, returns the number removed"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("SELECT DISTINCT folder FROM image_index")
+        missing = [(folder,) for (folder,) in cursor.fetchall() if not Path(folder).is_dir()]
+        removed = 0
+        if missing:
+            cursor.executemany("DELETE FROM image_index WHERE folder = ?", missing)
+            removed = cursor.rowcount
+            conn.commit()
+        conn.close()
+        return removed
+
+    # Statistics (read from the tables maintained by the queue_stats_on_finish trigger)
+    def _stats_since(self, days):
+        """First day included in a `days`-long window ending today (None for all time)"""
+        if not days:
+            return ""
+        return (datetime.now() - timedelta(days=days - 1)).date().isoformat()
+
+    @retry_on_locked
+    def get_daily_stats(self, days=30):
+        """Posted/failed counts and average attempt duration per day, newest first"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT day, SUM(posted), SUM(failed), SUM(attempt_seconds), SUM(timed_attempts)
+            FROM queue_stats
+            WHERE day >= ?
+            GROUP BY day
+            ORDER BY day DESC
+        """, (self._stats_since(days),))
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [
+            {
+                'day': day,
+                'posted': posted,
+                'failed': failed,
+                'attempt_seconds': seconds,
+                'timed_attempts': timed,
+                'avg_seconds': seconds / timed if timed else None
+            }
+            for day, posted, failed, seconds, timed in rows
+        ]
+
+    @retry_on_locked
+    def get_workflow_stats(self, days=30):
+        """Posted/failed counts and average attempt duration per workflow, most posted first"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT s.workflow_id, w.name, SUM(s.posted), SUM(s.failed),
+                   SUM(s.attempt_seconds), SUM(s.timed_attempts)
+            FROM queue_stats s
+            LEFT JOIN workflows w ON w.id = s.workflow_id
+            WHERE s.day >= ?
+            GROUP BY s.workflow_id
+            ORDER BY SUM(s.posted) DESC
+        """, (self._stats_since(days),))
+        rows = cursor.fetchall()
+        conn.close()
+
+        return [
+            {
+                'workflow_id': workflow_id,
+                'name': name or f"(deleted #{workflow_id})",
+                'posted': posted,
+                'failed': failed,
+                'avg_seconds': seconds / timed if timed else None
+            }
+            for workflow_id, name, posted, failed, seconds, timed in rows
+        ]
+
+    @retry_on_locked
+    def get_failure_reasons(self, days=30, limit=10):
+        """Most common failure reasons as (reason, count) tuples"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT reason, SUM(count) FROM queue_failure_reasons
+            WHERE day >= ?
+            GROUP BY reason
+            ORDER BY SUM(count) DESC
+            LIMIT ?
+        """, (self._stats_since(days), limit))
+        reasons = cursor.fetchall()
+        conn.close()
+        return reasons
+
+    @retry_on_locked
+    def incremental_vacuum(self, pages=500):
+        """Reclaim up to `pages` free pages without rewriting the whole file"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA freelist_count")
+        free_before = cursor.fetchone()[0]
+        cursor.execute(f"PRAGMA incremental_vacuum({int(pages)})")
+        cursor.fetchall()
+        cursor.execute("PRAGMA freelist_count")
+        free_after = cursor.fetchone()[0]
+        conn.close()
+        return free_before - free_after
+
+    @retry_on_locked
+    def enable_incremental_vacuum(self, allow_rewrite=True):
+        """Switch the file to incremental auto-vacuum, returns True if it was converted.
+
+        Converting rewrites the whole database with VACUUM, so this runs from
+        maintenance on a background thread rather than at startup, and is
+        deferred (allow_rewrite=False) while other writers are busy.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA auto_vacuum")
+        converted = cursor.fetchone()[0] != 2
+        if converted and not allow_rewrite:
+            logger.info("Deferring the one-time VACUUM to incremental auto-vacuum until posting is idle")
+            converted = False
+        elif converted:
+            start = time.perf_counter()
+            cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            cursor.execute("VACUUM")
+            logger.info(f"Enabled incremental auto-vacuum in {time.perf_counter() - start:.1f}s")
+        conn.close()
+        return converted
+
+    def run_maintenance(self, retention_days=30, batch_size=500, compress_threshold=1024, vacuum_pages=500,
+                        allow_full_vacuum=True):
+        """Apply the queue retention policy and reclaim freed space.
+
+        Pass allow_full_vacuum=False while other writers are busy (e.g. a
+        posting run): the one-time conversion rewrites the whole file and holds
+        the write lock for the duration, so it is left for a later run.
+        """
+        self.enable_incremental_vacuum(allow_rewrite=allow_full_vacuum)
+        archived = self.archive_queue_items(retention_days, batch_size, compress_threshold)
+        self.prune_missing_image_folders()
+        reclaimed = self.incremental_vacuum(vacuum_pages)
+        return {'archived': archived, 'reclaimed_pages': reclaimed}
+
+    # Backup and integrity operations
+    def quick_check(self):
+        """Run PRAGMA quick_check, returns (ok, list of problem messages)"""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA quick_check")
+        messages = [row[0] for row in cursor.fetchall()]
+        conn.close()
+        return messages == ['ok'], [m for m in messages if m != 'ok']
+
+    def backup(self, backup_dir="data/backups", keep=5, pages=100, sleep=0.01):
+        """Write an online snapshot of the database and rotate old snapshots.
+
+        The copy is done `pages` pages at a time, sleeping between steps, so
+        other connections can keep reading and writing while it runs.
+        Returns the path of the new snapshot.
+        """
+        backup_dir = Path(backup_dir)
+        backup_dir.mkdir(parents=True, exist_ok=True)
+
+        stem = "memory" if self.in_memory else Path(self.db_path.split("?")[0]).stem
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        snapshot = backup_dir / f"{stem}-{timestamp}.db"
+        partial = snapshot.with_suffix(".db.partial")
+
+        source = self.get_connection()
+        target = sqlite3.connect(str(partial))
+        try:
+            source.backup(target, pages=pages, sleep=sleep)
+        finally:
+            target.close()
+            source.close()
+        partial.replace(snapshot)
+
+        # Keep only the newest `keep` snapshots
+        snapshots = sorted(backup_dir.glob(f"{stem}-*.db"))
+        for old in snapshots[:-keep] if keep > 0 else []:
+            old.unlink()
+
+        return str(snapshot)
@@ -0,0 +1,142 @@
+"""
+Compact typed records for workflows and queue items
+"""
+import json
+
+
+def _loads(raw, default=None):
+    """Decode a JSON column, falling back to default on bad data"""
+    if not raw:
+        return default
+    try:
+        return json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return default
+
+
+class Record:
+    """Base class for slotted row records.
+
+    Records also support read-only dict-style access (record['title'],
+    record.get('groups')) so code written against the old dict rows keeps working.
+    """
+    __slots__ = ()
+
+    # Public field names, in display order
+    FIELDS = ()
+
+    def __getitem__(self, key):
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self.FIELDS
+
+    def get(self, key, default=None):
+        """Get a field value like dict.get"""
+        if key not in self.FIELDS:
+            return default
+        return getattr(self, key)
+
+    def keys(self):
+        return self.FIELDS
+
+    def to_dict(self):
+        """Convert to a plain dict (decodes any lazy fields)"""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id={self.id!r}, title={self.title!r})"
+
+
+class Workflow(Record):
+    """A workflow template row; descriptions and groups are decoded on first access"""
+    __slots__ = (
+        'id', 'name', 'title', 'price', 'category', 'condition', 'location',
+        'delivery_method', 'boost_listing', 'created_at', 'updated_at',
+        '_descriptions', '_groups'
+    )
+
+    # Column order used by Database SELECT statements
+    COLUMNS = (
+        'id', 'name', 'title', 'descriptions', 'price', 'category', 'condition', 'location',
+        'delivery_method', 'groups', 'boost_listing', 'created_at', 'updated_at'
+    )
+    FIELDS = COLUMNS
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a record from a row selected with COLUMNS"""
+        record = cls.__new__(cls)
+        (record.id, record.name, record.title, record._descriptions, record.price,
+         record.category, record.condition, record.location, delivery_method,
+         record._groups, boost_listing, record.created_at, record.updated_at) = row
+        record.delivery_method = delivery_method or 'Door pickup'
+        record.boost_listing = bool(boost_listing)
+        return record
+
+    @property
+    def descriptions(self):
+        if isinstance(self._descriptions, str):
+            self._descriptions = _loads(self._descriptions, [])
+        return self._descriptions
+
+    @property
+    def groups(self):
+        if isinstance(self._groups, str):
+            self._groups = _loads(self._groups)
+        return self._groups
+
+
+class QueueItem(Record):
+    """A posting queue row; images and groups are decoded on first access"""
+    __slots__ = (
+        'id', 'workflow_id', 'title', 'description', 'price', 'category', 'condition',
+        'location', 'delivery_method', 'boost_listing', 'status', 'created_at',
+        'posted_at', 'error_message', '_images', '_groups', '_artifacts'
+    )
+
+    # Column order used by Database SELECT statements
+    COLUMNS = (
+        'id', 'workflow_id', 'title', 'description', 'price', 'category', 'condition',
+        'location', 'images', 'delivery_method', 'groups', 'boost_listing', 'status',
+        'created_at', 'posted_at', 'error_message', 'artifacts'
+    )
+    FIELDS = COLUMNS
+
+    @classmethod
+    def from_row(cls, row):
+        """Build a record from a row selected with COLUMNS"""
+        record = cls.__new__(cls)
+        (record.id, record.workflow_id, record.title, record.description, record.price,
+         record.category, record.condition, record.location, record._images,
+         delivery_method, record._groups, boost_listing, status, record.created_at,
+         record.posted_at, record.error_message, record._artifacts) = row
+        record.delivery_method = delivery_method or 'Door pickup'
+        record.boost_listing = bool(boost_listing)
+        record.status = status or 'pending'
+        return record
+
+    @property
+    def images(self):
+        if isinstance(self._images, str):
+            self._images = _loads(self._images, [])
+        return self._images
+
+    @property
+    def artifacts(self):
+        if isinstance(self._artifacts, str):
+            self._artifacts = _loads(self._artifacts)
+        return self._artifacts
+
+    @property
+    def groups(self):
+        if isinstance(self._groups, str):
+            self._groups = _loads(self._groups)
+        return self._groups
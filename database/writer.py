@@ -0,0 +1,128 @@
+"""
+Write-behind database writer
+
+Runs database writes on a single background thread so callers (such as the
+asyncio posting loop) never block on SQLite. Writes are applied strictly in
+the order they were submitted. A write that hits "database is locked" is
+retried until it succeeds or close() runs out of time; writes that still
+fail are reported through on_error and the `failed` list, never dropped
+silently.
+"""
+import logging
+import queue
+import threading
+import time
+from database.db import _is_lock_error
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class DatabaseWriter:
+    def __init__(self, db, name="db-writer"):
+        self.db = db
+        self._queue = queue.Queue()
+        self._closed = False
+        self._deadline = None
+        self.failed = []
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, func, *args, on_done=None, on_error=None, **kwargs):
+        """Queue func(*args, **kwargs) to run on the writer thread.
+
+        on_done, if given, is called on the writer thread after the write
+        has been committed (use it to schedule GUI refreshes). on_error is
+        called with the exception if the write finally fails.
+        """
+        if self._closed:
+            raise RuntimeError("DatabaseWriter is closed")
+        with self._pending_lock:
+            self._pending += 1
+        self._queue.put((func, args, kwargs, on_done, on_error, True))
+
+    def update_queue_status(self, queue_id, status, error_message=None, artifacts=None, on_done=None, on_error=None):
+        """Queue a Database.update_queue_status call"""
+        self.submit(
+            self.db.update_queue_status, queue_id, status, error_message, artifacts,
+            on_done=on_done, on_error=on_error
+        )
+
+    def flush(self, timeout=None):
+        """Block until every write submitted so far has been applied (or has failed).
+
+        Returns False if that didn't happen within timeout; check `failed`
+        for writes that could not be applied.
+        """
+        done = threading.Event()
+        self._queue.put((done.set, (), {}, None, None, False))
+        return done.wait(timeout)
+
+    def close(self, timeout=30):
+        """Apply pending writes and stop the writer thread, returns the writes that failed.
+
+        Locked writes are retried for at most `timeout` seconds from here.
+        """
+        if self._closed:
+            return list(self.failed)
+        self._closed = True
+        self._deadline = time.monotonic() + timeout
+        self._queue.put(_STOP)
+        self._thread.join(timeout + 1)
+        if self._thread.is_alive():
+            logger.error(f"Database writer did not finish within {timeout}s, {self._queue.qsize()} writes pending")
+        return list(self.failed)
+
+    def pending(self):
+        """Number of writes not yet applied or failed (including one in progress)"""
+        with self._pending_lock:
+            return self._pending
+
+    def _run(self):
+        while True:
+            task = self._queue.get()
+            if task is _STOP:
+                break
+
+            func, args, kwargs, on_done, on_error, counted = task
+            error = self._apply(func, args, kwargs)
+            if counted:
+                with self._pending_lock:
+                    self._pending -= 1
+            if error is None:
+                callback = on_done
+            else:
+                self.failed.append((getattr(func, '__name__', func), args, error))
+                callback = on_error and (lambda: on_error(error))
+
+            if callback:
+                try:
+                    callback()
+                except Exception:
+                    logger.exception("Database write callback failed")
+
+    def _apply(self, func, args, kwargs):
+        """Run one write, retrying while the database is locked; returns the final error or None"""
+        name = f"{getattr(func, '__name__', func)}{args}"
+        delay = 0.1
+        while True:
+            try:
+                func(*args, **kwargs)
+                return None
+            except Exception as e:
+                if not _is_lock_error(e) or self._out_of_time():
+                    logger.exception(f"Database write failed: {name}")
+                    return e
+                logger.warning(f"Database locked, retrying write {name} in {delay:.1f}s")
+
+            # Sleep outside the except block, like Database.retry_on_locked
+            if self._deadline is not None:
+                delay = min(delay, max(self._deadline - time.monotonic(), 0))
+            time.sleep(delay)
+            delay = min(delay * 2, 2.0)
+
+    def _out_of_time(self):
+        return self._deadline is not None and time.monotonic() >= self._deadline
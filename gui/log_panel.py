@@ -0,0 +1,116 @@
+"""
+Log viewer fed by the in-memory log ring buffer
+"""
+import customtkinter as ctk
+import logging
+from gui.styles import get_font, MUTED_TEXT
+from config.logging_setup import get_log_buffer
+
+# "All" shows everything that was captured; DEBUG records only appear if
+# 'log_levels' lowers a package below the default INFO
+LEVELS = {
+    "All": logging.NOTSET,
+    "Info": logging.INFO,
+    "Warning": logging.WARNING,
+    "Error": logging.ERROR
+}
+
+class LogPanel(ctk.CTkFrame):
+    def __init__(self, parent, poll_ms=500):
+        super().__init__(parent)
+
+        self.poll_ms = poll_ms
+        self.last_sequence = 0
+        self.poll_id = None
+
+        self.setup_ui()
+        self.poll()
+
+    def setup_ui(self):
+        """Setup the log panel UI"""
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        header_frame = ctk.CTkFrame(self)
+        header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        header_frame.grid_columnconfigure(1, weight=1)
+
+        title = ctk.CTkLabel(
+            header_frame,
+            text="Logs",
+            font=get_font(size=20, weight="bold")
+        )
+        title.grid(row=0, column=0, padx=10, pady=10, sticky="w")
+
+        self.level_var = ctk.StringVar(value="Info")
+        level_menu = ctk.CTkOptionMenu(
+            header_frame,
+            variable=self.level_var,
+            values=list(LEVELS),
+            command=lambda _: self.reload(),
+            width=110
+        )
+        level_menu.grid(row=0, column=2, padx=10, pady=10)
+
+        self.textbox = ctk.CTkTextbox(self, font=get_font(size=11, family="Courier"), wrap="none")
+        self.textbox.grid(row=1, column=0, sticky="nsew")
+        self.textbox.configure(state="disabled")
+
+        if get_log_buffer() is None:
+            ctk.CTkLabel(
+                self,
+                text="Logging is not configured (start the app with main.py)",
+                font=get_font(size=12),
+                text_color=MUTED_TEXT
+            ).grid(row=2, column=0, pady=5)
+
+    def reload(self):
+        """Re-read the whole buffer, e.g. after the level filter changes"""
+        self.last_sequence = 0
+        self.textbox.configure(state="normal")
+        self.textbox.delete("1.0", "end")
+        self.textbox.configure(state="disabled")
+        self.append_new()
+
+    def append_new(self):
+        """Append buffered lines newer than the last one shown"""
+        buffer = get_log_buffer()
+        if buffer is None:
+            return
+
+        entries = buffer.get_since(self.last_sequence)
+        if not entries:
+            return
+        self.last_sequence = entries[-1][0]
+
+        min_level = LEVELS[self.level_var.get()]
+        lines = [line for _, levelno, line in entries if levelno >= min_level]
+        if not lines:
+            return
+
+        # Only follow the tail if the user hasn't scrolled up
+        at_bottom = self.textbox.yview()[1] >= 0.999
+        self.textbox.configure(state="normal")
+        self.textbox.insert("end", "\n".join(lines) + "\n")
+        self.trim(buffer.records.maxlen)
+        self.textbox.configure(state="disabled")
+        if at_bottom:
+            self.textbox.see("end")
+
+    def trim(self, max_lines):
+        """Drop the oldest lines so the textbox never holds more than the buffer"""
+        # Lines are counted in the underlying Tk text widget; the trailing newline adds one
+        line_count = int(self.textbox.index("end-1c").split(".")[0]) - 1
+        if line_count > max_lines:
+            self.textbox.delete("1.0", f"{line_count - max_lines + 1}.0")
+
+    def poll(self):
+        """Check the buffer for new lines periodically"""
+        self.append_new()
+        self.poll_id = self.after(self.poll_ms, self.poll)
+
+    def destroy(self):
+        if self.poll_id:
+            self.after_cancel(self.poll_id)
+            self.poll_id = None
+        super().destroy()
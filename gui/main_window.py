@@ -2,12 +2,22 @@
 Main GUI window for Facebook Marketplace Automation
 """
 import customtkinter as ctk
+from gui.styles import get_font, NAV_ACTIVE, NAV_INACTIVE, ERROR_TEXT, SECONDARY, MUTED_TEXT
+import logging
+import os
+import threading
 from gui.workflow_editor import WorkflowEditor
 from gui.queue_manager import QueueManager
 from gui.settings_window import SettingsWindow
+from gui.ui_monitor import UIMonitor
+from gui.memory_monitor import MemoryMonitor
+from gui.log_panel import LogPanel
+from gui.stats_panel import StatsPanel
 from database.db import Database
 from config.config import Config
 
+logger = logging.getLogger(__name__)
+
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
@@ -22,13 +32,35 @@ class MainWindow(ctk.CTk):
         # Initialize database and config
         self.db = Database()
         self.config = Config()
+
+        # Optional UI latency profiling (must be installed before widgets register callbacks)
+        self.ui_monitor = None
+        if self.config.get('ui_profiling', False) or os.environ.get('FB_UI_PROFILE') == '1':
+            self.ui_monitor = UIMonitor(self, threshold_ms=self.config.get('ui_slow_handler_ms', 100))
+            self.ui_monitor.install()
         
         # Setup UI
         self.setup_ui()
+
+        # Optional long-session memory profiling
+        self.memory_monitor = None
+        if self.config.get('memory_profiling', False) or os.environ.get('FB_MEMORY_PROFILE') == '1':
+            self.memory_monitor = MemoryMonitor(
+                self,
+                self.content_frame,
+                interval_minutes=self.config.get('memory_snapshot_minutes', 10)
+            )
+            self.memory_monitor.start()
         
         # Check if Chrome profile is configured
         if not self.config.get('chrome_profile_path'):
             self.after(500, self.show_first_time_setup)
+
+        # Archive old queue history in the background
+        self.after(5000, self.schedule_maintenance)
+
+        # Check database integrity and take a snapshot in the background
+        self.after(1000, self.schedule_backup)
     
     def setup_ui(self):
         """Setup the main UI layout"""
@@ -45,7 +77,7 @@ class MainWindow(ctk.CTk):
         self.logo_label = ctk.CTkLabel(
             self.sidebar,
             text="FB Marketplace\nAutomation",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(size=18, weight="bold")
         )
         self.logo_label.grid(row=0, column=0, padx=20, pady=(20, 30))
         
@@ -54,7 +86,7 @@ class MainWindow(ctk.CTk):
             self.sidebar,
             text="Workflows",
             command=self.show_workflows,
-            font=ctk.CTkFont(size=14)
+            font=get_font(size=14)
         )
         self.workflows_btn.grid(row=1, column=0, padx=20, pady=10)
         
@@ -62,7 +94,7 @@ class MainWindow(ctk.CTk):
             self.sidebar,
             text="Posting Queue",
             command=self.show_queue,
-            font=ctk.CTkFont(size=14)
+            font=get_font(size=14)
         )
         self.queue_btn.grid(row=2, column=0, padx=20, pady=10)
         
@@ -70,17 +102,44 @@ class MainWindow(ctk.CTk):
             self.sidebar,
             text="Settings",
             command=self.show_settings,
-            font=ctk.CTkFont(size=14)
+            font=get_font(size=14)
         )
         self.settings_btn.grid(row=3, column=0, padx=20, pady=10)
+
+        self.logs_btn = ctk.CTkButton(
+            self.sidebar,
+            text="Logs",
+            command=self.show_logs,
+            font=get_font(size=14)
+        )
+        self.logs_btn.grid(row=4, column=0, padx=20, pady=10)
+
+        self.stats_btn = ctk.CTkButton(
+            self.sidebar,
+            text="Statistics",
+            command=self.show_stats,
+            font=get_font(size=14)
+        )
+        self.stats_btn.grid(row=5, column=0, padx=20, pady=10)
         
         # Status indicator
         self.status_label = ctk.CTkLabel(
             self.sidebar,
             text="Status: Ready",
-            font=ctk.CTkFont(size=12)
+            font=get_font(size=12)
         )
         self.status_label.grid(row=7, column=0, padx=20, pady=(10, 20))
+
+        # UI lag indicator (profiling mode only)
+        if self.ui_monitor:
+            self.lag_label = ctk.CTkLabel(
+                self.sidebar,
+                text="UI lag: 0 ms",
+                font=get_font(size=11),
+                text_color=MUTED_TEXT
+            )
+            self.lag_label.grid(row=8, column=0, padx=20, pady=(0, 10))
+            self.after(500, self.update_lag_indicator)
         
         # Main content area
         self.content_frame = ctk.CTkFrame(self)
@@ -106,6 +165,20 @@ class MainWindow(ctk.CTk):
         self.current_view.grid(row=0, column=0, sticky="nsew")
         self.highlight_button(self.queue_btn)
     
+    def show_logs(self):
+        """Show log viewer"""
+        self.clear_content()
+        self.current_view = LogPanel(self.content_frame)
+        self.current_view.grid(row=0, column=0, sticky="nsew")
+        self.highlight_button(self.logs_btn)
+
+    def show_stats(self):
+        """Show posting statistics"""
+        self.clear_content()
+        self.current_view = StatsPanel(self.content_frame, self.db)
+        self.current_view.grid(row=0, column=0, sticky="nsew")
+        self.highlight_button(self.stats_btn)
+
     def show_settings(self):
         """Show settings window"""
         SettingsWindow(self, self.config)
@@ -128,7 +201,7 @@ class MainWindow(ctk.CTk):
         label = ctk.CTkLabel(
             dialog,
             text="Welcome to Facebook Marketplace Automation!",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(size=20, weight="bold")
         )
         label.pack(pady=(30, 20))
         
@@ -140,7 +213,7 @@ class MainWindow(ctk.CTk):
                  "Windows: C:\\Users\\YourName\\AppData\\Local\\Google\\Chrome\\User Data\n"
                  "Mac: ~/Library/Application Support/Google/Chrome\n"
                  "Linux: ~/.config/google-chrome",
-            font=ctk.CTkFont(size=12),
+            font=get_font(size=12),
             justify="left"
         )
         info.pack(pady=20, padx=30)
@@ -164,14 +237,14 @@ class MainWindow(ctk.CTk):
                 self.config.set('chrome_profile_path', path)
                 dialog.destroy()
             else:
-                error_label = ctk.CTkLabel(dialog, text="Please enter a valid path", text_color="red")
+                error_label = ctk.CTkLabel(dialog, text="Please enter a valid path", text_color=ERROR_TEXT)
                 error_label.pack()
         
         save_btn = ctk.CTkButton(
             dialog,
             text="Save and Continue",
             command=save_and_close,
-            font=ctk.CTkFont(size=14)
+            font=get_font(size=14)
         )
         save_btn.pack(pady=20)
         
@@ -179,8 +252,8 @@ class MainWindow(ctk.CTk):
             dialog,
             text="Skip for now",
             command=dialog.destroy,
-            fg_color="gray",
-            font=ctk.CTkFont(size=12)
+            fg_color=SECONDARY,
+            font=get_font(size=12)
         )
         skip_btn.pack()
     
@@ -191,10 +264,73 @@ class MainWindow(ctk.CTk):
     
     def highlight_button(self, button):
         """Highlight the active navigation button"""
-        for btn in [self.workflows_btn, self.queue_btn]:
-            btn.configure(fg_color=("gray75", "gray25"))
-        button.configure(fg_color=("gray85", "gray40"))
+        for btn in [self.workflows_btn, self.queue_btn, self.logs_btn, self.stats_btn]:
+            btn.configure(fg_color=NAV_INACTIVE)
+        button.configure(fg_color=NAV_ACTIVE)
     
+    def schedule_maintenance(self):
+        """Run database maintenance now and schedule the next run"""
+        thread = threading.Thread(target=self.maintenance_worker)
+        thread.daemon = True
+        thread.start()
+
+        interval_hours = self.config.get('maintenance_interval_hours', 6)
+        self.after(int(interval_hours * 3600 * 1000), self.schedule_maintenance)
+
+    def maintenance_worker(self):
+        """Worker thread for queue archival and incremental vacuum"""
+        try:
+            # The one-time VACUUM conversion would lock out the posting worker's status writes
+            worker = QueueManager.worker
+            posting = worker is not None and worker.is_running()
+            result = self.db.run_maintenance(
+                retention_days=self.config.get('queue_retention_days', 30),
+                batch_size=self.config.get('archive_batch_size', 500),
+                compress_threshold=self.config.get('archive_compress_threshold', 1024),
+                allow_full_vacuum=not posting
+            )
+            if result['archived']:
+                logger.info(f"Archived {result['archived']} queue items, reclaimed {result['reclaimed_pages']} pages")
+        except Exception as e:
+            logger.error(f"Error during database maintenance: {e}")
+
+    def schedule_backup(self):
+        """Back up the database now and schedule the next backup"""
+        thread = threading.Thread(target=self.backup_worker)
+        thread.daemon = True
+        thread.start()
+
+        interval_hours = self.config.get('backup_interval_hours', 24)
+        self.after(int(interval_hours * 3600 * 1000), self.schedule_backup)
+
+    def backup_worker(self):
+        """Worker thread for integrity check and online backup"""
+        try:
+            # Checked before every backup: never rotate good snapshots out with a corrupt copy
+            self.after(0, lambda: self.update_status("Checking database..."))
+            ok, problems = self.db.quick_check()
+            if not ok:
+                logger.error(f"Database integrity check failed, skipping backup: {problems[:5]}")
+                self.after(0, lambda: self.update_status("Database check FAILED"))
+                return
+
+            snapshot = self.db.backup(
+                backup_dir=self.config.get('backup_dir', 'data/backups'),
+                keep=self.config.get('backups_to_keep', 5)
+            )
+            logger.info(f"Database backed up to {snapshot}")
+            self.after(0, lambda: self.update_status("Backup complete"))
+        except Exception as e:
+            logger.error(f"Error backing up database: {e}")
+            self.after(0, lambda: self.update_status("Backup failed"))
+
+    def update_lag_indicator(self):
+        """Refresh the UI lag label from the monitor"""
+        lag = self.ui_monitor.current_lag_ms
+        color = ERROR_TEXT if lag >= self.ui_monitor.threshold * 1000 else MUTED_TEXT
+        self.lag_label.configure(text=f"UI lag: {lag:.0f} ms (max {self.ui_monitor.max_lag_ms:.0f})", text_color=color)
+        self.after(500, self.update_lag_indicator)
+
     def update_status(self, text):
         """Update status label"""
         self.status_label.configure(text=f"Status: {text}")
@@ -202,3 +338,21 @@ class MainWindow(ctk.CTk):
     def run(self):
         """Run the application"""
         self.mainloop()
+
+        # Don't leave a posting worker (and its Chrome) running after the window closes
+        worker = QueueManager.worker
+        if worker and worker.is_running():
+            worker.terminate("application closed")
+            worker.finished.wait(10)
+
+        if self.memory_monitor:
+            self.memory_monitor.stop()
+
+        if self.ui_monitor:
+            self.ui_monitor.uninstall()
+            lines = [
+                f"  {entry['name']}: {entry['calls']} calls, "
+                f"{entry['total_ms']:.0f} ms total, {entry['max_ms']:.0f} ms max"
+                for entry in self.ui_monitor.report()
+            ]
+            logger.info("Slowest UI handlers:\n" + "\n".join(lines))
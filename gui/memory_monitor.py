@@ -0,0 +1,190 @@
+"""
+Opt-in long-session memory profiler
+
+Enable with the 'memory_profiling' setting or the FB_MEMORY_PROFILE=1
+environment variable. tracemalloc is started when the window opens; the first
+periodic snapshot becomes the baseline and every later snapshot is diffed
+against it, logging the allocation sites that grew the most together with
+live widget counts per view, the number of Tcl commands (every Python
+callback bound to Tk is one) and pending `after` timers.
+"""
+import collections
+import gc
+import linecache
+import logging
+import threading
+import time
+import tkinter
+import tracemalloc
+
+logger = logging.getLogger(__name__)
+
+# Allocations made by the profiler and the import system are noise
+_IGNORED_TRACES = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, linecache.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def count_widgets(widget):
+    """Count a widget and all of its descendants"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def widget_counts(root, container):
+    """Live widget counts keyed by view.
+
+    Each child of container (the main content area) is a view; top-level
+    windows (dialogs) are listed separately so ones that are never destroyed
+    show up. Everything else under root is counted as "(window)".
+    """
+    counts = collections.Counter()
+    for view in container.winfo_children():
+        counts[type(view).__name__] += count_widgets(view)
+
+    for child in root.winfo_children():
+        if isinstance(child, tkinter.Toplevel):
+            counts[f"{type(child).__name__} '{child.title()}'"] += count_widgets(child)
+
+    counts["(window)"] = count_widgets(root) - sum(counts.values())
+    return dict(counts)
+
+
+def tk_object_counts(root):
+    """Tcl-side objects that leak when Python callbacks are never released"""
+    return {
+        'tk_commands': len(root.tk.splitlist(root.tk.call('info', 'commands'))),
+        'after_timers': len(root.tk.splitlist(root.tk.call('after', 'info')))
+    }
+
+
+def take_snapshot():
+    """Collect garbage and take a filtered tracemalloc snapshot"""
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces(_IGNORED_TRACES)
+
+
+def top_growth(snapshot, baseline, top=15, key_type='lineno'):
+    """Allocation sites that grew the most since baseline"""
+    stats = snapshot.compare_to(baseline, key_type)
+    growing = [stat for stat in stats if stat.size_diff > 0]
+    return [
+        {
+            'site': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            'size_diff_kb': stat.size_diff / 1024,
+            'count_diff': stat.count_diff,
+            'size_kb': stat.size / 1024
+        }
+        for stat in growing[:top]
+    ]
+
+
+class MemoryMonitor:
+    def __init__(self, root, container, interval_minutes=10, top=15, frames=10, history=48):
+        self.root = root
+        self.container = container
+        self.interval_ms = int(interval_minutes * 60 * 1000)
+        self.top = top
+        self.frames = frames
+
+        self.reports = collections.deque(maxlen=history)
+        self.baseline = None
+        self.baseline_counts = None
+
+        self._started_tracing = False
+        self._snapshot_id = None
+        self._busy = threading.Lock()
+
+    def start(self):
+        """Start tracing allocations and schedule periodic snapshots"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+            self._started_tracing = True
+        self._snapshot_id = self.root.after(self.interval_ms, self.tick)
+        logger.info(f"Memory profiling enabled, snapshot every {self.interval_ms // 60000} min")
+
+    def stop(self):
+        """Cancel snapshots and stop tracing if this monitor started it"""
+        if self._snapshot_id:
+            try:
+                self.root.after_cancel(self._snapshot_id)
+            except tkinter.TclError:
+                pass
+            self._snapshot_id = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def tick(self):
+        """Timer callback: count widgets here, snapshot and diff on a worker thread"""
+        self._snapshot_id = self.root.after(self.interval_ms, self.tick)
+
+        # Skip this round if the previous snapshot is still being diffed
+        if not self._busy.acquire(blocking=False):
+            return
+
+        counts = self.collect_counts()
+        thread = threading.Thread(target=self.snapshot_worker, args=(counts,))
+        thread.daemon = True
+        thread.start()
+
+    def collect_counts(self):
+        """Widget and Tcl object counts (main thread only)"""
+        counts = tk_object_counts(self.root)
+        counts['widgets'] = widget_counts(self.root, self.container)
+        return counts
+
+    def snapshot_worker(self, counts):
+        """Worker thread that snapshots memory and logs growth since the baseline"""
+        try:
+            start = time.perf_counter()
+            snapshot = take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+
+            if self.baseline is None:
+                self.baseline = snapshot
+                self.baseline_counts = counts
+                logger.info(f"Memory baseline: {current / 1024 / 1024:.1f} MB traced, "
+                            f"{counts['tk_commands']} Tcl commands, widgets {counts['widgets']}")
+                return
+
+            report = self.compare(snapshot, counts)
+            report['traced_mb'] = current / 1024 / 1024
+            report['peak_mb'] = peak / 1024 / 1024
+            report['snapshot_seconds'] = time.perf_counter() - start
+            self.reports.append(report)
+            logger.info(format_report(report))
+        except Exception as e:
+            logger.error(f"Memory snapshot failed: {e}")
+        finally:
+            self._busy.release()
+
+    def compare(self, snapshot, counts):
+        """Diff a snapshot and object counts against the baseline"""
+        baseline_total = sum(stat.size for stat in self.baseline.statistics('filename'))
+        total = sum(stat.size for stat in snapshot.statistics('filename'))
+        return {
+            'time': time.time(),
+            'growth_kb': (total - baseline_total) / 1024,
+            'top': top_growth(snapshot, self.baseline, self.top),
+            'tk_commands': counts['tk_commands'],
+            'tk_commands_diff': counts['tk_commands'] - self.baseline_counts['tk_commands'],
+            'after_timers': counts['after_timers'],
+            'widgets': counts['widgets']
+        }
+
+
+def format_report(report):
+    """Render a report as a multi-line log message"""
+    lines = [
+        f"Memory: {report.get('traced_mb', 0):.1f} MB traced ({report['growth_kb']:+.0f} KB since baseline), "
+        f"{report['tk_commands']} Tcl commands ({report['tk_commands_diff']:+d}), "
+        f"{report['after_timers']} after timers",
+        "  widgets: " + ", ".join(f"{view}={n}" for view, n in sorted(report['widgets'].items()))
+    ]
+    for entry in report['top']:
+        lines.append(f"  {entry['size_diff_kb']:+9.1f} KB {entry['count_diff']:+7d} objs  {entry['site']}")
+    return "\n".join(lines)
@@ -2,24 +2,45 @@
 Queue manager interface
 """
 import customtkinter as ctk
+from gui.styles import get_font, STATUS_COLORS, MUTED_TEXT, DANGER, START, STOP
 from tkinter import messagebox
-import asyncio
-import threading
-from automation.browser import BrowserManager
-from automation.marketplace import MarketplaceAutomation
-import random
+import logging
+import webbrowser
+from tkinter import TclError
+from automation.artifacts import ArtifactStore
+from automation.worker_process import PostingProcess
+
+logger = logging.getLogger(__name__)
 
 class QueueManager(ctk.CTkFrame):
+    # The posting worker outlives the view (switching tabs rebuilds it), so it
+    # lives on the class. Status bar text always goes to the main window;
+    # widget updates go to whichever queue view is showing.
+    worker = None
+    worker_root = None
+    worker_status = None
+    active_view = None
+
     def __init__(self, parent, db, config, status_callback):
         super().__init__(parent)
         
         self.db = db
         self.config = config
         self.status_callback = status_callback
-        self.is_posting = False
+        self.refresh_id = None
+        self.artifact_store = ArtifactStore(
+            self.config.get('artifacts_dir', 'data/artifacts'),
+            self.config.get('artifacts_max_mb', 200) * 1024 * 1024
+        )
         
         self.setup_ui()
         self.refresh_queue()
+
+        QueueManager.active_view = self
+        if self.is_posting():
+            self.start_btn.configure(state="disabled")
+            self.stop_btn.configure(state="normal")
+            self.progress_label.configure(text="Posting in progress...")
     
     def setup_ui(self):
         """Setup the queue manager UI"""
@@ -35,7 +56,7 @@ class QueueManager(ctk.CTkFrame):
         title = ctk.CTkLabel(
             header_frame,
             text="Posting Queue",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(size=20, weight="bold")
         )
         title.grid(row=0, column=0, padx=10, pady=10, sticky="w")
         
@@ -43,7 +64,7 @@ class QueueManager(ctk.CTkFrame):
         self.stats_label = ctk.CTkLabel(
             header_frame,
             text="0 pending | 0 posted | 0 failed",
-            font=ctk.CTkFont(size=12)
+            font=get_font(size=12)
         )
         self.stats_label.grid(row=0, column=1, padx=10, pady=10)
         
@@ -55,8 +76,8 @@ class QueueManager(ctk.CTkFrame):
             button_frame,
             text="Start Posting",
             command=self.start_posting,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            fg_color="green",
+            font=get_font(size=14, weight="bold"),
+            fg_color=START,
             width=130
         )
         self.start_btn.grid(row=0, column=0, padx=5)
@@ -65,8 +86,8 @@ class QueueManager(ctk.CTkFrame):
             button_frame,
             text="Stop",
             command=self.stop_posting,
-            font=ctk.CTkFont(size=14),
-            fg_color="red",
+            font=get_font(size=14),
+            fg_color=STOP,
             width=80,
             state="disabled"
         )
@@ -76,7 +97,7 @@ class QueueManager(ctk.CTkFrame):
             button_frame,
             text="Clear Completed",
             command=self.clear_completed,
-            font=ctk.CTkFont(size=12),
+            font=get_font(size=12),
             width=130
         )
         self.clear_btn.grid(row=0, column=2, padx=5)
@@ -94,7 +115,7 @@ class QueueManager(ctk.CTkFrame):
         self.progress_label = ctk.CTkLabel(
             progress_frame,
             text="Ready to post",
-            font=ctk.CTkFont(size=12)
+            font=get_font(size=12)
         )
         self.progress_label.grid(row=0, column=0, padx=10, pady=5, sticky="w")
         
@@ -115,8 +136,8 @@ class QueueManager(ctk.CTkFrame):
             empty_label = ctk.CTkLabel(
                 self.queue_frame,
                 text="Queue is empty\nUse 'Batch Generate' in Workflows to add listings",
-                font=ctk.CTkFont(size=14),
-                text_color="gray"
+                font=get_font(size=14),
+                text_color=MUTED_TEXT
             )
             empty_label.grid(row=0, column=0, pady=50)
         
@@ -139,21 +160,14 @@ class QueueManager(ctk.CTkFrame):
         item_frame.grid_columnconfigure(1, weight=1)
         
         # Status indicator
-        status_colors = {
-            'pending': 'gray',
-            'posting': 'blue',
-            'posted': 'green',
-            'failed': 'red'
-        }
-        
-        status_frame = ctk.CTkFrame(item_frame, width=10, fg_color=status_colors.get(item['status'], 'gray'))
+        status_frame = ctk.CTkFrame(item_frame, width=10, fg_color=STATUS_COLORS.get(item['status'], 'gray'))
         status_frame.grid(row=0, column=0, rowspan=3, sticky="ns", padx=(5, 10))
         
         # Title
         title_label = ctk.CTkLabel(
             item_frame,
             text=item['title'],
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(size=14, weight="bold"),
             anchor="w"
         )
         title_label.grid(row=0, column=1, sticky="w", padx=5, pady=(5, 0))
@@ -166,25 +180,37 @@ class QueueManager(ctk.CTkFrame):
         details_label = ctk.CTkLabel(
             item_frame,
             text=details,
-            font=ctk.CTkFont(size=11),
+            font=get_font(size=11),
             anchor="w",
-            text_color="gray"
+            text_color=MUTED_TEXT
         )
         details_label.grid(row=1, column=1, sticky="w", padx=5)
         
         # Status text
         status_text = (item.get('status') or 'pending').capitalize()
         if item.get('error_message'):
-            status_text += f" - {item['error_message']}"
+            # Details (paths, tracebacks) are in the failure dialog
+            status_text += f" - {item['error_message'].splitlines()[0]}"
         
         status_label = ctk.CTkLabel(
             item_frame,
             text=status_text,
-            font=ctk.CTkFont(size=10),
+            font=get_font(size=10),
             anchor="w"
         )
         status_label.grid(row=2, column=1, sticky="w", padx=5, pady=(0, 5))
         
+        # Failure artifacts button
+        if item['status'] == 'failed' and item.get('artifacts'):
+            artifacts_btn = ctk.CTkButton(
+                item_frame,
+                text="View Failure",
+                command=lambda: self.show_artifacts(item),
+                width=100,
+                height=30
+            )
+            artifacts_btn.grid(row=0, column=2, rowspan=3, padx=(10, 0))
+
         # Delete button
         if item['status'] in ['pending', 'failed']:
             delete_btn = ctk.CTkButton(
@@ -193,10 +219,69 @@ class QueueManager(ctk.CTkFrame):
                 command=lambda: self.delete_item(item['id']),
                 width=80,
                 height=30,
-                fg_color="darkred"
+                fg_color=DANGER
             )
-            delete_btn.grid(row=0, column=2, rowspan=3, padx=10)
+            delete_btn.grid(row=0, column=3, rowspan=3, padx=10)
     
+    def show_artifacts(self, item):
+        """Show the screenshot and DOM snapshot captured when an item failed"""
+        artifacts = item.get('artifacts') or {}
+
+        dialog = ctk.CTkToplevel(self)
+        dialog.title(f"Failure - {item['title']}")
+        dialog.geometry("900x650")
+        dialog.transient(self.winfo_toplevel())
+
+        ctk.CTkLabel(
+            dialog,
+            text=item.get('error_message') or "Unknown error",
+            font=get_font(size=12),
+            wraplength=850,
+            justify="left"
+        ).pack(padx=20, pady=(15, 10), anchor="w")
+
+        screenshot = self.artifact_store.path(artifacts['screenshot']) if artifacts.get('screenshot') else None
+        if screenshot:
+            try:
+                from PIL import Image
+                with Image.open(screenshot) as image:
+                    image.thumbnail((860, 480))
+                    preview = ctk.CTkImage(light_image=image.copy(), size=image.size)
+                ctk.CTkLabel(dialog, image=preview, text="").pack(padx=20, pady=5)
+            except Exception as e:
+                logger.warning(f"Could not load screenshot preview: {e}")
+        elif artifacts.get('screenshot'):
+            ctk.CTkLabel(dialog, text="Screenshot was evicted from the artifacts folder", text_color=MUTED_TEXT).pack(pady=5)
+
+        button_frame = ctk.CTkFrame(dialog)
+        button_frame.pack(pady=15)
+
+        if screenshot:
+            ctk.CTkButton(
+                button_frame,
+                text="Open Screenshot",
+                command=lambda: webbrowser.open(screenshot.as_uri())
+            ).grid(row=0, column=0, padx=5)
+
+        if artifacts.get('dom') and self.artifact_store.path(artifacts['dom']):
+            ctk.CTkButton(
+                button_frame,
+                text="Open DOM Snapshot",
+                command=lambda: self.open_dom_snapshot(artifacts['dom'])
+            ).grid(row=0, column=1, padx=5)
+
+    def open_dom_snapshot(self, name):
+        """Open a script-free copy of a DOM snapshot in the browser"""
+        try:
+            path = self.artifact_store.export_dom(name)
+        except OSError as e:
+            logger.error(f"Could not export DOM snapshot {name}: {e}")
+            path = None
+        if path is None:
+            messagebox.showerror("Error", "DOM snapshot is no longer available")
+            return
+        webbrowser.open(path.as_uri())
+
     def delete_item(self, item_id):
         """Delete a queue item"""
         if messagebox.askyesno("Confirm", "Delete this listing from queue?"):
@@ -205,7 +290,7 @@ class QueueManager(ctk.CTkFrame):
     
     def clear_completed(self):
         """Clear all completed/failed items"""
-        if messagebox.askyesno("Confirm", "Clear all posted and failed listings from queue?"):
+        if messagebox.askyesno("Confirm", "Move all posted and failed listings to the archive?"):
             self.db.clear_completed_queue()
             self.refresh_queue()
     
@@ -226,108 +311,135 @@ class QueueManager(ctk.CTkFrame):
             )
             return
         
-        self.is_posting = True
+        if self.is_posting():
+            return
+
+        # Posting runs in a child process so a browser hang or crash can't freeze the window
+        worker = PostingProcess(
+            self.db,
+            self.config.settings,
+            [item['id'] for item in pending_items],
+            on_event=QueueManager.relay_worker_event,
+            stop_timeout=self.config.get('worker_stop_timeout', 120)
+        )
+        try:
+            worker.start()
+        except Exception as e:
+            logger.exception(f"Could not start posting worker: {e}")
+            messagebox.showerror("Error", f"Could not start posting: {e}")
+            return
+        QueueManager.worker = worker
+        QueueManager.worker_root = self.winfo_toplevel()
+        QueueManager.worker_status = self.status_callback
+
         self.start_btn.configure(state="disabled")
         self.stop_btn.configure(state="normal")
-        
-        # Start posting in separate thread
-        thread = threading.Thread(target=self.posting_worker, args=(pending_items,))
-        thread.daemon = True
-        thread.start()
+        self.progress_bar.set(0)
+        self.progress_label.configure(text="Starting...")
+        self.status_callback("Starting")
     
     def stop_posting(self):
-        """Stop posting process"""
-        self.is_posting = False
-        self.start_btn.configure(state="normal")
+        """Stop posting once the current listing is finished"""
+        if not self.is_posting():
+            return
+        QueueManager.worker.stop()
         self.stop_btn.configure(state="disabled")
-        self.status_callback("Stopped")
-    
-    def posting_worker(self, items):
-        """Worker thread for posting listings"""
-        # Create new event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            loop.run_until_complete(self.post_listings(items))
-        except Exception as e:
-            print(f"Error in posting worker: {e}")
-        finally:
-            loop.close()
-            
-            # Reset UI
-            self.after(0, lambda: self.start_btn.configure(state="normal"))
-            self.after(0, lambda: self.stop_btn.configure(state="disabled"))
-            self.after(0, lambda: self.status_callback("Ready"))
-            self.after(0, self.refresh_queue)
-    
-    async def post_listings(self, items):
-        """Async function to post listings"""
-        chrome_path = self.config.get('chrome_profile_path')
-        browser = BrowserManager(chrome_path)
-        automation = MarketplaceAutomation(browser)
-        
+        self.progress_label.configure(text="Stopping after the current listing...")
+        self.status_callback("Stopping")
+
+    def is_posting(self):
+        """True while a posting worker process is running"""
+        return QueueManager.worker is not None and QueueManager.worker.is_running()
+
+    @staticmethod
+    def relay_worker_event(kind, payload):
+        """Called on the worker monitor thread; hands the event to the Tk thread"""
         try:
-            await automation.initialize()
-            
-            total = len(items)
-            for idx, item in enumerate(items):
-                if not self.is_posting:
-                    break
-                
-                # Update progress
-                progress = (idx + 1) / total
-                self.after(0, lambda p=progress: self.progress_bar.set(p))
-                self.after(0, lambda i=idx: self.progress_label.configure(
-                    text=f"Posting {i+1} of {total}..."
-                ))
-                self.after(0, lambda: self.status_callback(f"Posting {idx+1}/{total}"))
-                
-                # Update item status
-                self.db.update_queue_status(item['id'], 'posting')
-                self.after(0, self.refresh_queue)
-                
-                # Post listing
-                result = await automation.create_listing(
-                    item['title'],
-                    item['description'],
-                    item['price'],
-                    item['category'],
-                    item['condition'],
-                    item['location'],
-                    item['images'],
-                    item.get('delivery_method', 'Door pickup'),
-                    item.get('groups'),
-                    item.get('boost_listing', False)
+            QueueManager.worker_root.after(0, lambda: QueueManager.deliver_worker_event(kind, payload))
+        except (RuntimeError, TclError):
+            # The app is closing
+            pass
+
+    @staticmethod
+    def deliver_worker_event(kind, payload):
+        """Show a worker event, whether or not the queue view is open"""
+        text = worker_status_text(kind, payload)
+        if text:
+            QueueManager.worker_status(text)
+        if kind == 'error':
+            messagebox.showerror("Error", f"Posting failed: {payload}")
+
+        view = QueueManager.active_view
+        if view is not None and view.winfo_exists():
+            view.handle_worker_event(kind, payload)
+
+    def handle_worker_event(self, kind, payload):
+        """Update the queue view's widgets for a message from the posting worker"""
+        if kind == 'preflight':
+            if payload['failed']:
+                self.progress_label.configure(
+                    text=f"{payload['failed']} of {payload['checked']} listing(s) failed pre-flight checks"
                 )
-                
-                # Update status based on result
-                if result['success']:
-                    self.db.update_queue_status(item['id'], 'posted')
-                else:
-                    self.db.update_queue_status(item['id'], 'failed', result['error'])
-                
-                self.after(0, self.refresh_queue)
-                
-                # Random delay between posts
-                if idx < total - 1:  # Don't delay after last post
-                    min_delay = self.config.get('min_delay_between_posts', 60)
-                    max_delay = self.config.get('max_delay_between_posts', 180)
-                    delay = random.uniform(min_delay, max_delay)
-                    
-                    self.after(0, lambda d=delay: self.progress_label.configure(
-                        text=f"Waiting {int(d)} seconds before next post..."
-                    ))
-                    
-                    await asyncio.sleep(delay)
-            
-            self.after(0, lambda: self.progress_label.configure(text="Posting complete!"))
-            self.after(0, lambda: self.status_callback("Complete"))
-            
-        except Exception as e:
-            print(f"Error posting listings: {e}")
-            error_msg = str(e)
-            self.after(0, lambda: messagebox.showerror("Error", f"Posting failed: {error_msg}"))
-        finally:
-            await automation.close()
-            self.is_posting = False
+        elif kind == 'progress':
+            index, total = payload['index'], payload['total']
+            self.progress_bar.set((index + 1) / total)
+            self.progress_label.configure(text=f"Posting {index + 1} of {total}...")
+        elif kind == 'waiting':
+            self.progress_label.configure(text=f"Waiting {int(payload)} seconds before next post...")
+        elif kind == 'item':
+            self.schedule_refresh()
+        elif kind == 'done':
+            self.posting_finished(payload)
+
+    def posting_finished(self, result):
+        """Reset the UI once the worker has exited"""
+        self.start_btn.configure(state="normal")
+        self.stop_btn.configure(state="disabled")
+
+        summary = f"{result['posted']} posted, {result['failed']} failed"
+        if result['crashed']:
+            self.progress_label.configure(text=f"Posting worker stopped unexpectedly ({summary})")
+        elif result['error']:
+            self.progress_label.configure(text=f"Posting failed ({summary})")
+        elif result['stopped']:
+            self.progress_label.configure(text=f"Stopped ({summary})")
+        else:
+            self.progress_label.configure(text=f"Posting complete! ({summary})")
+            if not result['posted'] and result['failed']:
+                messagebox.showwarning(
+                    "Posting",
+                    "No listings were posted.\nSee the failed items for details."
+                )
+        self.refresh_queue()
+
+    def schedule_refresh(self, delay_ms=250):
+        """Refresh the queue soon, coalescing bursts of status changes into one rebuild"""
+        if self.refresh_id is None:
+            self.refresh_id = self.after(delay_ms, self.run_scheduled_refresh)
+
+    def run_scheduled_refresh(self):
+        self.refresh_id = None
+        self.refresh_queue()
+
+    def destroy(self):
+        if QueueManager.active_view is self:
+            QueueManager.active_view = None
+        if self.refresh_id:
+            self.after_cancel(self.refresh_id)
+            self.refresh_id = None
+        super().destroy()
+
+
+def worker_status_text(kind, payload):
+    """Status bar text for a worker event, or None"""
+    if kind == 'status':
+        return payload
+    if kind == 'progress':
+        return f"Posting {payload['index'] + 1}/{payload['total']}"
+    if kind == 'done':
+        if payload['crashed']:
+            return "Worker crashed"
+        if payload['error']:
+            return "Failed"
+        return "Stopped" if payload['stopped'] else "Complete"
+    return None
@@ -2,6 +2,7 @@
 Settings window interface
 """
 import customtkinter as ctk
+from gui.styles import get_font, MUTED_TEXT, SECONDARY
 from tkinter import filedialog, messagebox
 
 class SettingsWindow(ctk.CTkToplevel):
@@ -30,7 +31,7 @@ class SettingsWindow(ctk.CTkToplevel):
         title = ctk.CTkLabel(
             self,
             text="Settings",
-            font=ctk.CTkFont(size=24, weight="bold")
+            font=get_font(size=24, weight="bold")
         )
         title.pack(pady=(20, 30))
         
@@ -42,14 +43,14 @@ class SettingsWindow(ctk.CTkToplevel):
         ctk.CTkLabel(
             settings_frame,
             text="Chrome Profile Path:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(size=14, weight="bold")
         ).pack(anchor="w", pady=(10, 5))
         
         ctk.CTkLabel(
             settings_frame,
             text="Location of your Chrome user data folder (contains your login)",
-            font=ctk.CTkFont(size=11),
-            text_color="gray"
+            font=get_font(size=11),
+            text_color=MUTED_TEXT
         ).pack(anchor="w")
         
         path_frame = ctk.CTkFrame(settings_frame)
@@ -71,14 +72,14 @@ class SettingsWindow(ctk.CTkToplevel):
         ctk.CTkLabel(
             settings_frame,
             text="Posting Delays:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(size=14, weight="bold")
         ).pack(anchor="w", pady=(20, 5))
 
         ctk.CTkLabel(
             settings_frame,
             text="Random delay between posts (helps avoid detection)",
-            font=ctk.CTkFont(size=11),
-            text_color="gray"
+            font=get_font(size=11),
+            text_color=MUTED_TEXT
         ).pack(anchor="w")
 
         delay_frame = ctk.CTkFrame(settings_frame)
@@ -114,7 +115,7 @@ class SettingsWindow(ctk.CTkToplevel):
         ctk.CTkLabel(
             settings_frame,
             text="Default Listing Settings:",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(size=14, weight="bold")
         ).pack(anchor="w", pady=(20, 5))
         
         # Location
@@ -156,7 +157,7 @@ class SettingsWindow(ctk.CTkToplevel):
             button_frame,
             text="Save Settings",
             command=self.save_settings,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(size=14, weight="bold"),
             width=150
         )
         save_btn.pack(side="left", padx=10)
@@ -165,7 +166,7 @@ class SettingsWindow(ctk.CTkToplevel):
             button_frame,
             text="Cancel",
             command=self.destroy,
-            fg_color="gray",
+            fg_color=SECONDARY,
             width=100
         )
         cancel_btn.pack(side="left", padx=10)
@@ -0,0 +1,206 @@
+"""
+Posting statistics dashboard, read from the materialized queue_stats tables
+"""
+import customtkinter as ctk
+import logging
+import threading
+from tkinter import TclError
+from gui.styles import get_font, MUTED_TEXT, ERROR_TEXT, STATUS_COLORS
+
+logger = logging.getLogger(__name__)
+
+RANGES = {
+    "Last 7 days": 7,
+    "Last 30 days": 30,
+    "Last 90 days": 90,
+    "All time": None
+}
+
+class StatsPanel(ctk.CTkFrame):
+    def __init__(self, parent, db):
+        super().__init__(parent)
+
+        self.db = db
+
+        self.setup_ui()
+        self.refresh()
+
+    def setup_ui(self):
+        """Setup the statistics panel UI"""
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(2, weight=1)
+
+        header_frame = ctk.CTkFrame(self)
+        header_frame.grid(row=0, column=0, sticky="ew", pady=(0, 10))
+        header_frame.grid_columnconfigure(1, weight=1)
+
+        title = ctk.CTkLabel(
+            header_frame,
+            text="Statistics",
+            font=get_font(size=20, weight="bold")
+        )
+        title.grid(row=0, column=0, padx=10, pady=10, sticky="w")
+
+        self.range_var = ctk.StringVar(value="Last 30 days")
+        range_menu = ctk.CTkOptionMenu(
+            header_frame,
+            variable=self.range_var,
+            values=list(RANGES),
+            command=lambda _: self.refresh(),
+            width=130
+        )
+        range_menu.grid(row=0, column=2, padx=5, pady=10)
+
+        refresh_btn = ctk.CTkButton(
+            header_frame,
+            text="Refresh",
+            command=self.refresh,
+            width=90
+        )
+        refresh_btn.grid(row=0, column=3, padx=10, pady=10)
+
+        # Totals for the selected range
+        self.summary_frame = ctk.CTkFrame(self)
+        self.summary_frame.grid(row=1, column=0, sticky="ew", pady=(0, 10))
+        for column in range(4):
+            self.summary_frame.grid_columnconfigure(column, weight=1)
+
+        self.summary_labels = {}
+        for column, (key, caption) in enumerate([
+            ('posted', "Posted"),
+            ('failed', "Failed"),
+            ('success', "Success rate"),
+            ('avg', "Avg attempt")
+        ]):
+            ctk.CTkLabel(
+                self.summary_frame,
+                text=caption,
+                font=get_font(size=12),
+                text_color=MUTED_TEXT
+            ).grid(row=0, column=column, pady=(10, 0))
+            value = ctk.CTkLabel(self.summary_frame, text="-", font=get_font(size=22, weight="bold"))
+            value.grid(row=1, column=column, pady=(0, 10))
+            self.summary_labels[key] = value
+
+        self.body = ctk.CTkScrollableFrame(self)
+        self.body.grid(row=2, column=0, sticky="nsew")
+        self.body.grid_columnconfigure(0, weight=1)
+
+    def refresh(self):
+        """Load statistics for the selected range in the background"""
+        days = RANGES[self.range_var.get()]
+        thread = threading.Thread(target=self.load_worker, args=(days,))
+        thread.daemon = True
+        thread.start()
+
+    def load_worker(self, days):
+        """Worker thread that reads the precomputed statistics"""
+        try:
+            stats = {
+                'daily': self.db.get_daily_stats(days),
+                'workflows': self.db.get_workflow_stats(days),
+                'reasons': self.db.get_failure_reasons(days)
+            }
+        except Exception as e:
+            logger.error(f"Error loading statistics: {e}")
+            stats = None
+
+        try:
+            self.after(0, lambda: self.show_stats(stats))
+        except (RuntimeError, TclError):
+            # Panel was closed while loading
+            pass
+
+    def show_stats(self, stats):
+        """Render loaded statistics"""
+        if not self.winfo_exists():
+            return
+
+        for widget in self.body.winfo_children():
+            widget.destroy()
+
+        if stats is None:
+            ctk.CTkLabel(self.body, text="Could not load statistics", text_color=ERROR_TEXT).grid(row=0, column=0, pady=20)
+            return
+
+        daily = stats['daily']
+        posted = sum(day['posted'] for day in daily)
+        failed = sum(day['failed'] for day in daily)
+        timed = sum(day['timed_attempts'] for day in daily)
+        avg_seconds = sum(day['attempt_seconds'] for day in daily) / timed if timed else None
+
+        self.summary_labels['posted'].configure(text=str(posted))
+        self.summary_labels['failed'].configure(text=str(failed))
+        self.summary_labels['success'].configure(
+            text=f"{posted / (posted + failed) * 100:.0f}%" if posted + failed else "-"
+        )
+        self.summary_labels['avg'].configure(text=format_duration(avg_seconds))
+
+        if not daily:
+            ctk.CTkLabel(
+                self.body,
+                text="No posts in this period",
+                font=get_font(size=13),
+                text_color=MUTED_TEXT
+            ).grid(row=0, column=0, pady=20)
+            return
+
+        row = 0
+        row = self.add_table(row, "By Day", ["Day", "Posted", "Failed", "Avg attempt"], [
+            (day['day'], day['posted'], day['failed'], format_duration(day['avg_seconds']))
+            for day in daily
+        ])
+        row = self.add_table(row, "By Workflow", ["Workflow", "Posted", "Failed", "Avg attempt"], [
+            (workflow['name'], workflow['posted'], workflow['failed'], format_duration(workflow['avg_seconds']))
+            for workflow in stats['workflows']
+        ])
+        if stats['reasons']:
+            self.add_table(row, "Top Failure Reasons", ["Reason", "Count"], stats['reasons'])
+
+    def add_table(self, row, heading, columns, rows):
+        """Add a titled grid of labels to the body, returns the next free row"""
+        ctk.CTkLabel(
+            self.body,
+            text=heading,
+            font=get_font(size=14, weight="bold")
+        ).grid(row=row, column=0, sticky="w", padx=10, pady=(15, 5))
+
+        table = ctk.CTkFrame(self.body)
+        table.grid(row=row + 1, column=0, sticky="ew", padx=10)
+        table.grid_columnconfigure(0, weight=1)
+
+        for column, name in enumerate(columns):
+            ctk.CTkLabel(
+                table,
+                text=name,
+                font=get_font(size=12, weight="bold"),
+                text_color=MUTED_TEXT
+            ).grid(row=0, column=column, sticky="w", padx=10, pady=(5, 2))
+
+        for index, values in enumerate(rows, start=1):
+            for column, value in enumerate(values):
+                color = None
+                if columns[column] == "Posted":
+                    color = STATUS_COLORS['posted']
+                elif columns[column] == "Failed" and value:
+                    color = STATUS_COLORS['failed']
+                ctk.CTkLabel(
+                    table,
+                    text=str(value),
+                    font=get_font(size=12),
+                    text_color=color,
+                    anchor="w",
+                    wraplength=500 if column == 0 else 0
+                ).grid(row=index, column=column, sticky="w", padx=10, pady=1)
+
+        return row + 2
+
+
+def format_duration(seconds):
+    """Render an attempt duration like '45s' or '3m 20s'"""
+    if seconds is None:
+        return "-"
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    return f"{seconds // 60}m {seconds % 60:02d}s"
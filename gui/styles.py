@@ -0,0 +1,42 @@
+"""
+Shared fonts and colors for the GUI
+
+Fonts are created once per (size, weight) and reused, so refreshing a list
+of hundreds of rows doesn't allocate a new Tk font for every label.
+"""
+import customtkinter as ctk
+
+# Colors
+MUTED_TEXT = "gray"
+ERROR_TEXT = "red"
+DANGER = "darkred"
+START = "green"
+STOP = "red"
+SECONDARY = "gray"
+NAV_INACTIVE = ("gray75", "gray25")
+NAV_ACTIVE = ("gray85", "gray40")
+
+# Queue item status bar colors
+STATUS_COLORS = {
+    'pending': 'gray',
+    'posting': 'blue',
+    'posted': 'green',
+    'failed': 'red'
+}
+
+_fonts = {}
+
+
+def get_font(size=13, weight="normal", family=None):
+    """Get the shared CTkFont for a size/weight/family, creating it on first use"""
+    key = (size, weight, family)
+    font = _fonts.get(key)
+    if font is None:
+        font = ctk.CTkFont(family=family, size=size, weight=weight)
+        _fonts[key] = font
+    return font
+
+
+def font_count():
+    """Number of fonts created by the registry"""
+    return len(_fonts)
@@ -0,0 +1,178 @@
+"""
+Opt-in Tk main-loop latency watchdog and slow-handler profiler
+
+Enable with the 'ui_profiling' setting or the FB_UI_PROFILE=1 environment
+variable. Every Tk callback (button commands, event bindings and `after`
+callbacks) is timed; handlers that run longer than the threshold are logged
+with a stack sample taken while they were still running. A heartbeat timer
+measures how late the event loop services it, which is shown as "UI lag".
+"""
+import collections
+import functools
+import logging
+import sys
+import threading
+import time
+import tkinter
+import traceback
+
+logger = logging.getLogger(__name__)
+
+
+class UIMonitor:
+    def __init__(self, root, threshold_ms=100, heartbeat_ms=100, history=200):
+        self.root = root
+        self.threshold = threshold_ms / 1000
+        self.heartbeat_interval = heartbeat_ms / 1000
+
+        self.slow_handlers = collections.deque(maxlen=history)
+        self.handler_stats = {}
+        self.current_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+
+        self._running = []
+        self._lock = threading.Lock()
+        self._main_thread_id = threading.get_ident()
+        self._original_register = None
+        self._original_after = None
+        self._last_heartbeat = None
+        self._heartbeat_id = None
+        self._stop = threading.Event()
+
+    def install(self):
+        """Start wrapping Tk callbacks and measuring event-loop lag"""
+        if self._original_register:
+            return
+
+        monitor = self
+        original = tkinter.Misc._register
+        original_after = tkinter.Misc.after
+        self._original_register = original
+        self._original_after = original_after
+
+        def _register(widget, func, subst=None, needcleanup=1):
+            # after() callbacks are wrapped below so they're reported by their own name
+            if getattr(func, '__qualname__', '') != 'Misc.after.<locals>.callit':
+                func = monitor._wrap(func)
+            return original(widget, func, subst, needcleanup)
+
+        def after(widget, ms, func=None, *args):
+            if func is not None:
+                func = monitor._wrap(func)
+            return original_after(widget, ms, func, *args)
+
+        tkinter.Misc._register = _register
+        tkinter.Misc.after = after
+
+        self._stop.clear()
+        threading.Thread(target=self._sample_worker, daemon=True).start()
+
+        self._last_heartbeat = time.perf_counter()
+        self._heartbeat_id = self.root.after(int(self.heartbeat_interval * 1000), self._heartbeat)
+
+    def uninstall(self):
+        """Stop monitoring; callbacks already registered stay wrapped"""
+        if self._original_register:
+            tkinter.Misc._register = self._original_register
+            tkinter.Misc.after = self._original_after
+            self._original_register = None
+            self._original_after = None
+        self._stop.set()
+        if self._heartbeat_id:
+            try:
+                self.root.after_cancel(self._heartbeat_id)
+            except tkinter.TclError:
+                pass
+            self._heartbeat_id = None
+
+    def _wrap(self, func):
+        """Wrap a Tk callback so its run time is measured"""
+        if getattr(func, '_ui_monitor_wrapped', False):
+            return func
+
+        name = _describe(func)
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            entry = {'name': name, 'start': time.perf_counter(), 'stack': None}
+            with self._lock:
+                self._running.append(entry)
+            try:
+                return func(*args)
+            finally:
+                duration = time.perf_counter() - entry['start']
+                with self._lock:
+                    self._running.remove(entry)
+                self._record(name, duration, entry['stack'])
+
+        wrapper._ui_monitor_wrapped = True
+        return wrapper
+
+    def _record(self, name, duration, stack):
+        """Record a finished handler run and log it if it was slow"""
+        stats = self.handler_stats.setdefault(name, {'calls': 0, 'total': 0.0, 'max': 0.0})
+        stats['calls'] += 1
+        stats['total'] += duration
+        stats['max'] = max(stats['max'], duration)
+
+        if duration < self.threshold:
+            return
+
+        self.slow_handlers.append({
+            'name': name,
+            'duration_ms': duration * 1000,
+            'time': time.time(),
+            'stack': stack
+        })
+        if stack:
+            logger.warning(f"Slow handler {name}: {duration * 1000:.0f} ms\n" + "".join(stack).rstrip())
+        else:
+            logger.warning(f"Slow handler {name}: {duration * 1000:.0f} ms")
+
+    def _sample_worker(self):
+        """Background thread that captures the main thread's stack during slow handlers"""
+        interval = max(self.threshold / 2, 0.01)
+        while not self._stop.wait(interval):
+            now = time.perf_counter()
+            with self._lock:
+                # Sample the innermost handler, that's the one actually running
+                entry = self._running[-1] if self._running else None
+            if not entry or entry['stack'] or now - entry['start'] < self.threshold:
+                continue
+
+            frame = sys._current_frames().get(self._main_thread_id)
+            if frame:
+                entry['stack'] = traceback.format_stack(frame, limit=15)
+
+    def _heartbeat(self):
+        """Timer callback measuring how late the event loop ran it"""
+        now = time.perf_counter()
+        lag = max(0.0, now - self._last_heartbeat - self.heartbeat_interval)
+        self.current_lag_ms = lag * 1000
+        self.max_lag_ms = max(self.max_lag_ms, self.current_lag_ms)
+
+        self._last_heartbeat = now
+        self._heartbeat_id = self.root.after(int(self.heartbeat_interval * 1000), self._heartbeat)
+
+    _heartbeat._ui_monitor_wrapped = True
+
+    def report(self, top=10):
+        """Return the handlers with the highest total run time"""
+        ranked = sorted(self.handler_stats.items(), key=lambda kv: kv[1]['total'], reverse=True)
+        return [
+            {
+                'name': name,
+                'calls': stats['calls'],
+                'total_ms': stats['total'] * 1000,
+                'max_ms': stats['max'] * 1000
+            }
+            for name, stats in ranked[:top]
+        ]
+
+
+def _describe(func):
+    """Readable name for a callback, e.g. QueueManager.refresh_queue"""
+    func = getattr(func, '__func__', func)
+    qualname = getattr(func, '__qualname__', None) or repr(func)
+    module = getattr(func, '__module__', None)
+    return f"{module}.{qualname}" if module else qualname
@@ -2,9 +2,19 @@
 Workflow editor interface
 """
 import customtkinter as ctk
-from tkinter import filedialog, messagebox
+from gui.styles import get_font, DANGER, MUTED_TEXT, ERROR_TEXT, SECONDARY
+from tkinter import filedialog, messagebox, TclError
+import logging
 import os
-from pathlib import Path
+import sqlite3
+import threading
+from datetime import datetime
+from automation.batch import (
+    scan_image_folder, plan_listings, enqueue_listings,
+    index_capture_times, group_by_capture_time, plan_grouped_listings
+)
+
+logger = logging.getLogger(__name__)
 
 class WorkflowEditor(ctk.CTkFrame):
     def __init__(self, parent, db, config):
@@ -14,6 +24,17 @@ class WorkflowEditor(ctk.CTkFrame):
         self.config = config
         self.current_workflow = None
         self.descriptions = []
+
+        # Autosave state: fields edited since the last save, pending timer, write in flight
+        self.autosave_enabled = config.get('auto_save_workflows', True)
+        self.autosave_delay_ms = config.get('autosave_delay_ms', 1000)
+        self.dirty_fields = set()
+        self.autosave_id = None
+        self.saving = False
+        self.loading = False
+        self.closing = False
+        self.save_thread = None
+        self.save_result = None
         
         self.setup_ui()
         self.refresh_workflow_list()
@@ -35,7 +56,7 @@ class WorkflowEditor(ctk.CTkFrame):
         header = ctk.CTkLabel(
             self.left_panel,
             text="Workflows",
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(size=18, weight="bold")
         )
         header.grid(row=0, column=0, pady=(10, 5), padx=10, sticky="w")
         
@@ -54,7 +75,7 @@ class WorkflowEditor(ctk.CTkFrame):
             button_frame,
             text="New Workflow",
             command=self.new_workflow,
-            font=ctk.CTkFont(size=13)
+            font=get_font(size=13)
         )
         self.new_btn.grid(row=0, column=0, pady=5, padx=(0, 5), sticky="ew")
         
@@ -62,7 +83,7 @@ class WorkflowEditor(ctk.CTkFrame):
             button_frame,
             text="Duplicate",
             command=self.duplicate_workflow,
-            font=ctk.CTkFont(size=13)
+            font=get_font(size=13)
         )
         self.duplicate_btn.grid(row=0, column=1, pady=5, padx=(5, 0), sticky="ew")
         
@@ -70,8 +91,8 @@ class WorkflowEditor(ctk.CTkFrame):
             button_frame,
             text="Delete",
             command=self.delete_workflow,
-            fg_color="darkred",
-            font=ctk.CTkFont(size=13)
+            fg_color=DANGER,
+            font=get_font(size=13)
         )
         self.delete_btn.grid(row=1, column=0, columnspan=2, pady=5, sticky="ew")
         
@@ -88,7 +109,7 @@ class WorkflowEditor(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             self.right_panel,
             text="Workflow Editor",
-            font=ctk.CTkFont(size=20, weight="bold")
+            font=get_font(size=20, weight="bold")
         )
         title_label.grid(row=0, column=0, pady=(10, 20), sticky="w")
         
@@ -154,7 +175,7 @@ class WorkflowEditor(ctk.CTkFrame):
             self.right_panel,
             text="Enable Boost Listing (promoted/paid listing)",
             variable=self.boost_var,
-            font=ctk.CTkFont(size=13)
+            font=get_font(size=13)
         )
         boost_checkbox.grid(row=17, column=0, sticky="w", pady=(5, 10))
 
@@ -162,7 +183,7 @@ class WorkflowEditor(ctk.CTkFrame):
         desc_header = ctk.CTkLabel(
             self.right_panel,
             text="Description Variations (2-3 recommended)",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(size=14, weight="bold")
         )
         desc_header.grid(row=18, column=0, sticky="w", pady=(20, 10))
 
@@ -185,21 +206,30 @@ class WorkflowEditor(ctk.CTkFrame):
             self.right_panel,
             text="Save Workflow",
             command=self.save_workflow,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(size=14, weight="bold"),
             height=40
         )
-        self.save_btn.grid(row=21, column=0, sticky="ew", pady=(20, 10))
+        self.save_btn.grid(row=21, column=0, sticky="ew", pady=(20, 0))
+
+        # Autosave status
+        self.autosave_label = ctk.CTkLabel(
+            self.right_panel,
+            text="Changes are saved automatically" if self.autosave_enabled else "",
+            font=get_font(size=11),
+            text_color=MUTED_TEXT
+        )
+        self.autosave_label.grid(row=22, column=0, sticky="w", pady=(0, 10))
 
         # Batch generate section
         batch_header = ctk.CTkLabel(
             self.right_panel,
             text="Batch Generate Listings",
-            font=ctk.CTkFont(size=14, weight="bold")
+            font=get_font(size=14, weight="bold")
         )
-        batch_header.grid(row=22, column=0, sticky="w", pady=(30, 10))
+        batch_header.grid(row=23, column=0, sticky="w", pady=(30, 10))
 
         batch_frame = ctk.CTkFrame(self.right_panel)
-        batch_frame.grid(row=23, column=0, sticky="ew", pady=5)
+        batch_frame.grid(row=24, column=0, sticky="ew", pady=5)
         batch_frame.grid_columnconfigure(1, weight=1)
 
         ctk.CTkLabel(batch_frame, text="Images per listing:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
@@ -212,14 +242,49 @@ class WorkflowEditor(ctk.CTkFrame):
         self.num_listings.insert(0, "5")
         self.num_listings.grid(row=1, column=1, padx=5, pady=5, sticky="w")
 
+        self.group_by_time_var = ctk.BooleanVar(value=self.config.get('batch_group_by_time', False))
+        ctk.CTkCheckBox(
+            batch_frame,
+            text="Keep photos taken together in one listing",
+            variable=self.group_by_time_var
+        ).grid(row=2, column=0, columnspan=2, padx=5, pady=5, sticky="w")
+
+        ctk.CTkLabel(batch_frame, text="Burst gap (seconds):").grid(row=3, column=0, padx=5, pady=5, sticky="w")
+        self.burst_gap = ctk.CTkEntry(batch_frame, width=60)
+        self.burst_gap.insert(0, str(self.config.get('burst_gap_seconds', 30)))
+        self.burst_gap.grid(row=3, column=1, padx=5, pady=5, sticky="w")
+
         self.batch_btn = ctk.CTkButton(
             self.right_panel,
             text="Select Images & Generate",
             command=self.batch_generate,
-            font=ctk.CTkFont(size=14),
+            font=get_font(size=14),
             height=40
         )
-        self.batch_btn.grid(row=24, column=0, sticky="ew", pady=10)
+        self.batch_btn.grid(row=25, column=0, sticky="ew", pady=10)
+
+        self.track_changes()
+
+    def track_changes(self):
+        """Mark fields dirty as the user edits them"""
+        entries = [
+            ('name', self.name_entry),
+            ('title', self.title_entry),
+            ('price', self.price_entry),
+            ('location', self.location_entry),
+            ('groups', self.groups_entry)
+        ]
+        for field, entry in entries:
+            entry.bind("<KeyRelease>", lambda event, f=field: self.mark_dirty(f))
+
+        variables = [
+            ('category', self.category_var),
+            ('condition', self.condition_var),
+            ('delivery_method', self.delivery_method_var),
+            ('boost_listing', self.boost_var)
+        ]
+        for field, var in variables:
+            var.trace_add("write", lambda *args, f=field: self.mark_dirty(f))
     
     def add_description_field(self):
         """Add a new description text box"""
@@ -237,19 +302,22 @@ class WorkflowEditor(ctk.CTkFrame):
             text="Remove",
             command=lambda: self.remove_description(frame, textbox),
             width=80,
-            fg_color="darkred"
+            fg_color=DANGER
         )
         remove_btn.grid(row=0, column=1, padx=5)
-        
+
+        textbox.bind("<KeyRelease>", lambda event: self.mark_dirty('descriptions'))
         self.descriptions.append(textbox)
     
     def remove_description(self, frame, textbox):
         """Remove a description field"""
         self.descriptions.remove(textbox)
         frame.destroy()
+        self.mark_dirty('descriptions')
     
     def new_workflow(self):
         """Create a new workflow"""
+        self.flush_autosave()
         self.current_workflow = None
         self.clear_form()
         # Add one description field by default
@@ -258,6 +326,7 @@ class WorkflowEditor(ctk.CTkFrame):
     
     def clear_form(self):
         """Clear all form fields"""
+        self.loading = True
         self.name_entry.delete(0, 'end')
         self.title_entry.delete(0, 'end')
         self.price_entry.delete(0, 'end')
@@ -272,9 +341,17 @@ class WorkflowEditor(ctk.CTkFrame):
         for desc in self.descriptions:
             desc.master.destroy()
         self.descriptions.clear()
+
+        self.loading = False
+        self.dirty_fields.clear()
     
     def save_workflow(self):
         """Save the current workflow"""
+        # Apply any autosave still in flight first, so the stale-write check
+        # compares against the version that write produced
+        self.cancel_autosave()
+        self.wait_for_save()
+
         name = self.name_entry.get().strip()
         title = self.title_entry.get().strip()
         price = self.price_entry.get().strip()
@@ -311,24 +388,237 @@ class WorkflowEditor(ctk.CTkFrame):
         groups = [g.strip() for g in groups_str.split(',')] if groups_str else None
 
         if self.current_workflow:
-            # Update existing
-            self.db.update_workflow(
-                self.current_workflow['id'],
-                name, title, desc_list, price, category, condition, location, delivery_method, groups, boost_listing
-            )
-            messagebox.showinfo("Success", "Workflow updated successfully!")
-        else:
+            # Update existing, unless it was saved elsewhere since it was loaded
+            fields = {
+                'name': name, 'title': title, 'descriptions': desc_list, 'price': price,
+                'category': category, 'condition': condition, 'location': location,
+                'delivery_method': delivery_method, 'groups': groups, 'boost_listing': boost_listing
+            }
+            workflow_id = self.current_workflow['id']
+            try:
+                updated_at = self.db.update_workflow_fields(
+                    workflow_id, fields, expected_updated_at=self.current_workflow['updated_at']
+                )
+                if not updated_at:
+                    if self.db.get_workflow(workflow_id) is None:
+                        if not messagebox.askyesno(
+                            "Workflow Deleted",
+                            f"'{name}' was deleted elsewhere.\n\nSave it as a new workflow?"
+                        ):
+                            self.set_autosave_status("Workflow was deleted elsewhere; Save to recreate it", error=True)
+                            return
+                        # Recreated below
+                        self.current_workflow = None
+                    elif messagebox.askyesno(
+                        "Workflow Changed",
+                        f"'{name}' was changed elsewhere since you opened it.\n\nOverwrite those changes?"
+                    ):
+                        updated_at = self.db.update_workflow_fields(workflow_id, fields)
+                    else:
+                        return
+            except sqlite3.IntegrityError:
+                messagebox.showerror("Error", "Workflow name already exists")
+                return
+
+            if updated_at:
+                self.current_workflow = self.db.get_workflow(workflow_id)
+                self.dirty_fields.clear()
+                self.set_autosave_status("All changes saved")
+                messagebox.showinfo("Success", "Workflow updated successfully!")
+            elif self.current_workflow:
+                # Deleted between the check and the overwrite
+                messagebox.showerror("Error", "Workflow could not be saved; it was changed or deleted elsewhere")
+                return
+
+        if not self.current_workflow:
             # Create new
             workflow_id = self.db.create_workflow(
                 name, title, desc_list, price, category, condition, location, delivery_method, groups, boost_listing
             )
             if workflow_id:
+                # Further edits to the new workflow are autosaved
+                self.current_workflow = self.db.get_workflow(workflow_id)
+                self.dirty_fields.clear()
                 messagebox.showinfo("Success", "Workflow created successfully!")
             else:
                 messagebox.showerror("Error", "Workflow name already exists")
                 return
 
         self.refresh_workflow_list()
+
+    def mark_dirty(self, field):
+        """Record an edit and restart the autosave countdown"""
+        if self.loading:
+            return
+        self.dirty_fields.add(field)
+
+        # New workflows are created with the Save button; autosave only updates
+        if not self.autosave_enabled or not self.current_workflow:
+            return
+        if self.autosave_id:
+            self.after_cancel(self.autosave_id)
+        self.autosave_id = self.after(self.autosave_delay_ms, self.autosave)
+
+    def cancel_autosave(self):
+        """Drop the pending autosave timer"""
+        if self.autosave_id:
+            self.after_cancel(self.autosave_id)
+            self.autosave_id = None
+
+    def flush_autosave(self):
+        """Save pending edits now, e.g. before switching workflows or closing"""
+        self.cancel_autosave()
+        # Edits made while a write was running are still dirty; save them after it
+        self.wait_for_save()
+        if self.autosave_enabled and self.dirty_fields and not self.saving:
+            self.autosave()
+
+    def wait_for_save(self):
+        """Block until the autosave write in flight (if any) has finished and apply its result"""
+        while self.saving:
+            self.save_thread.join(timeout=5)
+            if self.save_thread.is_alive():
+                logger.warning("Autosave is still running; continuing without waiting for it")
+                return
+            # Applying the result can start another write (e.g. "keep my edits")
+            self.apply_save_result()
+
+    def read_field(self, field):
+        """Current form value for a workflow column; raises ValueError if invalid"""
+        if field == 'name' or field == 'title':
+            value = (self.name_entry if field == 'name' else self.title_entry).get().strip()
+            if not value:
+                raise ValueError(f"{field.title()} is required")
+            return value
+        if field == 'price':
+            try:
+                return float(self.price_entry.get().strip())
+            except ValueError:
+                raise ValueError("Price must be a number")
+        if field == 'descriptions':
+            desc_list = [textbox.get("1.0", "end-1c").strip() for textbox in self.descriptions]
+            desc_list = [text for text in desc_list if text]
+            if not desc_list:
+                raise ValueError("Please add at least one description")
+            return desc_list
+        if field == 'groups':
+            groups_str = self.groups_entry.get().strip()
+            return [g.strip() for g in groups_str.split(',')] if groups_str else None
+        if field == 'location':
+            return self.location_entry.get().strip()
+        if field == 'boost_listing':
+            return self.boost_var.get()
+        return {
+            'category': self.category_var,
+            'condition': self.condition_var,
+            'delivery_method': self.delivery_method_var
+        }[field].get()
+
+    def autosave(self):
+        """Write the fields that changed since the last save on a background thread"""
+        self.autosave_id = None
+        if not self.current_workflow or not self.dirty_fields:
+            return
+        if self.saving:
+            # The previous write is still running, try again shortly
+            self.autosave_id = self.after(self.autosave_delay_ms, self.autosave)
+            return
+
+        fields = {}
+        for field in self.dirty_fields:
+            try:
+                value = self.read_field(field)
+            except ValueError as e:
+                self.set_autosave_status(f"Not saved: {e}", error=True)
+                return
+            # Typing and then undoing an edit doesn't need a write
+            if value != self.current_workflow[field]:
+                fields[field] = value
+        self.dirty_fields.clear()
+
+        if not fields:
+            self.set_autosave_status("All changes saved")
+            return
+
+        self.saving = True
+        self.set_autosave_status("Saving...")
+        self.save_thread = threading.Thread(target=self.autosave_worker, args=(self.current_workflow, fields))
+        self.save_thread.daemon = True
+        self.save_thread.start()
+
+    def autosave_worker(self, workflow, fields):
+        """Worker thread that writes only the dirty columns"""
+        updated_at, fresh, error = None, None, None
+        try:
+            updated_at = self.db.update_workflow_fields(
+                workflow['id'], fields, expected_updated_at=workflow['updated_at']
+            )
+            fresh = self.db.get_workflow(workflow['id'])
+        except sqlite3.IntegrityError:
+            error = "workflow name already exists"
+        except Exception as e:
+            logger.error(f"Error autosaving workflow {workflow['id']}: {e}")
+            error = str(e)
+
+        self.save_result = (workflow, fields, updated_at, fresh, error)
+        if self.closing:
+            return
+        try:
+            self.after(0, self.apply_save_result)
+        except (RuntimeError, TclError):
+            # Editor was closed; the write itself has already been applied
+            pass
+
+    def apply_save_result(self):
+        """Hand a finished autosave to autosave_done, unless wait_for_save already did"""
+        result, self.save_result = self.save_result, None
+        if result:
+            self.autosave_done(*result)
+        elif self.save_thread and not self.save_thread.is_alive():
+            self.saving = False
+
+    def autosave_done(self, workflow, fields, updated_at, fresh, error):
+        """Apply an autosave result on the main thread"""
+        self.saving = False
+        if self.closing:
+            return
+        is_current = self.current_workflow is not None and self.current_workflow['id'] == workflow['id']
+
+        if error:
+            if is_current:
+                self.dirty_fields.update(fields)
+            self.set_autosave_status(f"Not saved: {error}", error=True)
+            return
+
+        if updated_at:
+            if is_current:
+                self.current_workflow = fresh
+            if 'name' in fields:
+                self.refresh_workflow_list()
+            self.set_autosave_status("All changes saved")
+            return
+
+        # Stale: the workflow was saved elsewhere (or deleted) after we loaded it
+        if not is_current:
+            self.set_autosave_status(f"Not saved: '{workflow['name']}' was changed elsewhere", error=True)
+        elif fresh is None:
+            self.current_workflow = None
+            self.set_autosave_status("Workflow was deleted elsewhere; Save to recreate it", error=True)
+        elif messagebox.askyesno(
+            "Workflow Changed",
+            f"'{fresh['name']}' was changed elsewhere since you opened it.\n\n"
+            "Reload it? Choose No to keep your edits and save over it."
+        ):
+            self.load_workflow(fresh)
+            self.set_autosave_status("Reloaded")
+        else:
+            self.current_workflow = fresh
+            self.dirty_fields.update(fields)
+            self.autosave()
+
+    def set_autosave_status(self, text, error=False):
+        """Update the autosave status line"""
+        self.autosave_label.configure(text=text, text_color=ERROR_TEXT if error else MUTED_TEXT)
     
     def duplicate_workflow(self):
         """Duplicate the selected workflow"""
@@ -343,7 +633,7 @@ class WorkflowEditor(ctk.CTkFrame):
         dialog.transient(self.winfo_toplevel())
         dialog.grab_set()
         
-        ctk.CTkLabel(dialog, text="Duplicate Options", font=ctk.CTkFont(size=16, weight="bold")).pack(pady=20)
+        ctk.CTkLabel(dialog, text="Duplicate Options", font=get_font(size=16, weight="bold")).pack(pady=20)
         
         ctk.CTkLabel(dialog, text="New workflow name:").pack(pady=5)
         name_entry = ctk.CTkEntry(dialog, width=300)
@@ -408,6 +698,7 @@ class WorkflowEditor(ctk.CTkFrame):
             return
         
         if messagebox.askyesno("Confirm", f"Delete workflow '{self.current_workflow['name']}'?"):
+            self.cancel_autosave()
             self.db.delete_workflow(self.current_workflow['id'])
             self.current_workflow = None
             self.clear_form()
@@ -416,7 +707,9 @@ class WorkflowEditor(ctk.CTkFrame):
     
     def load_workflow(self, workflow):
         """Load workflow into the editor"""
+        self.flush_autosave()
         self.current_workflow = workflow
+        self.loading = True
 
         self.name_entry.delete(0, 'end')
         self.name_entry.insert(0, workflow['name'])
@@ -449,7 +742,19 @@ class WorkflowEditor(ctk.CTkFrame):
         for desc_text in workflow['descriptions']:
             self.add_description_field()
             self.descriptions[-1].insert("1.0", desc_text)
+
+        self.loading = False
+        self.dirty_fields.clear()
     
+    def select_workflow(self, workflow_id):
+        """Load a workflow from the list, re-reading it so edits saved since the list was built are included"""
+        workflow = self.db.get_workflow(workflow_id)
+        if not workflow:
+            messagebox.showerror("Error", "Workflow no longer exists")
+            self.refresh_workflow_list()
+            return
+        self.load_workflow(workflow)
+
     def refresh_workflow_list(self):
         """Refresh the workflow list"""
         # Clear current list
@@ -462,9 +767,9 @@ class WorkflowEditor(ctk.CTkFrame):
             btn = ctk.CTkButton(
                 self.workflow_listbox,
                 text=workflow['name'],
-                command=lambda w=workflow: self.load_workflow(w),
+                command=lambda workflow_id=workflow['id']: self.select_workflow(workflow_id),
                 anchor="w",
-                font=ctk.CTkFont(size=13)
+                font=get_font(size=13)
             )
             btn.grid(sticky="ew", pady=2)
     
@@ -480,11 +785,7 @@ class WorkflowEditor(ctk.CTkFrame):
             return
         
         # Get all image files
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp'}
-        image_files = []
-        for file in Path(folder).iterdir():
-            if file.suffix.lower() in image_extensions:
-                image_files.append(str(file))
+        image_files = scan_image_folder(folder)
         
         if not image_files:
             messagebox.showerror("Error", "No images found in selected folder")
@@ -496,43 +797,151 @@ class WorkflowEditor(ctk.CTkFrame):
         except ValueError:
             messagebox.showerror("Error", "Invalid number format")
             return
-        
-        if images_per * num_listings > len(image_files):
-            messagebox.showwarning(
-                "Warning",
-                f"Not enough images. You have {len(image_files)} images but need {images_per * num_listings}.\n"
-                f"Will create as many listings as possible."
+
+        if images_per < 1 or num_listings < 1:
+            messagebox.showerror("Error", "Images per listing and number of listings must be at least 1")
+            return
+
+        workflow = self.current_workflow
+
+        if not self.group_by_time_var.get():
+            if images_per * num_listings > len(image_files):
+                messagebox.showwarning(
+                    "Warning",
+                    f"Not enough images. You have {len(image_files)} images but need {images_per * num_listings}.\n"
+                    f"Will create as many listings as possible."
+                )
+                num_listings = len(image_files) // images_per
+
+            # Generate listings, rotating through descriptions
+            listings = plan_listings(workflow, image_files, images_per, num_listings)
+            self.show_batch_preview(workflow, listings, len(image_files))
+            return
+
+        try:
+            burst_gap = float(self.burst_gap.get())
+        except ValueError:
+            messagebox.showerror("Error", "Burst gap must be a number of seconds")
+            return
+
+        # Reading EXIF for new photos can take a while, keep the UI responsive
+        self.batch_btn.configure(state="disabled", text="Reading photo dates...")
+        thread = threading.Thread(
+            target=self.group_worker,
+            args=(workflow, image_files, images_per, num_listings, burst_gap)
+        )
+        thread.daemon = True
+        thread.start()
+
+    def group_worker(self, workflow, image_files, images_per, num_listings, burst_gap):
+        """Worker thread that indexes capture times and plans burst-grouped listings"""
+        try:
+            capture_times = index_capture_times(
+                self.db, image_files, max_workers=self.config.get('preflight_workers', 8)
             )
-            num_listings = len(image_files) // images_per
-        
-        # Generate listings
-        descriptions = self.current_workflow['descriptions']
-        generated = 0
-        
-        for i in range(num_listings):
-            # Get images for this listing
-            start_idx = i * images_per
-            end_idx = start_idx + images_per
-            listing_images = image_files[start_idx:end_idx]
-            
-            # Rotate through descriptions
-            desc_idx = i % len(descriptions)
-            description = descriptions[desc_idx]
-            
-            # Add to queue
-            self.db.add_to_queue(
-                self.current_workflow['id'],
-                self.current_workflow['title'],
-                description,
-                self.current_workflow['price'],
-                self.current_workflow['category'],
-                self.current_workflow['condition'],
-                self.current_workflow['location'],
-                listing_images,
-                self.current_workflow.get('delivery_method', 'Door pickup'),
-                self.current_workflow.get('groups'),
-                self.current_workflow.get('boost_listing', False)
+            groups = group_by_capture_time(capture_times, burst_gap)
+            listings = plan_grouped_listings(workflow, groups, images_per, num_listings)
+            result = lambda: self.show_batch_preview(
+                workflow, listings, len(image_files), capture_times, len(groups), images_per
             )
-            generated += 1
-        
-        messagebox.showinfo("Success", f"Generated {generated} listings and added to queue!")
+        except Exception as e:
+            logger.exception(f"Error grouping images: {e}")
+            error_msg = str(e)
+            result = lambda: messagebox.showerror("Error", f"Could not read images: {error_msg}")
+
+        def done():
+            self.batch_btn.configure(state="normal", text="Select Images & Generate")
+            result()
+
+        try:
+            self.after(0, done)
+        except (RuntimeError, TclError):
+            pass
+
+    def show_batch_preview(self, workflow, listings, image_count, capture_times=None, burst_count=None, images_per=None):
+        """Show the planned listings and enqueue them once confirmed.
+
+        images_per is given for burst-grouped plans, where it is a maximum:
+        listings built from shorter bursts are pointed out.
+        """
+
+        if not listings:
+            messagebox.showerror("Error", "Not enough images for a single listing")
+            return
+
+        dialog = ctk.CTkToplevel(self)
+        dialog.title("Preview Listings")
+        dialog.geometry("700x500")
+        dialog.transient(self.winfo_toplevel())
+        dialog.grab_set()
+        dialog.grid_columnconfigure(0, weight=1)
+        dialog.grid_rowconfigure(2, weight=1)
+
+        used = sum(len(images) for _, images in listings)
+        summary = f"{len(listings)} listings using {used} of {image_count} photos"
+        if burst_count is not None:
+            summary += f" ({burst_count} bursts)"
+        ctk.CTkLabel(
+            dialog,
+            text=summary,
+            font=get_font(size=14, weight="bold")
+        ).grid(row=0, column=0, padx=15, pady=(15, 5), sticky="w")
+
+        short = sum(1 for _, images in listings if len(images) < images_per) if images_per else 0
+        if short:
+            ctk.CTkLabel(
+                dialog,
+                text=f"{short} listing(s) have fewer than {images_per} photos because their burst was shorter. "
+                     "Turn off grouping by capture time to fill every listing.",
+                font=get_font(size=12),
+                text_color=ERROR_TEXT,
+                wraplength=660,
+                justify="left"
+            ).grid(row=1, column=0, padx=15, pady=(0, 5), sticky="w")
+
+        preview = ctk.CTkTextbox(dialog, font=get_font(size=12), wrap="word")
+        preview.grid(row=2, column=0, sticky="nsew", padx=15, pady=5)
+
+        lines = []
+        for number, (description, images) in enumerate(listings, start=1):
+            names = ", ".join(os.path.basename(path) for path in images)
+            line = f"#{number}  {len(images)} photo(s)"
+            if capture_times:
+                first = datetime.fromtimestamp(capture_times[images[0]])
+                last = datetime.fromtimestamp(capture_times[images[-1]])
+                line += f"  {first:%Y-%m-%d %H:%M:%S}"
+                if last != first:
+                    line += f" - {last:%H:%M:%S}"
+            lines.append(f"{line}\n    {names}\n    {description[:80]}")
+        preview.insert("1.0", "\n\n".join(lines))
+        preview.configure(state="disabled")
+
+        button_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+        button_frame.grid(row=3, column=0, sticky="e", padx=15, pady=15)
+
+        def confirm():
+            dialog.destroy()
+            generated = enqueue_listings(self.db, workflow, listings)
+            messagebox.showinfo("Success", f"Generated {generated} listings and added to queue!")
+
+        ctk.CTkButton(
+            button_frame,
+            text="Cancel",
+            command=dialog.destroy,
+            fg_color=SECONDARY,
+            width=100
+        ).grid(row=0, column=0, padx=5)
+        ctk.CTkButton(
+            button_frame,
+            text=f"Add {len(listings)} to Queue",
+            command=confirm,
+            width=140
+        ).grid(row=0, column=1, padx=5)
+
+    def destroy(self):
+        # Don't lose the last edits when switching views or closing the app
+        self.flush_autosave()
+        self.closing = True
+        if self.save_thread:
+            self.save_thread.join(timeout=5)
+        super().destroy()
@@ -9,16 +9,29 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from gui.main_window import MainWindow
+import logging
+import multiprocessing
 
 def main():
     """Main entry point"""
-    print("Starting Facebook Marketplace Automation Tool...")
-    print("=" * 50)
-    
+    # Imported here, not at module level: the posting worker is started with
+    # "spawn", which re-runs this module's top level in the child, and the
+    # child should not load customtkinter and the GUI
+    from config.config import Config
+    from config.logging_setup import setup_logging, shutdown_logging
+    from gui.main_window import MainWindow
+
+    setup_logging(Config())
+    logging.getLogger(__name__).info("Starting Facebook Marketplace Automation Tool...")
+
     # Create and run the GUI
-    app = MainWindow()
-    app.run()
+    try:
+        app = MainWindow()
+        app.run()
+    finally:
+        shutdown_logging()
 
 if __name__ == "__main__":
+    # Needed for the posting worker process in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     main()
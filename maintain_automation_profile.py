@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Disk-footprint maintenance for the automation Chrome profile
+
+Measures the profile by subdirectory and prunes caches Chrome regenerates on
+its own (shader/GPU caches, HTTP and code caches, service worker caches).
+Cookies, login data, local storage and preferences are never touched, so the
+Facebook login survives. Each run is appended to data/profile_maintenance.jsonl
+with before/after sizes and, optionally, browser launch times.
+
+Usage:
+    python maintain_automation_profile.py              # report only
+    python maintain_automation_profile.py --prune      # delete regenerable caches
+    python maintain_automation_profile.py --prune --measure-launch
+    python maintain_automation_profile.py --prune --force   # after a Chrome crash left a stale lock
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import socket
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+HISTORY_PATH = Path("data/profile_maintenance.jsonl")
+
+# Paths relative to the profile root that Chrome rebuilds on demand
+REGENERABLE_CACHES = [
+    "GrShaderCache",
+    "GraphiteDawnCache",
+    "ShaderCache",
+    "component_crx_cache",
+    "extensions_crx_cache",
+    "Crashpad/reports",
+    "BrowserMetrics",
+    "Default/Cache",
+    "Default/Code Cache",
+    "Default/GPUCache",
+    "Default/DawnGraphiteCache",
+    "Default/DawnWebGPUCache",
+    "Default/Service Worker/CacheStorage",
+    "Default/Service Worker/ScriptCache",
+    "Default/Shared Dictionary/cache",
+]
+
+# Files Chrome holds while the profile is in use
+LOCK_FILES = ["SingletonLock", "SingletonCookie", "lockfile"]
+
+
+def dir_size(path):
+    """Total size in bytes of a file or directory tree"""
+    path = Path(path)
+    if path.is_symlink():
+        return 0
+    if path.is_file():
+        return path.stat().st_size
+    total = 0
+    for child in path.rglob("*"):
+        try:
+            if child.is_file() and not child.is_symlink():
+                total += child.stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def measure_profile(profile):
+    """Size of each top-level and Default/ entry, largest first"""
+    profile = Path(profile)
+    sizes = {}
+    for entry in profile.iterdir():
+        if entry.name == "Default" and entry.is_dir():
+            for child in entry.iterdir():
+                sizes[f"Default/{child.name}"] = dir_size(child)
+        else:
+            sizes[entry.name] = dir_size(entry)
+    return dict(sorted(sizes.items(), key=lambda kv: kv[1], reverse=True))
+
+
+def profile_lock_state(profile):
+    """Whether Chrome has the profile open, as (state, detail).
+
+    state is 'free', 'in_use' or 'stale'. A crashed Chrome leaves its lock
+    files behind: on Linux/macOS SingletonLock is a symlink to
+    "<hostname>-<pid>", so the lock is stale if that pid is no longer a
+    running Chrome on this host. On Windows Chrome keeps "lockfile" open
+    without sharing, so a lockfile that can be opened is stale.
+    """
+    profile = Path(profile)
+    present = [name for name in LOCK_FILES if (profile / name).exists() or (profile / name).is_symlink()]
+    if not present:
+        return 'free', None
+
+    singleton = profile / "SingletonLock"
+    if singleton.is_symlink():
+        target = os.readlink(singleton)
+        host, _, pid = target.rpartition("-")
+        if not pid.isdigit():
+            return 'in_use', f"unrecognised SingletonLock target {target!r}"
+        if host != socket.gethostname():
+            return 'in_use', f"locked by Chrome on another host ({host})"
+        if _is_chrome_running(int(pid)):
+            return 'in_use', f"Chrome (pid {pid}) is running"
+        return 'stale', f"Chrome pid {pid} is no longer running"
+
+    lockfile = profile / "lockfile"
+    if lockfile.exists():
+        try:
+            fd = os.open(lockfile, os.O_RDWR)
+        except PermissionError:
+            return 'in_use', "lockfile is held by a running Chrome"
+        except OSError as e:
+            return 'in_use', f"lockfile could not be checked ({e.strerror})"
+        os.close(fd)
+        return 'stale', "lockfile is not held by any process"
+
+    return 'stale', f"only {', '.join(present)} left behind"
+
+
+def _is_chrome_running(pid):
+    """True if pid is alive (and, where /proc shows it, is a Chrome process)"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Alive, owned by another user
+        pass
+    except OSError:
+        return False
+
+    # The pid may have been reused since the crash
+    comm = Path(f"/proc/{pid}/comm")
+    if comm.exists():
+        try:
+            name = comm.read_text().strip().lower()
+        except OSError:
+            return True
+        return "chrom" in name
+    return True
+
+
+def prune_profile(profile, dry_run=False):
+    """Delete regenerable caches, returns {relative path: bytes freed}"""
+    profile = Path(profile)
+    freed = {}
+    for relative in REGENERABLE_CACHES:
+        path = profile / relative
+        if not path.exists():
+            continue
+        size = dir_size(path)
+        if not dry_run:
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                path.unlink()
+        freed[relative] = size
+    return freed
+
+
+def measure_launch_time(profile):
+    """Launch and close Chrome with the profile, returns seconds to a usable page"""
+    from automation.browser import BrowserManager
+
+    async def launch():
+        browser = BrowserManager(str(Path(profile).absolute()))
+        try:
+            await browser.start()
+            return browser.launch_seconds
+        finally:
+            await browser.close()
+
+    return asyncio.run(launch())
+
+
+def format_size(size):
+    return f"{size / (1024 * 1024):8.1f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure and prune the automation Chrome profile")
+    parser.add_argument("--profile", help="Profile directory (default: chrome_profile_path from settings)")
+    parser.add_argument("--prune", action="store_true", help="Delete regenerable caches")
+    parser.add_argument("--dry-run", action="store_true", help="Show what --prune would delete")
+    parser.add_argument("--measure-launch", action="store_true", help="Time a browser launch before and after")
+    parser.add_argument("--force", action="store_true", help="Prune even though a stale lock was left by a crashed Chrome")
+    parser.add_argument("--top", type=int, default=15, help="Number of entries to list")
+    args = parser.parse_args()
+
+    profile = args.profile
+    if not profile:
+        from config.config import Config
+        profile = Config().get('chrome_profile_path') or "chrome_automation_profile"
+    profile = Path(profile)
+
+    if not profile.is_dir():
+        print(f"[ERROR] Profile not found: {profile}")
+        sys.exit(1)
+
+    if args.prune and not args.dry_run:
+        state, detail = profile_lock_state(profile)
+        if state == 'in_use':
+            print(f"[ERROR] Chrome is using this profile ({detail}). Close all Chrome windows and try again.")
+            sys.exit(1)
+        if state == 'stale' and not args.force:
+            print(f"[ERROR] Stale Chrome lock in this profile ({detail}), probably left by a crash. "
+                  "Pass --force to prune.")
+            sys.exit(1)
+
+    record = {'time': datetime.now().isoformat(), 'profile': str(profile.absolute())}
+
+    before = measure_profile(profile)
+    record['size_before'] = sum(before.values())
+    print(f"\nProfile: {profile.absolute()}")
+    print(f"Total:   {format_size(record['size_before']).strip()}\n")
+    for name, size in list(before.items())[:args.top]:
+        print(f"  {format_size(size)}  {name}")
+
+    if args.measure_launch:
+        record['launch_before'] = measure_launch_time(profile)
+        print(f"\nLaunch time: {record['launch_before']:.2f}s")
+
+    if args.prune or args.dry_run:
+        freed = prune_profile(profile, dry_run=args.dry_run)
+        verb = "Would free" if args.dry_run else "Freed"
+        print(f"\n{verb}:")
+        for name, size in freed.items():
+            print(f"  {format_size(size)}  {name}")
+        if args.dry_run:
+            return
+
+        record['pruned'] = freed
+        record['size_after'] = dir_size(profile)
+        print(f"\n[OK] {format_size(record['size_before'] - record['size_after']).strip()} freed, "
+              f"profile is now {format_size(record['size_after']).strip()}")
+
+        if args.measure_launch:
+            record['launch_after'] = measure_launch_time(profile)
+            print(f"Launch time: {record['launch_after']:.2f}s (was {record['launch_before']:.2f}s)")
+
+    HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(HISTORY_PATH, 'a') as f:
+        f.write(json.dumps(record) + "\n")
+    print(f"\nRecorded in {HISTORY_PATH}\n")
+
+
+if __name__ == "__main__":
+    main()